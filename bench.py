@@ -0,0 +1,21 @@
+import sys
+
+from src.utils.environment import set_environment
+from src.bench.bench import main as bench_main
+from src.utils.executor import shutdown_executor
+
+def main():
+    """
+    Punto de entrada de las pruebas de rendimiento (ver src/bench/bench.py).
+    """
+    # Seteo las variables de entorno
+    set_environment()
+    
+    try:
+        return bench_main()
+    finally:
+        # Cierro los pools de trabajadores que se hayan creado
+        shutdown_executor()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 from src.utils.environment import set_environment
 from src.gui.gui import get_app
 import src.menus.menu as menu
+from src.utils.executor import shutdown_executor
 
 def main():
     """
@@ -21,6 +22,9 @@ def main():
         app.mainloop()
     except Exception as e:
         print(f"Error en la aplicación principal: {e}")
+    finally:
+        # Cierro los pools de trabajadores que se hayan creado
+        shutdown_executor()
 
 if __name__ == "__main__":
     main()
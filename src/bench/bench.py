@@ -0,0 +1,504 @@
+# Imports estándar de Python
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import platform
+import tempfile
+import urllib.parse
+from datetime import datetime
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv, make_soup
+from src.utils.http_archive import HttpArchive
+from src.utils.http_client import http_get
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+################################################################################
+# Configuraciones por defecto
+################################################################################
+DEFAULT_BENCH_REPEAT = 3
+DEFAULT_BENCH_DB_RECORDS = 500
+DEFAULT_BENCH_TOLERANCE = 0.2 # Variacion admitida respecto de la linea base
+TARGETS_FILENAME = 'targets.json'
+
+################################################################################
+# Casos de prueba de los parsers
+################################################################################
+# Cada caso define la URL de la pagina a grabar, como preparar el objeto a
+# partir del HTML (no se mide) y la funcion que se mide.
+def prepare_youtube_video(key, html):
+    from src.youtube.youtube_video import YoutubeVideo
+    obj = YoutubeVideo(video_id=key)
+    obj.set_html(html)
+    return obj
+
+def prepare_youtube_short(key, html):
+    from src.youtube.youtube_short import YoutubeShort
+    obj = YoutubeShort(short_id=key)
+    obj.set_html(html)
+    return obj
+
+def prepare_youtube_playlist(key, html):
+    from src.youtube.youtube_playlist import YoutubePlaylist
+    obj = YoutubePlaylist(playlist_id=key)
+    obj.set_html(html)
+    return obj
+
+def prepare_youtube_channel(key, html):
+    from src.youtube.youtube_channel import YoutubeChannel
+    obj = YoutubeChannel(channel_id=key)
+    obj.set_html(html)
+    return obj
+
+def prepare_similarweb_site(key, html):
+    from src.similarweb.similarweb import SimilarWebWebsite
+    obj = SimilarWebWebsite()
+    obj.domain = key
+    obj.raw_html = html
+    return obj
+
+def run_load_data_from_html(obj):
+    return obj._load_data_from_html()
+
+def run_similarweb_site(obj):
+    obj.set_html_content(make_soup(obj.raw_html, obj.html_parser))
+    return obj._load_data_from_html()
+
+def run_meli_listing(html):
+    from src.products.meli_utils import parse_meli_listing
+    return parse_meli_listing(html)
+
+def run_alibaba_listing(html):
+    from src.products.alibaba_utils import parse_alibaba_listing
+    return parse_alibaba_listing(html)
+
+def run_ebay_listing(html):
+    from src.products.ebay_utils import parse_ebay_listing
+    return parse_ebay_listing(html)
+
+def run_google_news_listing(html):
+    from src.news.google_news import parse_google_news_listing
+    return parse_google_news_listing(html)
+
+def prepare_listing(key, html):
+    return html
+
+# Las URLs de los listados son las mismas que arma generate_urls en cada modulo
+PARSER_CASES = {
+    'youtube_video': ('https://www.youtube.com/watch?v={key}', prepare_youtube_video, run_load_data_from_html),
+    'youtube_short': ('https://www.youtube.com/watch?v={key}', prepare_youtube_short, run_load_data_from_html),
+    'youtube_playlist': ('https://www.youtube.com/playlist?list={key}', prepare_youtube_playlist, run_load_data_from_html),
+    'youtube_channel': ('https://www.youtube.com/channel/{key}', prepare_youtube_channel, run_load_data_from_html),
+    'meli_listing': ('https://listado.mercadolibre.com.ar/{quoted}/', prepare_listing, run_meli_listing),
+    'alibaba_listing': ('https://spanish.alibaba.com/trade/search?SearchText={quoted}/', prepare_listing, run_alibaba_listing),
+    'ebay_listing': ('https://www.ebay.com/sch/i.html?_from=R40&_nkw={quoted}/', prepare_listing, run_ebay_listing),
+    'google_news_listing': ('https://www.google.com/search?q={quoted}&tbm=nws', prepare_listing, run_google_news_listing),
+    'similarweb_site': ('https://www.similarweb.com/website/{key}/', prepare_similarweb_site, run_similarweb_site),
+}
+
+def get_case_url(case, key):
+    """
+    Devuelve la URL de la pagina de un caso de prueba.
+    """
+    template = PARSER_CASES[case][0]
+    return template.format(key=key, quoted=urllib.parse.quote_plus(key.lower()))
+
+################################################################################
+# Metricas
+################################################################################
+def get_peak_rss_mb():
+    """
+    Devuelve el pico de memoria residente del proceso en MB o None si no se puede medir.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # En macOS el valor esta en bytes, en Linux en KB
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return round(peak / divisor, 2)
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return round(getattr(info, 'peak_wset', info.rss) / (1024 * 1024), 2)
+    return None
+
+def percentile(sorted_values, pct):
+    """
+    Devuelve el percentil pedido (metodo del rango mas cercano).
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def summarize(latencies):
+    """
+    Resume una lista de latencias en segundos.
+
+    Returns:
+        dict: Cantidad de operaciones, tiempo total, operaciones por segundo,
+              latencias p50/p95 en milisegundos y pico de memoria.
+    """
+    latencies = sorted(latencies)
+    total = sum(latencies)
+    return {
+        'n': len(latencies),
+        'total_s': round(total, 6),
+        'throughput': round(len(latencies) / total, 3) if total > 0 else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3) if latencies else None,
+        'peak_rss_mb': get_peak_rss_mb(),
+    }
+
+def measure(func, inputs, prepare=None):
+    """
+    Mide la latencia de func para cada elemento de inputs.
+
+    Args:
+        func (callable): Funcion a medir.
+        inputs (iterable): Argumentos de cada llamada.
+        prepare (callable, optional): Se aplica a cada argumento antes de medir.
+
+    Returns:
+        dict: Resumen de las latencias (ver summarize).
+    """
+    latencies = []
+    for item in inputs:
+        arg = prepare(item) if prepare else item
+        start = time.perf_counter()
+        func(arg)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+################################################################################
+# Grabacion de paginas
+################################################################################
+def load_targets(archive):
+    """
+    Devuelve la lista de paginas grabadas para los casos de prueba.
+    """
+    filename = os.path.join(archive.path, TARGETS_FILENAME)
+    if not os.path.exists(filename):
+        return []
+    with open(filename, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def save_targets(archive, targets):
+    """
+    Guarda la lista de paginas grabadas para los casos de prueba.
+    """
+    filename = os.path.join(archive.path, TARGETS_FILENAME)
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(targets, file, indent=4)
+
+def record(case, keys, files=None):
+    """
+    Graba las paginas de un caso de prueba en el archivo HTTP.
+
+    Las paginas se descargan con el cliente HTTP en modo 'record' y despues se
+    procesan una vez para que tambien queden grabadas las subpaginas que pide
+    cada parser (pestañas de los canales, paginas de productos, etc.). Las
+    paginas que se obtienen con Selenium (SimilarWeb) se importan desde
+    archivos HTML ya guardados.
+
+    Args:
+        case (str): Caso de prueba (ver PARSER_CASES).
+        keys (list): Identificadores (IDs, tematicas o dominios) a grabar.
+        files (list, optional): Archivos HTML a importar, uno por cada key.
+    """
+    if case not in PARSER_CASES:
+        raise ValueError(f'Caso de prueba no valido: [{case}]. Opciones: {list(PARSER_CASES)}.')
+    if files and len(files) != len(keys):
+        raise ValueError('Se tiene que indicar un archivo por cada key.')
+
+    archive = HttpArchive()
+    targets = load_targets(archive)
+    _, prepare, run = PARSER_CASES[case]
+
+    for i, key in enumerate(keys):
+        url = get_case_url(case, key)
+        try:
+            if files:
+                with open(files[i], 'rb') as file:
+                    archive.store(url, 200, {'Content-Type': 'text/html; charset=utf-8'}, file.read(), 'utf-8')
+                response = archive.load(url)
+            else:
+                response = http_get(url)
+            if response.status_code != 200:
+                logger.error(f'No se pudo grabar la pagina [{url}]. HTTP code [{response.status_code}].')
+                continue
+
+            # Proceso la pagina para grabar las subpaginas que se consulten
+            run(prepare(key, response.text))
+
+            target = {'case': case, 'key': key, 'url': url}
+            if target not in targets:
+                targets.append(target)
+            logger.info(f'Se grabo la pagina del caso [{case}] para [{key}].')
+        except Exception as e:
+            logger.error(f'Error al grabar la pagina del caso [{case}] para [{key}]. Error: {e}')
+
+    save_targets(archive, targets)
+
+################################################################################
+# Pruebas de rendimiento
+################################################################################
+def run_parser_benchmarks(cases=None, repeat=DEFAULT_BENCH_REPEAT):
+    """
+    Mide los parsers reproduciendo sin conexion las paginas grabadas.
+
+    Args:
+        cases (list, optional): Casos a medir. Por defecto, todos los grabados.
+        repeat (int, optional): Cantidad de veces que se procesa cada pagina.
+
+    Returns:
+        dict: Resumen de latencias por caso ('parser.<caso>').
+    """
+    archive = HttpArchive()
+    results = {}
+
+    # Agrupo las paginas grabadas por caso
+    pages = {}
+    for target in load_targets(archive):
+        if cases and target['case'] not in cases:
+            continue
+        response = archive.load(target['url'])
+        if response is None:
+            logger.warning(f"No se encontro la pagina grabada [{target['url']}].")
+            continue
+        pages.setdefault(target['case'], []).append((target['key'], response.text))
+
+    for case, case_pages in pages.items():
+        _, prepare, run = PARSER_CASES[case]
+        inputs = case_pages * repeat
+        try:
+            results[f'parser.{case}'] = measure(run, inputs, prepare=lambda x: prepare(*x))
+        except Exception as e:
+            logger.error(f'Error al medir el parser del caso [{case}]. Error: {e}')
+    return results
+
+def build_db_samples(n_records):
+    """
+    Arma registros sinteticos para cada metodo insert_* de la base de datos.
+    """
+    from src.youtube.youtube_video import YoutubeVideo
+    from src.youtube.youtube_short import YoutubeShort
+    from src.youtube.youtube_channel import YoutubeChannel
+    from src.youtube.youtube_playlist import YoutubePlaylist
+    from src.similarweb.similarweb import SimilarWebWebsite
+    from src.products.product import Product
+    from src.news.new import New
+
+    def records(defaults, make_ids):
+        return [{**defaults, **make_ids(i)} for i in range(n_records)]
+
+    return {
+        'insert_channel_record': records(YoutubeChannel.DEFAULT_VALUES, lambda i: {'channel_id': f'UCbench{i:06d}'}),
+        'insert_video_record': records(YoutubeVideo.DEFAULT_VALUES, lambda i: {'video_id': f'vbench{i:06d}', 'channel_id': f'UCbench{i % 20:06d}'}),
+        'insert_short_record': records(YoutubeShort.DEFAULT_VALUES, lambda i: {'short_id': f'sbench{i:06d}', 'channel_id': f'UCbench{i % 20:06d}'}),
+        'insert_playlist_record': records(YoutubePlaylist.DEFAULT_VALUES, lambda i: {'playlist_id': f'PLbench{i:06d}', 'channel_id': f'UCbench{i % 20:06d}', 'video_ids': [f'vbench{i:06d}']}),
+        'insert_similarweb_record': records(SimilarWebWebsite.DEFAULT_VALUES, lambda i: {'domain_id': i, 'domain': f'bench{i}.com'}),
+        'insert_news_record': records(New.DEFAULT_VALUES, lambda i: {'new_id': i, 'title': f'Noticia {i}', 'topic_id': i % 10, 'newspaper_id': i % 5}),
+        'insert_product_record': records(Product.DEFAULT_VALUES, lambda i: {'product_id': f'bench{i:06d}', 'product_name': f'Producto {i}'}),
+    }
+
+def run_db_benchmarks(n_records=DEFAULT_BENCH_DB_RECORDS, repeat=DEFAULT_BENCH_REPEAT):
+    """
+    Mide los metodos insert_*, export_table y las funciones de db_clean
+    sobre una base de datos temporal con registros sinteticos.
+
+    Returns:
+        dict: Resumen de latencias por operacion ('db.<operacion>').
+    """
+    from src.database.db import Database
+    from src.database.db_clean import clean_channel_tables, clean_video_tables, clean_similarweb_tables
+
+    results = {}
+    tmp_dir = tempfile.mkdtemp(prefix='bench_')
+    old_db_name = os.environ.get('DB_NAME')
+    os.environ['DB_NAME'] = os.path.join(tmp_dir, 'bench.db')
+
+    try:
+        db = Database()
+
+        # Inserciones
+        for method, samples in build_db_samples(n_records).items():
+            results[f'db.{method}'] = measure(getattr(db, method), samples)
+
+        # Exportacion de las tablas
+        export_dir = os.path.join(tmp_dir, 'export')
+        results['db.export_table'] = measure(lambda _: db.export_table(path=export_dir), range(repeat))
+        db.db_close()
+
+        # Limpieza de las tablas exportadas
+        clean_funcs = {
+            'clean_channel_tables': (clean_channel_tables, 'channel_records.csv', 'channel.csv'),
+            'clean_video_tables': (clean_video_tables, 'video_records.csv', 'video.csv'),
+            'clean_similarweb_tables': (clean_similarweb_tables, 'similarweb_records.csv', 'similarweb_domains.csv'),
+        }
+        for name, (func, filename_1, filename_2) in clean_funcs.items():
+            try:
+                results[f'db.{name}'] = measure(
+                    lambda _: func(os.path.join(export_dir, filename_1), os.path.join(export_dir, filename_2), save_clean=False),
+                    range(repeat)
+                )
+            except Exception as e:
+                logger.error(f'Error al medir la funcion [{name}]. Error: {e}')
+
+    finally:
+        if old_db_name is None:
+            del os.environ['DB_NAME']
+        else:
+            os.environ['DB_NAME'] = old_db_name
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return results
+
+def compare_with_baseline(results, baseline, tolerance=DEFAULT_BENCH_TOLERANCE):
+    """
+    Compara los resultados con una linea base guardada.
+
+    Se considera una regresion si la latencia p95 crece o las operaciones
+    por segundo caen mas que la tolerancia indicada.
+
+    Returns:
+        list: Regresiones encontradas ({'case', 'metric', 'baseline', 'current'}).
+    """
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get('results', {}).get(case)
+        if not base:
+            continue
+        if base.get('p95_ms') and current.get('p95_ms') is not None:
+            if current['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+                regressions.append({'case': case, 'metric': 'p95_ms', 'baseline': base['p95_ms'], 'current': current['p95_ms']})
+        if base.get('throughput') and current.get('throughput') is not None:
+            if current['throughput'] < base['throughput'] * (1 - tolerance):
+                regressions.append({'case': case, 'metric': 'throughput', 'baseline': base['throughput'], 'current': current['throughput']})
+    return regressions
+
+def run(cases=None, repeat=None, n_records=None, skip_db=False, baseline_file=None, tolerance=None):
+    """
+    Ejecuta todas las pruebas de rendimiento y arma el reporte.
+
+    Returns:
+        dict: Reporte con los resultados y las regresiones respecto de la linea base.
+    """
+    repeat = repeat or getenv('BENCH_REPEAT', DEFAULT_BENCH_REPEAT)
+    n_records = n_records or getenv('BENCH_DB_RECORDS', DEFAULT_BENCH_DB_RECORDS)
+    tolerance = tolerance if tolerance is not None else getenv('BENCH_TOLERANCE', DEFAULT_BENCH_TOLERANCE)
+
+    results = run_parser_benchmarks(cases=cases, repeat=repeat)
+    if not skip_db:
+        results.update(run_db_benchmarks(n_records=n_records, repeat=repeat))
+
+    report = {
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'db_records': n_records,
+        'peak_rss_mb': get_peak_rss_mb(),
+        'results': results,
+        'regressions': [],
+    }
+
+    if baseline_file and os.path.exists(baseline_file):
+        with open(baseline_file, 'r', encoding='utf-8') as file:
+            report['regressions'] = compare_with_baseline(results, json.load(file), tolerance)
+    return report
+
+def get_default_baseline_file():
+    """Devuelve la ruta por defecto de la linea base."""
+    return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'bench', 'baseline.json')
+
+def main(argv=None):
+    """
+    Punto de entrada de las pruebas de rendimiento.
+
+    Ejemplos:
+        python bench.py record --case youtube_video --keys dQw4w9WgXcQ
+        python bench.py record --case similarweb_site --keys google.com --files results/similarweb/html_site_google.com.html
+        python bench.py run --output results/bench/run.json
+        python bench.py run --save-baseline
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Pruebas de rendimiento de los scrapers y la base de datos')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='Grabar paginas reales en el archivo de pruebas')
+    record_parser.add_argument('--case', required=True, choices=list(PARSER_CASES), help='Caso de prueba')
+    record_parser.add_argument('--keys', nargs='+', required=True, help='IDs, tematicas o dominios a grabar')
+    record_parser.add_argument('--files', nargs='+', default=None, help='Archivos HTML a importar (uno por key)')
+
+    run_parser = subparsers.add_parser('run', help='Ejecutar las pruebas sin conexion')
+    run_parser.add_argument('--cases', nargs='+', default=None, help='Casos de prueba a medir')
+    run_parser.add_argument('--repeat', type=int, default=None, help='Repeticiones por pagina')
+    run_parser.add_argument('--db-records', type=int, default=None, help='Registros sinteticos por tabla')
+    run_parser.add_argument('--skip-db', action='store_true', help='No medir la base de datos')
+    run_parser.add_argument('--output', default=None, help='Archivo JSON donde guardar el reporte')
+    run_parser.add_argument('--baseline', default=None, help='Linea base contra la cual comparar')
+    run_parser.add_argument('--save-baseline', action='store_true', help='Guardar el reporte como nueva linea base')
+    run_parser.add_argument('--tolerance', type=float, default=None, help='Variacion admitida respecto de la linea base')
+
+    args = parser.parse_args(argv)
+
+    # El modo del archivo HTTP se define antes de crear el cliente HTTP
+    os.environ['HTTP_ARCHIVE_MODE'] = 'record' if args.command == 'record' else 'replay'
+
+    if args.command == 'record':
+        record(args.case, args.keys, files=args.files)
+        return 0
+
+    baseline_file = args.baseline or get_default_baseline_file()
+    report = run(
+        cases=args.cases,
+        repeat=args.repeat,
+        n_records=args.db_records,
+        skip_db=args.skip_db,
+        baseline_file=baseline_file,
+        tolerance=args.tolerance,
+    )
+
+    output = json.dumps(report, indent=4)
+    print(output)
+
+    filenames = [args.output] if args.output else []
+    if args.save_baseline:
+        filenames.append(baseline_file)
+    for filename in filenames:
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write(output)
+        logger.info(f'Reporte guardado en [{filename}].')
+
+    # Devuelvo un codigo de error si hubo regresiones
+    if report['regressions']:
+        logger.warning(f"Se encontraron {len(report['regressions'])} regresiones respecto de la linea base.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
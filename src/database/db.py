@@ -2,6 +2,7 @@
 import datetime
 import os
 import sqlite3
+from contextlib import contextmanager
 # import sys
 
 # # Añade el directorio raíz del proyecto a sys.path
@@ -14,18 +15,131 @@ import pandas as pd
 
 # Imports locales
 from src.logger.logger import Logger
-from src.utils.utils import getenv, join_str
+from src.utils.utils import getenv
 
 ################################################################################
 # Genero una instancia del Logger
 ################################################################################
 logger = Logger(os.path.basename(__file__)).get_logger()
 
+################################################################################
+# Tablas con el ultimo registro de cada entidad
+################################################################################
+# {tabla: (tabla de historial, clave, columnas, columna requerida)}
+# Si se indica una columna requerida solo se consideran los registros en los
+# que esa columna no es nula ni cero. En SIMILARWEB_LATEST se usa GLOBAL_RANK
+# para mantener el criterio de get_similar_domains()
+LATEST_TABLES = {
+    'VIDEO_LATEST': ('VIDEO_RECORDS', 'VIDEO_ID', ['VIEWS', 'MOST_VIEWED_MOMENT', 'LIKES', 'COMMENTS_COUNT'], None),
+    'SHORT_LATEST': ('SHORT_RECORDS', 'SHORT_ID', ['VIEWS', 'MOST_VIEWED_MOMENT', 'LIKES', 'COMMENTS_COUNT'], None),
+    'CHANNEL_LATEST': ('CHANNEL_RECORDS', 'CHANNEL_ID', ['VIDEOS_COUNT', 'SUBSCRIBERS', 'TOTAL_VIEWS', 'MONTHLY_SUBS', 'DAILY_SUBS'], None),
+    'PLAYLIST_LATEST': ('PLAYLIST_RECORDS', 'PLAYLIST_ID', ['VIDEOS_COUNT', 'TOTAL_VIEWS', 'LIKES'], None),
+    'SIMILARWEB_LATEST': ('SIMILARWEB_RECORDS', 'DOMAIN_ID', ['GLOBAL_RANK', 'COUNTRY_RANK', 'CATEGORY_RANK', 'TOTAL_VISITS', 'BOUNCE_RATE', 'PAGES_PER_VISIT', 'AVG_DURATION_VISIT'], 'GLOBAL_RANK'),
+}
+
+def latest_backfill_queries(table_name):
+    """
+    Devuelve las consultas que reconstruyen una tabla *_LATEST a partir de
+    su tabla de historial.
+    """
+    records_table, key, columns, required = LATEST_TABLES[table_name]
+    fields = ', '.join([key, 'RECORD_ID'] + columns + ['UPDATE_DATE'])
+    where = f'WHERE {required} IS NOT NULL AND {required} != 0' if required else ''
+    return [
+        f'DELETE FROM {table_name}',
+        f'''
+        INSERT INTO {table_name} ({fields})
+        SELECT {fields} FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY UPDATE_DATE DESC, RECORD_ID DESC) AS RN
+            FROM {records_table}
+            {where}
+        )
+        WHERE RN = 1
+        ''',
+    ]
+
+def latest_table_queries(table_name):
+    """
+    Devuelve las consultas que crean una tabla *_LATEST, los triggers que la
+    mantienen actualizada al insertar o borrar registros de historial y la
+    carga inicial de datos.
+    """
+    records_table, key, columns, required = LATEST_TABLES[table_name]
+    fields = ', '.join([key, 'RECORD_ID'] + columns + ['UPDATE_DATE'])
+    new_values = ', '.join(f'NEW.{x}' for x in [key, 'RECORD_ID'] + columns + ['UPDATE_DATE'])
+    updates = ', '.join(f'{x} = excluded.{x}' for x in ['RECORD_ID'] + columns + ['UPDATE_DATE'])
+    insert_when = f'WHEN NEW.{required} IS NOT NULL AND NEW.{required} != 0' if required else ''
+    where = f'AND {required} IS NOT NULL AND {required} != 0' if required else ''
+    
+    return [
+        f'''
+        CREATE TABLE IF NOT EXISTS {table_name} (
+            {key} PRIMARY KEY,
+            RECORD_ID INTEGER,
+            {', '.join(columns)},
+            UPDATE_DATE DATE
+        )
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS TRG_{records_table}_LATEST_INSERT
+        AFTER INSERT ON {records_table}
+        {insert_when}
+        BEGIN
+            INSERT INTO {table_name} ({fields})
+            VALUES ({new_values})
+            ON CONFLICT({key}) DO UPDATE SET {updates}
+            WHERE excluded.UPDATE_DATE >= {table_name}.UPDATE_DATE;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS TRG_{records_table}_LATEST_DELETE
+        AFTER DELETE ON {records_table}
+        WHEN OLD.RECORD_ID = (SELECT RECORD_ID FROM {table_name} WHERE {key} = OLD.{key})
+        BEGIN
+            DELETE FROM {table_name} WHERE {key} = OLD.{key};
+            INSERT INTO {table_name} ({fields})
+            SELECT {fields} FROM {records_table}
+            WHERE {key} = OLD.{key} {where}
+            ORDER BY UPDATE_DATE DESC, RECORD_ID DESC
+            LIMIT 1;
+        END
+        ''',
+    ] + latest_backfill_queries(table_name)
+
 class Database:
     ############################################################################
     # Atributos globables
     ############################################################################
     DEFAULT_DB_NAME = 'latinframe.db'
+    DEFAULT_JOURNAL_MODE = 'WAL'
+    DEFAULT_SYNCHRONOUS = 'NORMAL'
+    DEFAULT_CACHE_SIZE = -20000 # Negativo: tamaño en KiB (~20 MB)
+    DEFAULT_MMAP_SIZE = 268435456 # 256 MB
+
+    # Valores admitidos para los pragmas que se arman como texto
+    JOURNAL_MODES = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+    SYNCHRONOUS_MODES = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+
+    # Migraciones del esquema. Cada entrada es (version, [consultas]) y se
+    # aplica una sola vez; la version actual se guarda en PRAGMA user_version.
+    # NOTA: Para cambiar el esquema se agrega una entrada nueva al final,
+    # nunca se modifica una que ya fue aplicada.
+    MIGRATIONS = [
+        (1, [
+            'CREATE INDEX IF NOT EXISTS IDX_VIDEO_RECORDS_VIDEO_DATE ON VIDEO_RECORDS (VIDEO_ID, UPDATE_DATE)',
+            'CREATE INDEX IF NOT EXISTS IDX_CHANNEL_RECORDS_CHANNEL_DATE ON CHANNEL_RECORDS (CHANNEL_ID, UPDATE_DATE)',
+            'CREATE INDEX IF NOT EXISTS IDX_VIDEO_CHANNEL ON VIDEO (CHANNEL_ID)',
+            'CREATE INDEX IF NOT EXISTS IDX_SHORT_CHANNEL ON SHORT (CHANNEL_ID)',
+            'CREATE INDEX IF NOT EXISTS IDX_PLAYLIST_CHANNEL ON PLAYLIST (CHANNEL_ID)',
+            'CREATE INDEX IF NOT EXISTS IDX_SIMILARWEB_RECORDS_DOMAIN_DATE ON SIMILARWEB_RECORDS (DOMAIN_ID, UPDATE_DATE)',
+        ]),
+        (2, [query for table_name in LATEST_TABLES for query in latest_table_queries(table_name)] + [
+            'CREATE INDEX IF NOT EXISTS IDX_SIMILARWEB_LATEST_RANK ON SIMILARWEB_LATEST (GLOBAL_RANK)',
+        ]),
+        (3, [
+            'CREATE INDEX IF NOT EXISTS IDX_SHORT_RECORDS_SHORT_DATE ON SHORT_RECORDS (SHORT_ID, UPDATE_DATE)',
+        ]),
+    ]
 
     ############################################################################
     # Metodos de incializacion
@@ -37,6 +151,14 @@ class Database:
         self.conn = None
         self.cursor = None
 
+        # Filas pendientes de escritura cuando se trabaja en modo bulk
+        # {query: [params, ...]}
+        self.bulk_depth = 0
+        self.bulk_rows = {}
+        
+        # Indica si el ultimo commit del modo bulk se pudo confirmar
+        self.bulk_success = True
+
         # Open connection
         self.db_open()
 
@@ -49,6 +171,9 @@ class Database:
         self.create_news_tables()
         self.create_product_tables()
 
+        # Aplico las migraciones pendientes del esquema
+        self.migrate_schema()
+
     ############################################################################
     # Métodos de gestión de la base de datos
     ############################################################################
@@ -75,6 +200,93 @@ class Database:
                 self.cursor = self.conn.cursor()
             except sqlite3.Error as e:
                 logger.error(f'Error al abrir la conexión con la base de datos: {str(e)}')
+                return
+            
+            # Configuro la conexion
+            self.set_pragmas()
+
+    def set_pragmas(self):
+        """
+        Configura los pragmas de la conexion segun settings.json
+        (DB_JOURNAL_MODE, DB_SYNCHRONOUS, DB_CACHE_SIZE y DB_MMAP_SIZE).
+        """
+        journal_mode = str(getenv('DB_JOURNAL_MODE', self.DEFAULT_JOURNAL_MODE)).upper()
+        synchronous = str(getenv('DB_SYNCHRONOUS', self.DEFAULT_SYNCHRONOUS)).upper()
+        cache_size = getenv('DB_CACHE_SIZE', self.DEFAULT_CACHE_SIZE)
+        mmap_size = getenv('DB_MMAP_SIZE', self.DEFAULT_MMAP_SIZE)
+        
+        # Valido los valores porque los pragmas no admiten parametros
+        if journal_mode not in self.JOURNAL_MODES:
+            logger.warning(f'Modo de journal no válido: {journal_mode}. Se usara el valor por defecto [{self.DEFAULT_JOURNAL_MODE}].')
+            journal_mode = self.DEFAULT_JOURNAL_MODE
+        if synchronous not in self.SYNCHRONOUS_MODES:
+            logger.warning(f'Modo synchronous no válido: {synchronous}. Se usara el valor por defecto [{self.DEFAULT_SYNCHRONOUS}].')
+            synchronous = self.DEFAULT_SYNCHRONOUS
+        
+        pragmas = [
+            f'PRAGMA journal_mode = {journal_mode}',
+            f'PRAGMA synchronous = {synchronous}',
+            f'PRAGMA cache_size = {int(cache_size)}',
+            f'PRAGMA mmap_size = {int(mmap_size)}',
+        ]
+        for pragma in pragmas:
+            try:
+                self.cursor.execute(pragma)
+            except sqlite3.Error as e:
+                logger.error(f'Error al configurar la base de datos: {str(e)}. Query: {pragma}')
+
+    def get_schema_version(self):
+        """Devuelve la version actual del esquema (PRAGMA user_version)."""
+        try:
+            return self.select('PRAGMA user_version')[0][0]
+        except Exception as e:
+            logger.error(f'Error al obtener la version del esquema: {str(e)}')
+            return 0
+
+    def migrate_schema(self):
+        """
+        Aplica en orden las migraciones de MIGRATIONS cuya version sea mayor
+        que la version actual del esquema. Cada migracion se aplica en su
+        propia transaccion junto con el cambio de version.
+        """
+        current_version = self.get_schema_version()
+        
+        for version, queries in self.MIGRATIONS:
+            if version <= current_version:
+                continue
+            try:
+                if not self.conn.in_transaction:
+                    self.cursor.execute('BEGIN')
+                for query in queries:
+                    self.cursor.execute(query)
+                self.cursor.execute(f'PRAGMA user_version = {int(version)}')
+                self.conn.commit()
+                current_version = version
+                logger.info(f'Se aplico la migracion del esquema de la base de datos a la version {version}.')
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                logger.error(f'Error al aplicar la migracion {version} del esquema: {str(e)}. Query: {query}')
+                break
+
+    def backfill_latest_tables(self):
+        """
+        Reconstruye las tablas *_LATEST desde las tablas de historial.
+
+        Los triggers mantienen estas tablas al dia, pero si el historial se
+        modifica por fuera (por ejemplo con un UPDATE manual) se puede usar
+        este metodo para volver a generarlas.
+        """
+        try:
+            if not self.conn.in_transaction:
+                self.cursor.execute('BEGIN')
+            for table_name in LATEST_TABLES:
+                for query in latest_backfill_queries(table_name):
+                    self.cursor.execute(query)
+            self.conn.commit()
+            logger.info(f'Se reconstruyeron las tablas {list(LATEST_TABLES)}.')
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f'Error al reconstruir las tablas de ultimos registros: {str(e)}')
 
     def db_close(self):
         """Método para cerrar la conexión a la base de datos """
@@ -87,9 +299,17 @@ class Database:
                 logger.error(f'Error al cerrar la conexión con la base de datos: {str(e)}')
 
     def exec(self, query, params=()):
-        """Ejecuta una consulta que modifica la base de datos."""
+        """
+        Ejecuta una consulta que modifica la base de datos.
+
+        Dentro de un bloque bulk() la consulta no se ejecuta en el momento,
+        se encola y se escribe junto con el resto al cerrar el bloque.
+        """
         if self.conn is None:
             raise Exception("No se puede ejecutar el comando 'exec' con una base de datos cerrada.")
+        if self.bulk_depth > 0:
+            self.bulk_rows.setdefault(query, []).append(params)
+            return
         try:
             self.cursor.execute(query, params)
             self.conn.commit()
@@ -97,10 +317,105 @@ class Database:
             self.conn.rollback()
             logger.error(f'Error al ejecutar la consulta: {str(e)}. Query: {query}, Parámetros: {params}')
 
+    def executemany(self, query, params_list):
+        """
+        Ejecuta una consulta que modifica la base de datos para una lista de
+        parametros usando una unica transaccion.
+        """
+        if self.conn is None:
+            raise Exception("No se puede ejecutar el comando 'executemany' con una base de datos cerrada.")
+        params_list = list(params_list)
+        if not params_list:
+            return
+        if self.bulk_depth > 0:
+            self.bulk_rows.setdefault(query, []).extend(params_list)
+            return
+        try:
+            self.cursor.executemany(query, params_list)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f'Error al ejecutar la consulta: {str(e)}. Query: {query}, Cantidad de filas: {len(params_list)}')
+
+    @contextmanager
+    def bulk(self):
+        """
+        Agrupa todas las escrituras del bloque en una unica transaccion.
+
+        Las consultas que se hacen con exec() dentro del bloque se agrupan por
+        consulta y se escriben con executemany(). Al salir del bloque se hace
+        un solo commit. Los select() sobre esta misma conexion ven las filas
+        pendientes porque se vuelcan (sin commit) antes de la lectura.
+
+        Uso:
+            with db.bulk():
+                for video in videos:
+                    db.insert_video_record(video.to_dict())
+        """
+        if self.conn is None:
+            raise Exception("No se puede iniciar el modo bulk con una base de datos cerrada.")
+        
+        self.bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self.bulk_depth -= 1
+            
+            # Solo el bloque mas externo escribe los datos
+            if self.bulk_depth == 0:
+                self.bulk_commit()
+
+    def bulk_flush(self):
+        """
+        Escribe las filas pendientes del modo bulk dentro de la transaccion
+        actual, sin hacer commit.
+
+        Si una consulta falla para el lote completo, se reintenta fila por fila
+        para que una fila invalida no descarte al resto.
+        """
+        if not self.bulk_rows:
+            return
+        
+        # Me aseguro de tener una transaccion abierta para que los savepoints
+        # no hagan commit al liberarse
+        if not self.conn.in_transaction:
+            self.cursor.execute('BEGIN')
+        
+        pending_rows, self.bulk_rows = self.bulk_rows, {}
+        for query, params_list in pending_rows.items():
+            self.cursor.execute('SAVEPOINT bulk_flush')
+            try:
+                self.cursor.executemany(query, params_list)
+            except sqlite3.Error as e:
+                self.cursor.execute('ROLLBACK TO SAVEPOINT bulk_flush')
+                logger.warning(f'Error al escribir {len(params_list)} filas en lote: {str(e)}. Se reintenta fila por fila. Query: {query}')
+                for params in params_list:
+                    try:
+                        self.cursor.execute(query, params)
+                    except sqlite3.Error as e:
+                        logger.error(f'Error al ejecutar la consulta: {str(e)}. Query: {query}, Parámetros: {params}')
+            self.cursor.execute('RELEASE SAVEPOINT bulk_flush')
+
+    def bulk_commit(self):
+        """
+        Escribe las filas pendientes del modo bulk y hace commit. El resultado
+        queda en bulk_success.
+        """
+        try:
+            self.bulk_flush()
+            self.conn.commit()
+            self.bulk_success = True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            self.bulk_success = False
+            logger.error(f'Error al confirmar la transaccion del modo bulk: {str(e)}')
+
     def select(self, query, params=()):
         """Ejecuta una consulta que devuelve resultados."""
         if self.conn is None:
             raise Exception("No se puede ejecutar el comando 'select' con una base de datos cerrada.")
+        if self.bulk_depth > 0:
+            return self.bulk_select(query, params)
         try:
             self.cursor.execute(query, params)
             result = self.cursor.fetchall()
@@ -111,6 +426,31 @@ class Database:
             logger.error(f'Error al ejecutar la consulta de selección: {str(e)}. Query: {query}, Parámetros: {params}')
             return None
 
+    def bulk_select(self, query, params=()):
+        """
+        Ejecuta una consulta de lectura dentro de un bloque bulk().
+
+        Primero vuelca las filas pendientes para que la lectura las vea. La
+        consulta corre en su propio savepoint, de modo que si falla solo se
+        deshace la lectura y no las filas ya escritas en la transaccion.
+        """
+        try:
+            self.bulk_flush()
+            self.cursor.execute('SAVEPOINT bulk_select')
+        except sqlite3.Error as e:
+            logger.error(f'Error al preparar la consulta de selección en modo bulk: {str(e)}. Query: {query}, Parámetros: {params}')
+            return None
+        
+        try:
+            self.cursor.execute(query, params)
+            result = self.cursor.fetchall()
+        except sqlite3.Error as e:
+            self.cursor.execute('ROLLBACK TO SAVEPOINT bulk_select')
+            logger.error(f'Error al ejecutar la consulta de selección: {str(e)}. Query: {query}, Parámetros: {params}')
+            result = None
+        self.cursor.execute('RELEASE SAVEPOINT bulk_select')
+        return result
+
     def add_column(self, table_name, column_name, column_type):
         """Agrega una columna a una tabla existente """
         query = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
@@ -455,19 +795,18 @@ class Database:
             logger.error(f'Error inesperado al insertar/actualizar registros en la tabla PLAYLIST_RECORDS: {str(e)}. Query: {query}, Parámetros: {params}')
         
         try:
-            for video_id in playlist_info['video_ids']:
-                query = '''
-                INSERT INTO PLAYLIST_VIDEO (
-                    PLAYLIST_ID, VIDEO_ID, UPDATE_DATE
-                ) VALUES (?, ?, ?)
-                ON CONFLICT(PLAYLIST_ID, VIDEO_ID)
-                DO UPDATE SET UPDATE_DATE = excluded.UPDATE_DATE
-                '''
-                params = (
-                    playlist_info['playlist_id'], video_id,
-                    current_time
-                )
-                self.exec(query, params)
+            query = '''
+            INSERT INTO PLAYLIST_VIDEO (
+                PLAYLIST_ID, VIDEO_ID, UPDATE_DATE
+            ) VALUES (?, ?, ?)
+            ON CONFLICT(PLAYLIST_ID, VIDEO_ID)
+            DO UPDATE SET UPDATE_DATE = excluded.UPDATE_DATE
+            '''
+            params = [
+                (playlist_info['playlist_id'], video_id, current_time)
+                for video_id in playlist_info['video_ids']
+            ]
+            self.executemany(query, params)
         except sqlite3.Error as e:
             logger.error(f'Error al insertar/actualizar registros en la tabla PLAYLIST_VIDEO: {str(e)}. Query: {query}, Parámetros: {params}')
         except Exception as e:
@@ -774,7 +1113,7 @@ class Database:
             'SHORT','SHORT_RECORDS','PLAYLIST','PLAYLIST_RECORDS','PLAYLIST_VIDEO',
             'NEWS', 'NEWSPAPERS', 'SIMILARWEB_DOMAINS', 'SIMILARWEB_RECORDS', 'TOPICS',
             'PRODUCT', 'PRODUCT_RECORDS'
-        ]
+        ] + list(LATEST_TABLES)
 
         # Asegurarse de que el directorio de destino exista
         os.makedirs(path, exist_ok=True)
@@ -857,54 +1196,158 @@ class Database:
         Obtiene una lista de IDs de videos de YouTube de la tabla especificada.
 
         Parámetros:
-        table_name (str): Nombre de la tabla a consultar.
-        sort (str): Orden de los resultados, 'asc' para ascendente o 'desc' para descendente.
-        channel_id (str): Lista de canales para aplicar el filtrado
+        channel_id_list (str/list): Canal o lista de canales para aplicar el filtrado
 
         Retorna:
-        list: Lista de IDs de canales.
+        list: Lista de IDs de videos ordenada por vistas, likes y fecha.
         """
+        if isinstance(channel_id_list, str):
+            channel_id_list = [channel_id_list]
+        channel_id_list = list(channel_id_list or [])
+        
         query = """
         SELECT 
             V.VIDEO_ID
         FROM 
             VIDEO V
         JOIN 
-            (
-                SELECT 
-                    VIDEO_ID, 
-                    VIEWS, 
-                    LIKES, 
-                    UPDATE_DATE
-                FROM 
-                    VIDEO_RECORDS
-                WHERE 
-                    (VIDEO_ID, UPDATE_DATE) IN (
-                        SELECT 
-                            VIDEO_ID, 
-                            MAX(UPDATE_DATE) AS LATEST_UPDATE
-                        FROM 
-                            VIDEO_RECORDS
-                        GROUP BY 
-                            VIDEO_ID
-                    )
-            ) VR ON V.VIDEO_ID = VR.VIDEO_ID
+            VIDEO_LATEST VL ON V.VIDEO_ID = VL.VIDEO_ID
         WHERE 
-            V.CHANNEL_ID IN ("{}")
+            V.CHANNEL_ID IN ({})
         ORDER BY 
-            VR.VIEWS DESC, 
-            VR.LIKES DESC, 
-            VR.UPDATE_DATE DESC;
-        """.format(join_str(channel_id_list))
+            VL.VIEWS DESC, 
+            VL.LIKES DESC, 
+            VL.UPDATE_DATE DESC;
+        """.format(','.join('?' * len(channel_id_list)))
 
         try:
-            db_ids = self.select(query, ())
+            db_ids = self.select(query, tuple(channel_id_list))
             db_ids = [item[0] for item in db_ids]
             return db_ids
         except Exception as e:
             logger.error(f'Error al obtener IDs de videos de la tabla VIDEO. Error: {str(e)}')
             return []
         
+    def get_youtube_video_ids_by_channel(self, channel_limits, chunk_size=400):
+        """
+        Obtiene los IDs de videos de YouTube de varios canales en una sola
+        consulta, ordenados por vistas, likes y fecha dentro de cada canal.
+
+        Parámetros:
+        channel_limits (dict/list): Diccionario {channel_id: limite} con la
+            cantidad maxima de videos por canal (un limite negativo o None
+            indica sin limite), o lista de canales sin limite.
+        chunk_size (int): Cantidad maxima de canales por consulta.
+
+        Retorna:
+        dict: Diccionario {channel_id: [video_ids]}.
+        """
+        if not isinstance(channel_limits, dict):
+            channel_limits = {channel_id: -1 for channel_id in channel_limits}
+        
+        query = """
+        WITH LIMITS (CHANNEL_ID, N_VIDEOS) AS (
+            VALUES {}
+        )
+        SELECT 
+            CHANNEL_ID,
+            VIDEO_ID
+        FROM (
+            SELECT 
+                V.CHANNEL_ID,
+                V.VIDEO_ID,
+                L.N_VIDEOS,
+                ROW_NUMBER() OVER (
+                    PARTITION BY V.CHANNEL_ID
+                    ORDER BY VL.VIEWS DESC, VL.LIKES DESC, VL.UPDATE_DATE DESC
+                ) AS RN
+            FROM 
+                VIDEO V
+            JOIN 
+                LIMITS L ON V.CHANNEL_ID = L.CHANNEL_ID
+            JOIN 
+                VIDEO_LATEST VL ON V.VIDEO_ID = VL.VIDEO_ID
+        )
+        WHERE 
+            N_VIDEOS < 0 OR RN <= N_VIDEOS
+        ORDER BY 
+            CHANNEL_ID,
+            RN;
+        """
+        
+        video_ids = {channel_id: [] for channel_id in channel_limits}
+        channel_ids = list(channel_limits)
+        
+        # Divido los canales en grupos para no superar el limite de parametros de SQLite
+        for idx in range(0, len(channel_ids), chunk_size):
+            chunk = channel_ids[idx:idx + chunk_size]
+            params = []
+            for channel_id in chunk:
+                limit = channel_limits[channel_id]
+                params.extend([channel_id, -1 if limit is None else int(limit)])
+            
+            try:
+                results = self.select(query.format(','.join(['(?, ?)'] * len(chunk))), tuple(params))
+                for channel_id, video_id in results:
+                    video_ids[channel_id].append(video_id)
+            except Exception as e:
+                logger.error(f'Error al obtener IDs de videos de la tabla VIDEO para los canales {chunk}. Error: {str(e)}')
+        
+        return video_ids
+    
+    def get_youtube_refresh_stats(self, kind, channel_ids, since, chunk_size=400):
+        """
+        Obtiene, para los videos o shorts de varios canales, la fecha del
+        ultimo registro y el crecimiento de vistas desde una fecha dada.
+
+        Parámetros:
+        kind (str): 'video' o 'short'.
+        channel_ids (list): Lista de IDs de canales.
+        since (str): Fecha desde la que se mide el crecimiento ('%Y-%m-%d %H:%M:%S').
+        chunk_size (int): Cantidad maxima de canales por consulta.
+
+        Retorna:
+        list: Lista de tuplas (channel_id, id, ultima actualizacion,
+              cantidad de registros, vistas ganadas, horas entre el primer y
+              el ultimo registro).
+        """
+        if kind not in ('video', 'short'):
+            raise ValueError(f'Tipo de entidad no valido: {kind}')
+        
+        table = kind.upper()
+        query = """
+        SELECT 
+            T.CHANNEL_ID,
+            T.{key},
+            L.UPDATE_DATE,
+            COUNT(R.RECORD_ID),
+            MAX(R.VIEWS) - MIN(R.VIEWS),
+            (JULIANDAY(MAX(R.UPDATE_DATE)) - JULIANDAY(MIN(R.UPDATE_DATE))) * 24
+        FROM 
+            {table} T
+        JOIN 
+            {table}_LATEST L ON T.{key} = L.{key}
+        LEFT JOIN 
+            {table}_RECORDS R ON T.{key} = R.{key} AND R.UPDATE_DATE >= ?
+        WHERE 
+            T.CHANNEL_ID IN ({{}})
+        GROUP BY 
+            T.CHANNEL_ID, T.{key}, L.UPDATE_DATE;
+        """.format(table=table, key=f'{table}_ID')
+        
+        stats = []
+        channel_ids = list(channel_ids)
+        
+        # Divido los canales en grupos para no superar el limite de parametros de SQLite
+        for idx in range(0, len(channel_ids), chunk_size):
+            chunk = channel_ids[idx:idx + chunk_size]
+            try:
+                stats.extend(self.select(query.format(','.join('?' * len(chunk))), (since, *chunk)) or [])
+            except Exception as e:
+                logger.error(f'Error al obtener el historial de la tabla {table}_RECORDS para los canales {chunk}. Error: {str(e)}')
+        
+        return stats
+        
     def get_similar_domains(self):
         """
         Obtiene una lista de dominios únicos de la tabla especificada.
@@ -922,30 +1365,10 @@ class Database:
         FROM 
             SIMILARWEB_DOMAINS SD
         JOIN 
-            (
-                SELECT 
-                    DOMAIN_ID, 
-                    GLOBAL_RANK, 
-                    UPDATE_DATE
-                FROM 
-                    SIMILARWEB_RECORDS
-                WHERE 
-                    (DOMAIN_ID, UPDATE_DATE) IN (
-                        SELECT 
-                            DOMAIN_ID, 
-                            MAX(UPDATE_DATE) 
-                        FROM 
-                            SIMILARWEB_RECORDS
-                        WHERE 
-                            GLOBAL_RANK IS NOT NULL AND GLOBAL_RANK != 0
-                        GROUP BY 
-                            DOMAIN_ID
-                    )
-                    AND GLOBAL_RANK IS NOT NULL AND GLOBAL_RANK != 0
-            ) SDR ON SD.DOMAIN_ID = SDR.DOMAIN_ID
+            SIMILARWEB_LATEST SL ON SD.DOMAIN_ID = SL.DOMAIN_ID
         ORDER BY 
-            SDR.GLOBAL_RANK, 
-            SDR.UPDATE_DATE DESC;
+            SL.GLOBAL_RANK, 
+            SL.UPDATE_DATE DESC;
         """
 
         try:
@@ -180,6 +180,14 @@ def sql_clean_db_pre_export():
             query = f'delete from video_records where video_id = "{video_id}"'
             db.exec(query, ())
 
+def sql_backfill_latest_tables():
+    """
+    Reconstruye las tablas con el ultimo registro de cada entidad
+    (VIDEO_LATEST, CHANNEL_LATEST, etc.) a partir de las tablas de historial.
+    """
+    with Database() as db:
+        db.backfill_latest_tables()
+
 def sql_export_db(sel='.csv'):
     """
     Exporta la base de datos a un archivo con la extensión especificada.
@@ -25,6 +25,7 @@ def menu_database(app):
         app.screen()  # Limpia la pantalla
         app.add_option("Ejecutar SQL", lambda: print("Ejecutar SQL"))
         app.add_option("Sanidad de canales de YouTube", lambda: youtube_db_fetch())
+        app.add_option("Reconstruir tablas de ultimos registros", lambda: sql_backfill_latest_tables())
         app.add_option("Exportar BD a CSV", lambda: sql_export_db(sel='.csv'))
         app.add_option("Exportar BD a Excel", lambda: sql_export_db(sel='.xlsx'))
         app.add_option("Volver", lambda: app.main_menu())
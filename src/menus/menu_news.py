@@ -60,8 +60,8 @@ def fetch_all_news_data():
     # Pido las noticias
     news = google_news_listings.get_news()
 
-    # Guardo los datos
-    with Database() as db:
+    # Guardo los datos en una unica transaccion
+    with Database() as db, db.bulk():
         # Recorro las noticias y les agrego los ID
         # Guardo los datos en la base de datos
         for new in news:
@@ -69,19 +69,22 @@ def fetch_all_news_data():
                 id_field='new_id',
                 table_name='news',
                 search_field='title',
-                target=new.title
+                target=new.title,
+                db=db
                 )
             new.topic_id = fetch_new_id(
                 id_field='topic_id',
                 table_name='topics',
                 search_field='topic',
-                target=new.topic
+                target=new.topic,
+                db=db
                 )
             new.newspaper_id = fetch_new_id(
                 id_field='newspaper_id',
                 table_name='newspapers',
                 search_field='newspaper',
-                target=new.newspaper
+                target=new.newspaper,
+                db=db
                 )
             
             # Muestro los datos en pantalla
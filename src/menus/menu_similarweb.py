@@ -12,6 +12,7 @@ from functools import partial
 
 # Imports locales
 from src.similarweb.similarweb_manager import SimilarWebManager
+from src.utils.driver import Driver
 from src.logger.logger import Logger
 
 ################################################################################
@@ -32,6 +33,7 @@ def menu_similarweb(app):
         app.add_option("Actualizar todo", lambda: fetch_similarwebs_data())
         app.add_option("Buscar dominio", lambda: fetch_similarweb_domain(app))
         app.add_option("Agregar dominio", lambda: add_similarweb_domain(app))
+        app.add_option("Actualizar driver del navegador", lambda: refresh_browser_driver())
         app.add_option("Volver", lambda: app.main_menu())
     except AttributeError as e:
         logger.error(f"Error al configurar el menú de SimilarWeb: {e}")
@@ -45,6 +47,12 @@ def fetch_similarwebs_data():
     # se hace adentro de la clase, no necesito un metodo get_webs()
     similarweb_manager.fetch_data()
     
+def refresh_browser_driver():
+    """
+    Descarga y fija el driver del navegador configurado.
+    """
+    Driver().resolve_drivers(refresh=True)
+
 def fetch_similarweb_domain(app):
     """
     """
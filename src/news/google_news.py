@@ -12,15 +12,15 @@ import re
 import urllib.parse
 import requests
 from functools import partial
-from multiprocessing import Pool, cpu_count
-from bs4 import BeautifulSoup
+import soupsieve
 import time
 from unidecode import unidecode
 
 # Imports locales
 from src.news.new import New
 from src.logger.logger import Logger
-from src.utils.utils import get_http_response, getenv
+from src.utils.executor import ExecutorService
+from src.utils.utils import get_http_response, getenv, make_soup, DEFAULT_HTML_PARSER
 from src.database.db import Database
 from datetime import datetime, timedelta
 
@@ -45,6 +45,32 @@ def init_google_new(html_content):
     item.fetch_data()
     return item
 
+# Selector CSS compilado de las tarjetas de cada noticia en el listado
+ITEM_CARD_SELECTOR = soupsieve.compile('div.CA8QAA, div.SoaBEf, div.xCURGd')
+
+def parse_google_news_listing(html_content, parser=DEFAULT_HTML_PARSER):
+    """
+    Recorre una unica vez la pagina de un listado y devuelve los datos de
+    cada noticia como diccionarios.
+
+    Args:
+        html_content (str or BeautifulSoup): Contenido HTML de la pagina del listado.
+        parser (str, optional): Parser de BeautifulSoup a usar si el contenido es texto.
+
+    Returns:
+        list: Lista con el diccionario de campos de cada noticia cargado con exito.
+    """
+    if isinstance(html_content, str):
+        html_content = make_soup(html_content, parser)
+
+    items_data = []
+    for card in ITEM_CARD_SELECTOR.select(html_content):
+        # La tarjeta se procesa tal cual, sin volver a convertirla en texto
+        item = init_google_new(card)
+        if item.fetch_status:
+            items_data.append(item.to_dicc())
+    return items_data
+
 class GoogleNewsListings:
     ############################################################################
     # Atributos globables
@@ -54,7 +80,7 @@ class GoogleNewsListings:
     
     DEFAULT_SAVE_HTML = False
     DEFAULT_ENABLE_MP = True
-    DEFAULT_N_CORES = -1
+    DEFAULT_LISTING_MODE = 'item' # 'item' o 'page'
     DEBUG = False
     
     DEFAULT_TOPICS = [
@@ -80,35 +106,17 @@ class GoogleNewsListings:
             self.listings = {}
             self.urls = {}
             self.save_html = getenv('NEWS_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+            self.html_parser = getenv('NEWS_HTML_PARSER', DEFAULT_HTML_PARSER)
             self.enable_mp = getenv('ENABLE_MP', self.DEFAULT_ENABLE_MP)
-            self.n_cores = self.set_n_cores()
+            self.listing_mode = getenv('NEWS_LISTING_MODE', self.DEFAULT_LISTING_MODE)
             
             # Defino una lista por defecto y
             # agrego las tematicas de interes
             self.add_topics(self.DEFAULT_TOPICS)
             self.add_topics(topics)
-
-            # Inicializar el objeto Pool para el procesamiento paralelo
-            if self.enable_mp:
-                self.pool = Pool(processes=self.n_cores)
-            else:
-                self.pool = None
             
             self.initialized = True
     
-    def set_n_cores(self):
-        """
-        Obtiene el número de procesos a utilizar según la configuración.
-        """
-        max_n_cores = cpu_count()
-        if getenv('MP_N_CORES', self.DEFAULT_N_CORES) < 0:
-            return max_n_cores
-        else:
-            if getenv('MP_N_CORES', self.DEFAULT_N_CORES) > max_n_cores:
-                return max_n_cores
-            else:
-                return getenv('MP_N_CORES', self.DEFAULT_N_CORES)
-
     ############################################################################
     # Metodos de de uso
     ############################################################################
@@ -176,7 +184,9 @@ class GoogleNewsListings:
                     
                     # Obtengo el contenido HTML
                     url = self.listings[topic]['url']
-                    response = get_http_response(url)
+                    # En modo 'page' la pagina se interpreta recien al buscar los items
+                    response_type = 'text' if self.listing_mode == 'page' else 'page'
+                    response = get_http_response(url, response_type=response_type, parser=self.html_parser)
                     
                     if response:
                         self.listings[topic]['html_content'] = response
@@ -201,13 +211,18 @@ class GoogleNewsListings:
         """
         Scrapea el contenido HTML de cada URL y crea objetos segun el tipo que corresponda.
         """
+        # En modo 'page' cada pagina se recorre una unica vez
+        if self.listing_mode == 'page':
+            self.page_item_initialize()
+            return
+
         for topic in self.topics:
             if 'html_content' in self.listings[topic]:
                 html_content = self.listings[topic]['html_content']
                 
                 # Obtengo los items encontrados
                 # NOTA: Aca es donde hay que cambiar para aplicar el filtro correcto
-                html_contents = html_content.find_all('div', class_=['CA8QAA','SoaBEf','xCURGd'])
+                html_contents = ITEM_CARD_SELECTOR.select(html_content)
                 
                 if self.enable_mp:
                     # Procesamiento en paralelo
@@ -225,13 +240,13 @@ class GoogleNewsListings:
 
     def parallel_item_initialize(self, topic, html_contents):
         """
-        Inicializa los objetos utilizando multiprocessing.Pool.
+        Inicializa los objetos en paralelo utilizando el servicio de ejecucion compartido.
         """
         try:
             # Paso el contenido a string porque sino, no puede procesar en paralelo
             html_contents = [str(x) for x in html_contents]
             init_func = partial(init_google_new)
-            self.listings[topic]['items'] = self.pool.map(init_func, html_contents)
+            self.listings[topic]['items'] = ExecutorService().map(init_func, html_contents, task_type='news')
         except Exception as e:
             logger.error(f'Error al inicializar los objetos en paralelo. Error: {str(e)}')
 
@@ -240,10 +255,38 @@ class GoogleNewsListings:
         Inicializa los objetos de forma serial.
         """
         try:
-            self.listings[topic]['items'] = [init_google_new(str(html_content)) for html_content in html_contents]
+            self.listings[topic]['items'] = [init_google_new(html_content) for html_content in html_contents]
         except Exception as e:
             logger.error(f'Error al inicializar los objetos en serie. Error: {str(e)}')
 
+    def page_item_initialize(self):
+        """
+        Inicializa los objetos recorriendo cada pagina de listado una unica vez.
+        Si el procesamiento en paralelo esta habilitado, se reparten las paginas
+        completas (no las tarjetas) entre los trabajadores.
+        """
+        topics = [x for x in self.topics if self.listings.get(x, {}).get('html_content')]
+        pages = [self.listings[x]['html_content'] for x in topics]
+        parse_func = partial(parse_google_news_listing, parser=self.html_parser)
+        
+        try:
+            if self.enable_mp:
+                results = ExecutorService().map(parse_func, pages, task_type='news')
+            else:
+                results = [parse_func(x) for x in pages]
+        except Exception as e:
+            logger.error(f'Error al recorrer las paginas de los listados. Error: {str(e)}')
+            return
+        
+        for topic, items_data in zip(topics, results):
+            self.listings[topic]['items'] = [GoogleNew.from_dict({**x, 'topic': topic}) for x in items_data]
+            
+            # El HTML de la pagina ya no se necesita
+            self.listings[topic]['html_content'] = None
+            
+            if self.DEBUG:
+                logger.info(f'Se encontraron {len(items_data)} noticias para la tematica [{topic}].')
+
     def show_items_content(self):
         """
         Muestra el contenido de cada item para cada tematica.
@@ -298,7 +341,7 @@ class GoogleNew(New):
             html_content (str): Contenido HTML a establecer.
         """
         if isinstance(html_content, str):
-            html_content = BeautifulSoup(html_content, 'html.parser')
+            html_content = make_soup(html_content, self.html_parser)
         self.html_content = html_content
         
         if self.new_id is None:
@@ -436,6 +479,9 @@ class GoogleNew(New):
         
         except Exception as e:
             logger.warning(f"Fallo al cargar datos mediante scraping de contenido HTML: {e}")
+        finally:
+            # El HTML ya no se necesita una vez extraidos los datos
+            self.release_html()
 
         return False
     
@@ -613,38 +659,49 @@ class GoogleNew(New):
         
         return publish_date
 
-def fetch_new_id(id_field='news_id', table_name='news', search_field='title', target='youtube.com'):
-    with Database() as db:
-        # Defino la consulta que tengo que realizar
-        query = f"select {id_field} from {table_name} where {search_field} = '{target}'"
-
-        # Obtengo el resultado de busqueda
-        query_res = db.select(query)
-
-        # Si obtengo un resultado lo proceso
-        if ((query_res is not None) and
-            (len(query_res) > 0)
-        ):
-            # El resultado es una lista de tuplas
-            # Me quedo con el primer elemento
-            result = [x[0] for x in db.select(query)]
-            id = int(list(set(result))[0])
+def fetch_new_id(id_field='news_id', table_name='news', search_field='title', target='youtube.com', db=None):
+    """
+    Obtiene el ID de un elemento de la tabla dada o genera uno nuevo.
 
-        # Si no se encuentra el ID obtengo uno nuevo
+    Args:
+        db (Database, optional): Conexion abierta a reutilizar. Dentro de un
+            bloque Database.bulk() es necesario pasarla para que los IDs nuevos
+            que todavia no se confirmaron se tengan en cuenta.
+    """
+    if db is None:
+        with Database() as db:
+            return fetch_new_id(id_field, table_name, search_field, target, db)
+
+    # Defino la consulta que tengo que realizar
+    query = f"select {id_field} from {table_name} where {search_field} = '{target}'"
+
+    # Obtengo el resultado de busqueda
+    query_res = db.select(query)
+
+    # Si obtengo un resultado lo proceso
+    if ((query_res is not None) and
+        (len(query_res) > 0)
+    ):
+        # El resultado es una lista de tuplas
+        # Me quedo con el primer elemento
+        result = [x[0] for x in db.select(query)]
+        id = int(list(set(result))[0])
+
+    # Si no se encuentra el ID obtengo uno nuevo
+    else:
+        query = f"select max({id_field}) from {table_name}"
+
+        # El resultado es una lista de tuplas
+        # Me quedo con el primer elemento
+        result = [x[0] for x in db.select(query)]
+        max_id = list(set(result))[0]
+
+        # Ultimo check
+        if max_id is None:
+            id = 1
         else:
-            query = f"select max({id_field}) from {table_name}"
-
-            # El resultado es una lista de tuplas
-            # Me quedo con el primer elemento
-            result = [x[0] for x in db.select(query)]
-            max_id = list(set(result))[0]
-
-            # Ultimo check
-            if max_id is None:
-                id = 1
-            else:
-                # Genero el proximo ID
-                id = int(max_id) + 1
+            # Genero el proximo ID
+            id = int(max_id) + 1
 
     return id
 
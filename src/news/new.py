@@ -12,7 +12,7 @@ import os
 
 # Imports locales
 from src.logger.logger import Logger
-from src.utils.utils import getenv
+from src.utils.utils import getenv, DEFAULT_HTML_PARSER
 
 ################################################################################
 # Genero una instancia del Logger
@@ -42,6 +42,7 @@ class New:
         # Inicialización de la clase con valores por defecto y datos opcionales
         self.set_default_values()
         self.save_html = getenv('NEWS_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+        self.html_parser = getenv('NEWS_HTML_PARSER', DEFAULT_HTML_PARSER)
 
         # Si se proporciona un ID de la noticia, lo usamos
         if new_id is not None:
@@ -65,6 +66,17 @@ class New:
             if key in self.DEFAULT_VALUES:
                 setattr(self, key, value)
 
+    @classmethod
+    def from_dict(cls, info_dict):
+        """
+        Crea un objeto con los datos ya cargados a partir de un diccionario de
+        campos, por ejemplo el obtenido al recorrer la pagina de un listado.
+        """
+        item = cls(info_dict=info_dict)
+        item.data_loaded = True
+        item.fetch_status = True
+        return item
+
     def to_dicc(self):
         """Convierte el objeto a un diccionario con los valores actuales."""
         return {key: getattr(self, key) for key in self.DEFAULT_VALUES}
@@ -92,6 +104,14 @@ class New:
     ############################################################################
     # Funciones de obtención de código HTML
     ############################################################################
+    def release_html(self):
+        """
+        Libera el contenido HTML una vez procesado, salvo que se este
+        depurando o guardando el HTML.
+        """
+        if not (self.DEBUG or self.save_html):
+            self.html_content = None
+
     def save_html_content(self, html_content=None):
         """
         Guarda el contenido HTML de la noticia en un archivo.
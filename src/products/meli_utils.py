@@ -12,15 +12,15 @@ import re
 import urllib.parse
 import requests
 from functools import partial
-from multiprocessing import Pool, cpu_count
-from bs4 import BeautifulSoup
+import soupsieve
 import time
 from unidecode import unidecode
 from datetime import datetime, timedelta
 
 # Imports locales
 from src.logger.logger import Logger
-from src.utils.utils import get_http_response, getenv, fetch_excluded_topics
+from src.utils.executor import ExecutorService
+from src.utils.utils import get_http_response, getenv, fetch_excluded_topics, make_soup, DEFAULT_HTML_PARSER
 from src.products.product import Product
 
 ################################################################################
@@ -44,6 +44,32 @@ def init_alibaba_item(html_content):
     item.fetch_data()
     return item
 
+# Selector CSS compilado de las tarjetas de cada producto en el listado
+ITEM_CARD_SELECTOR = soupsieve.compile('div.ui-search-result__wrapper')
+
+def parse_meli_listing(html_content, parser=DEFAULT_HTML_PARSER):
+    """
+    Recorre una unica vez la pagina de un listado y devuelve los datos de
+    cada producto como diccionarios.
+
+    Args:
+        html_content (str or BeautifulSoup): Contenido HTML de la pagina del listado.
+        parser (str, optional): Parser de BeautifulSoup a usar si el contenido es texto.
+
+    Returns:
+        list: Lista con el diccionario de campos de cada producto cargado con exito.
+    """
+    if isinstance(html_content, str):
+        html_content = make_soup(html_content, parser)
+
+    items_data = []
+    for card in ITEM_CARD_SELECTOR.select(html_content):
+        # La tarjeta se procesa tal cual, sin volver a convertirla en texto
+        item = init_alibaba_item(card)
+        if item.fetch_status:
+            items_data.append(item.to_dicc())
+    return items_data
+
 class MeLiProductListings:
     ############################################################################
     # Atributos globables
@@ -53,7 +79,7 @@ class MeLiProductListings:
     
     DEFAULT_SAVE_HTML = False
     DEFAULT_ENABLE_MP = True
-    DEFAULT_N_CORES = -1
+    DEFAULT_LISTING_MODE = 'item' # 'item' o 'page'
     DEBUG = False
     
     DEFAULT_TOPICS = [
@@ -79,8 +105,9 @@ class MeLiProductListings:
             self.listings = {}
             self.urls = {}
             self.save_html = getenv('PRODUCTS_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+            self.html_parser = getenv('PRODUCTS_HTML_PARSER', DEFAULT_HTML_PARSER)
             self.enable_mp = getenv('ENABLE_MP', self.DEFAULT_ENABLE_MP)
-            self.n_cores = self.set_n_cores()
+            self.listing_mode = getenv('PRODUCTS_LISTING_MODE', self.DEFAULT_LISTING_MODE)
             
             self.excluded_topics = fetch_excluded_topics(platform='meli', method='get')
             self.failed_topics = []
@@ -91,28 +118,9 @@ class MeLiProductListings:
             # Defino una lista por defecto y
             # agrego las tematicas de interes
             self.add_topics(self.DEFAULT_TOPICS + topics)
-
-            # Inicializar el objeto Pool para el procesamiento paralelo
-            if self.enable_mp:
-                self.pool = Pool(processes=self.n_cores)
-            else:
-                self.pool = None
             
             self.initialized = True
     
-    def set_n_cores(self):
-        """
-        Obtiene el número de procesos a utilizar según la configuración.
-        """
-        max_n_cores = cpu_count()
-        if getenv('MP_N_CORES', self.DEFAULT_N_CORES) < 0:
-            return max_n_cores
-        else:
-            if getenv('MP_N_CORES', self.DEFAULT_N_CORES) > max_n_cores:
-                return max_n_cores
-            else:
-                return getenv('MP_N_CORES', self.DEFAULT_N_CORES)
-
     ############################################################################
     # Metodos de de uso
     ############################################################################
@@ -183,7 +191,9 @@ class MeLiProductListings:
                     
                     # Obtengo el contenido HTML
                     url = self.listings[topic]['url']
-                    response = get_http_response(url)
+                    # En modo 'page' la pagina se interpreta recien al buscar los items
+                    response_type = 'text' if self.listing_mode == 'page' else 'page'
+                    response = get_http_response(url, response_type=response_type, parser=self.html_parser)
                     
                     if response:
                         self.listings[topic]['html_content'] = response
@@ -216,6 +226,11 @@ class MeLiProductListings:
         """
         Scrapea el contenido HTML de cada URL y crea objetos segun el tipo que corresponda.
         """
+        # En modo 'page' cada pagina se recorre una unica vez
+        if self.listing_mode == 'page':
+            self.page_item_initialize()
+            return
+
         for topic in self.topics:
             if 'html_content' in self.listings[topic]:
                 html_content = self.listings[topic]['html_content']
@@ -223,7 +238,7 @@ class MeLiProductListings:
                 try:
                     # Obtengo los items encontrados
                     # NOTA: Aca es donde hay que cambiar para aplicar el filtro correcto
-                    html_contents = html_content.find_all('div', class_='ui-search-result__wrapper')
+                    html_contents = ITEM_CARD_SELECTOR.select(html_content)
                     
                     if self.enable_mp:
                         # Procesamiento en paralelo
@@ -243,13 +258,13 @@ class MeLiProductListings:
 
     def parallel_item_initialize(self, topic, html_contents):
         """
-        Inicializa los objetos utilizando multiprocessing.Pool.
+        Inicializa los objetos en paralelo utilizando el servicio de ejecucion compartido.
         """
         try:
             # Paso el contenido a string porque sino, no puede procesar en paralelo
             html_contents = [str(x) for x in html_contents]
             init_func = partial(init_alibaba_item)
-            self.listings[topic]['items'] = self.pool.map(init_func, html_contents)
+            self.listings[topic]['items'] = ExecutorService().map(init_func, html_contents, task_type='products')
         except Exception as e:
             logger.error(f'Error al inicializar los objetos en paralelo. Error: {str(e)}')
 
@@ -258,10 +273,38 @@ class MeLiProductListings:
         Inicializa los objetos de forma serial.
         """
         try:
-            self.listings[topic]['items'] = [init_alibaba_item(str(html_content)) for html_content in html_contents]
+            self.listings[topic]['items'] = [init_alibaba_item(html_content) for html_content in html_contents]
         except Exception as e:
             logger.error(f'Error al inicializar los objetos en serie. Error: {str(e)}')
 
+    def page_item_initialize(self):
+        """
+        Inicializa los objetos recorriendo cada pagina de listado una unica vez.
+        Si el procesamiento en paralelo esta habilitado, se reparten las paginas
+        completas (no las tarjetas) entre los trabajadores.
+        """
+        topics = [x for x in self.topics if self.listings.get(x, {}).get('html_content')]
+        pages = [self.listings[x]['html_content'] for x in topics]
+        parse_func = partial(parse_meli_listing, parser=self.html_parser)
+        
+        try:
+            if self.enable_mp:
+                results = ExecutorService().map(parse_func, pages, task_type='products')
+            else:
+                results = [parse_func(x) for x in pages]
+        except Exception as e:
+            logger.error(f'Error al recorrer las paginas de los listados. Error: {str(e)}')
+            return
+        
+        for topic, items_data in zip(topics, results):
+            self.listings[topic]['items'] = [MeLiProduct.from_dict({**x, 'topic': topic}) for x in items_data]
+            
+            # El HTML de la pagina ya no se necesita
+            self.listings[topic]['html_content'] = None
+            
+            if self.DEBUG:
+                logger.info(f'Se encontraron {len(items_data)} productos para la tematica [{topic}].')
+
     def show_items_content(self):
         """
         Muestra el contenido de cada item para cada tematica.
@@ -334,7 +377,7 @@ class MeLiProduct(Product):
             html_content (str): Contenido HTML a establecer.
         """
         if isinstance(html_content, str):
-            html_content = BeautifulSoup(html_content, 'html.parser')
+            html_content = make_soup(html_content, self.html_parser)
         self.html_content = html_content
         
         if self.product_id is None:
@@ -473,6 +516,9 @@ class MeLiProduct(Product):
         
         except Exception as e:
             logger.warning(f"Fallo al cargar datos mediante scraping de contenido HTML: {e}")
+        finally:
+            # El HTML ya no se necesita una vez extraidos los datos
+            self.release_html()
 
         return False
 
@@ -497,7 +543,7 @@ class MeLiProduct(Product):
             
                 # Si tengo el ID de producto pero si tengo una URL intento usar esa
                 # esa URL
-                aux_html_content = get_http_response(url=self.url)
+                aux_html_content = get_http_response(url=self.url, parser=self.html_parser)
                 
                 # Intento buscar un elemento input con name='itemId'
                 elem = aux_html_content.find('input', {'name': 'itemId'})
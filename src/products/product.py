@@ -12,7 +12,7 @@ import os
 
 # Imports locales
 from src.logger.logger import Logger
-from src.utils.utils import getenv
+from src.utils.utils import getenv, DEFAULT_HTML_PARSER
 
 ################################################################################
 # Genero una instancia del Logger
@@ -58,6 +58,7 @@ class Product:
         
         # Defino si tengo que guardar los HTML
         self.save_html = getenv('PRODUCTS_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+        self.html_parser = getenv('PRODUCTS_HTML_PARSER', DEFAULT_HTML_PARSER)
         
         # Este no va en el diccionario
         self.html_content = None
@@ -73,6 +74,17 @@ class Product:
             if key in self.DEFAULT_VALUES:
                 setattr(self, key, value)
 
+    @classmethod
+    def from_dict(cls, info_dict):
+        """
+        Crea un objeto con los datos ya cargados a partir de un diccionario de
+        campos, por ejemplo el obtenido al recorrer la pagina de un listado.
+        """
+        item = cls(info_dict=info_dict)
+        item.data_loaded = True
+        item.fetch_status = True
+        return item
+
     def to_dicc(self):
         """Convierte el objeto a un diccionario con los valores actuales."""
         return {key: getattr(self, key) for key in self.DEFAULT_VALUES}
@@ -101,6 +113,14 @@ class Product:
     ############################################################################
     # Funciones de obtención de código HTML
     ############################################################################
+    def release_html(self):
+        """
+        Libera el contenido HTML una vez procesado, salvo que se este
+        depurando o guardando el HTML.
+        """
+        if not (self.DEBUG or self.save_html):
+            self.html_content = None
+
     def save_html_content(self, html_content=None):
         """
         Guarda el contenido HTML del producto en un archivo.
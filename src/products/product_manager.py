@@ -274,9 +274,11 @@ class ProductManager:
         """
         # try:
         # Inserto los datos de los productos que se obtuvieron con exito
-        for item in self.items:
-            if item.fetch_status:
-                self.database.insert_product_record( item.to_dicc() )
+        # en una unica transaccion
+        with self.database.bulk():
+            for item in self.items:
+                if item.fetch_status:
+                    self.database.insert_product_record( item.to_dicc() )
         # except Exception as e:
         #     logger.error(f"Error al insertar datos para los productos en la base de datos: {str(e)}")
     
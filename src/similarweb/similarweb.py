@@ -8,11 +8,10 @@ import os
 # sys.path.append(project_root)
 
 # Imports de terceros
-from bs4 import BeautifulSoup
 
 # Imports locales
 from src.logger.logger import Logger
-from src.utils.utils import get_formatted_date, get_similarweb_url_tuple, getenv
+from src.utils.utils import get_formatted_date, get_similarweb_url_tuple, getenv, make_soup, DEFAULT_HTML_PARSER
 
 ################################################################################
 # Genero una instancia del Logger
@@ -34,19 +33,23 @@ class SimilarWebTopWebsitesTable:
         self.filename = filename or self.DEFAULT_FILENAME
         self.row_data = []
         self.save_html = getenv('SIMILARWEB_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+        self.html_parser = getenv('SIMILARWEB_HTML_PARSER', DEFAULT_HTML_PARSER)
         self.html_content = ''
         self.data_loaded = False
         self.fetch_status = False
         
-        if self.filename is not None:
+        if filename is not None:
             self.set_html_content_fromfile(filename=self.filename)
     
     ############################################################################
     # Funciones de obtención de contenido HTML
     ############################################################################
     def set_html_content(self, html_content):
-        """Establece el contenido HTML de la tabla."""
+        """Establece el contenido HTML de la tabla (codigo HTML o documento ya procesado)."""
+        if isinstance(html_content, str):
+            html_content = make_soup(html_content, self.html_parser)
         self.html_content = html_content
+        self.data_loaded = True
 
     def set_html_content_fromfile(self, filename=None):
         """Carga el contenido HTML desde un archivo."""
@@ -54,7 +57,7 @@ class SimilarWebTopWebsitesTable:
             self.filename = filename
         try:
             with open(self.filename, 'r', encoding="utf-8") as file:
-                self.html_content = BeautifulSoup(file, 'html.parser')
+                self.html_content = make_soup(file, self.html_parser)
             self.data_loaded = True
         except Exception as e:
             msg = f'No se pudo cargar el archivo {filename}: {str(e)}'
@@ -219,6 +222,7 @@ class SimilarWebWebsite:
         self.data_loaded = False
         self.html_content = None
         self.save_html = getenv('SIMILARWEB_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+        self.html_parser = getenv('SIMILARWEB_HTML_PARSER', DEFAULT_HTML_PARSER)
         self.fetch_status = False
         self.filename = filename
         
@@ -295,8 +299,10 @@ class SimilarWebWebsite:
         Establece el contenido HTML.
 
         Args:
-            html_content (str): Contenido HTML a establecer.
+            html_content (str): Contenido HTML a establecer (codigo HTML o documento ya procesado).
         """
+        if isinstance(html_content, str):
+            html_content = make_soup(html_content, self.html_parser)
         self.html_content = html_content
         if self.DEBUG:
             logger.info(f"Contenido HTML establecido con éxito para el sitio {self.domain}.")
@@ -306,7 +312,7 @@ class SimilarWebWebsite:
             self.filename = filename
         try:
             with open(self.filename, 'r', encoding="utf-8") as file:
-                self.html_content = BeautifulSoup(file, 'html.parser')
+                self.html_content = make_soup(file, self.html_parser)
         except Exception as e:
             msg = f'Could not save file {filename}: {e}'
             logger.error(msg)
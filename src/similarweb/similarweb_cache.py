@@ -0,0 +1,172 @@
+# Imports estándar de Python
+import os
+import time
+import zlib
+import sqlite3
+import threading
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+# Ninguno en este set
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class RenderCache:
+    """
+    Cache en disco del codigo HTML de las paginas de SimilarWeb renderizadas
+    con el navegador, guardada en una base SQLite.
+
+    Los datos de SimilarWeb cambian una vez por mes, por lo que una pagina
+    renderizada hace menos de SIMILARWEB_CACHE_TTL segundos se reutiliza sin
+    abrir el navegador. Las entradas se identifican por la URL normalizada.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_ENABLE = True
+    DEFAULT_TTL = 7 * 24 * 3600 # Segundos
+    DEFAULT_FILENAME = 'similarweb_cache.db'
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma. Las conexiones SQLite no se
+    # comparten entre procesos.
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self, path=None):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.enable = getenv('SIMILARWEB_CACHE_ENABLE', self.DEFAULT_ENABLE)
+            self.ttl = getenv('SIMILARWEB_CACHE_TTL', self.DEFAULT_TTL)
+            self.path = path or self.get_default_path()
+            self.lock = threading.Lock()
+            self.conn = None
+
+            if self.enable:
+                self.connect()
+            self.initialized = True
+
+    def get_default_path(self):
+        """
+        Devuelve la ruta por defecto del archivo de cache.
+        """
+        return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'cache', self.DEFAULT_FILENAME)
+
+    def connect(self):
+        """
+        Abre la base de la cache, crea la tabla si no existe y elimina las
+        entradas vencidas.
+        """
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode = WAL')
+            self.conn.execute('PRAGMA synchronous = NORMAL')
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS RENDER_CACHE (
+                    URL TEXT PRIMARY KEY,
+                    CONTENT BLOB,
+                    STORED_AT REAL
+                )
+            """)
+            self.conn.execute('DELETE FROM RENDER_CACHE WHERE STORED_AT < ?', (time.time() - self.ttl,))
+            self.conn.commit()
+
+            if self.DEBUG:
+                logger.info(f'Se abrio la cache de paginas de SimilarWeb en [{self.path}].')
+        except Exception as e:
+            logger.error(f'Error al abrir la cache de paginas de SimilarWeb en [{self.path}]. Se deshabilita la cache. Error: {e}')
+            self.conn = None
+            self.enable = False
+
+    ############################################################################
+    # Lectura y escritura de entradas
+    ############################################################################
+    def get(self, url):
+        """
+        Devuelve el codigo HTML guardado para la URL si todavia esta vigente.
+
+        Args:
+            url (str): URL normalizada de la pagina.
+
+        Returns:
+            str: Codigo HTML o None si no hay una copia vigente.
+        """
+        if not self.enable:
+            return None
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    'SELECT CONTENT, STORED_AT FROM RENDER_CACHE WHERE URL = ?', (url,)
+                ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                return None
+            if self.DEBUG:
+                logger.info(f'Se usa la copia en cache de la pagina [{url}].')
+            return zlib.decompress(row[0]).decode('utf-8')
+        except Exception as e:
+            logger.error(f'Error al leer la pagina [{url}] de la cache. Error: {e}')
+            return None
+
+    def store(self, url, html):
+        """
+        Guarda el codigo HTML de una pagina renderizada.
+
+        Args:
+            url (str): URL normalizada de la pagina.
+            html (str): Codigo HTML de la pagina.
+        """
+        if not self.enable or not html:
+            return
+        try:
+            with self.lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO RENDER_CACHE VALUES (?, ?, ?)',
+                    (url, zlib.compress(html.encode('utf-8')), time.time())
+                )
+                self.conn.commit()
+        except Exception as e:
+            logger.error(f'Error al guardar la pagina [{url}] en la cache. Error: {e}')
+
+    def invalidate(self, url=None):
+        """
+        Elimina la copia de una pagina o, si no se indica una URL, la cache completa.
+        """
+        if not self.enable:
+            return
+        try:
+            with self.lock:
+                if url is None:
+                    self.conn.execute('DELETE FROM RENDER_CACHE')
+                else:
+                    self.conn.execute('DELETE FROM RENDER_CACHE WHERE URL = ?', (url,))
+                self.conn.commit()
+        except Exception as e:
+            logger.error(f'Error al eliminar paginas de la cache. Error: {e}')
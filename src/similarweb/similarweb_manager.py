@@ -17,6 +17,7 @@ from src.database.db import Database
 from src.utils.driver import Driver
 from src.utils.utils import SIMILARWEB_BASE_URL, get_similarweb_url_tuple, getenv
 from src.similarweb.similarweb import SimilarWebTopWebsitesTable, SimilarWebWebsite
+from src.similarweb.similarweb_cache import RenderCache
 
 ################################################################################
 # Genero una instancia del Logger
@@ -76,6 +77,9 @@ class SimilarWebManager:
             # Inicializar el driver
             self.driver = self.initialize_driver()
             
+            # Cache de paginas renderizadas
+            self.cache = RenderCache()
+            
             # Marco la clase como inicializada
             self.initialized = True
             
@@ -136,35 +140,25 @@ class SimilarWebManager:
     def fetch_data(self):
         """
         """
-        # Verifico que el driver esta listo para operar
-        if self.driver is None:
-            logger.error(f'Error al obtener datos. El driver no esta inicializado.')
-            return
-        
         # Armo la lista de URLs para las tablas
         table_urls = [
             SIMILARWEB_BASE_URL + 'top-websites/',
             SIMILARWEB_BASE_URL + 'top-websites/arts-and-entertainment/tv-movies-and-streaming/',
         ]
         
-        # Apartir de esa lista, armos los nombres de los archivos
-        table_filenames = [self.generate_filename(x) for x in table_urls]
-        
-        # Hago el fetch de los HTML
-        if not self.skip_scrap:
-            self.driver.open_multiple_urls(
-                    urls = table_urls,
-                    timeout = self.delay,
-                    element_selector = '.app-section__content'
-                )
-        
         # Para cada top, obtengo la lista de dominios
         html_url_tuple = []
-        for table_filename in table_filenames:
+        for table_url, html in self.iter_pages(table_urls):
             # Obtengo la lista de paginas mas vistas
-            table = SimilarWebTopWebsitesTable(filename = table_filename)
+            table = SimilarWebTopWebsitesTable()
+            table.set_html_content(html)
             table.fetch_rows()
-            html_url_tuple.extend( table.get_url_list() )
+            url_list = table.get_url_list()
+            
+            # Una tabla sin filas es un renderizado incompleto
+            if not url_list:
+                self.discard_page(table_url)
+            html_url_tuple.extend( url_list )
         
         # Me quedo solo con las URLs
         html_urls = [x[0] for x in html_url_tuple]
@@ -219,24 +213,27 @@ class SimilarWebManager:
         logger.info('Se va a obtener la informacion de [{}] paginas web'.format(len(url_list)))
         logger.info(f'Lista final de URLs: {url_list}')
 
-        # Obtengo el codigo HTML para esas paginas
-        if not self.skip_scrap:
-            self.driver.open_multiple_urls(
-                    urls = url_list,
-                    timeout = self.delay,
-                    element_selector='.app-section__content'
-                )
-        
-        # Apartir de esa lista, armos los nombres de los archivos
-        domain_filenames = [self.generate_filename(x) for x in url_list]
-
-        # Recorro la lista de URLs
-        for filename in domain_filenames:
+        # Proceso cada pagina a medida que el driver la obtiene. El navegador
+        # queda fuera de la transaccion para no bloquear la base de datos
+        # mientras se renderizan las paginas
+        web_infos = []
+        for url, html in self.iter_pages(url_list):
             # Obtengo la informacion a partir del contenido HTML
-            web_info = SimilarWebWebsite(filename=filename)
+            web_info = SimilarWebWebsite()
+            web_info.set_html_content(html)
             web_info.fetch_data()
             
             if web_info.fetch_status:
+                web_infos.append(web_info)
+            else:
+                logger.error(f'Se produjo un error al intentar obtener los datos para el sitio [{url}].')
+                self.discard_page(url)
+
+        # Guardo los datos en una unica transaccion corta.
+        # NOTA: get_domain_id() usa la misma conexion, por lo que ve los dominios
+        # nuevos que todavia no se confirmaron
+        with self.database.bulk():
+            for web_info in web_infos:
                 # Obtengo el ID del canal
                 try:
                     # Busco el dominio en la base de datos
@@ -250,9 +247,6 @@ class SimilarWebManager:
 
                 # Mostrar datos de la pagina que fueron guardados en la base de datos
                 logger.info(str(web_info))
-                
-            else:
-                logger.error(f'Se produjo un error al intentar obtener los datos para un sitio desde el archivo [{filename}].')
 
     def get_domain_id(self, domain='youtube.com'):
         """
@@ -293,6 +287,80 @@ class SimilarWebManager:
     ############################################################################
     # Utilidades
     ############################################################################
+    def iter_pages(self, urls, timeout=None):
+        """
+        Obtiene el codigo HTML de las URLs y lo devuelve a medida que cada
+        pagina esta lista, para procesarla mientras se cargan las siguientes.
+
+        Las paginas con una copia vigente en la cache se devuelven sin abrir
+        el navegador y solo se renderizan las demas. Con SIMILARWEB_SKIP_SCRAP
+        no se abre el navegador y se leen las copias guardadas en disco por
+        el driver.
+
+        Si una pagina no se puede procesar hay que llamar a discard_page()
+        para que no quede en la cache y se vuelva a renderizar en la proxima
+        corrida.
+
+        Yields:
+            tuple: (url, html)
+        """
+        if not isinstance(urls, list):
+            urls = [urls]
+        
+        if not self.skip_scrap:
+            # Primero devuelvo las paginas vigentes en la cache
+            stale_urls = []
+            for url in urls:
+                html = self.cache.get(self.get_cache_key(url))
+                if html is None:
+                    stale_urls.append(url)
+                else:
+                    yield url, html
+            
+            if self.DEBUG:
+                logger.info(f'Paginas obtenidas desde la cache: {len(urls) - len(stale_urls)}. Paginas a renderizar: {len(stale_urls)}.')
+            if not stale_urls:
+                return
+            
+            # Verifico que el driver esta listo para operar
+            if self.driver is None:
+                logger.error(f'Error al obtener datos. El driver no esta inicializado.')
+                return
+            
+            for url, html in self.driver.iter_multiple_urls(
+                    urls = stale_urls,
+                    timeout = timeout or self.delay,
+                    element_selector = '.app-section__content'
+                ):
+                self.cache.store(self.get_cache_key(url), html)
+                yield url, html
+            return
+        
+        for url in urls:
+            filename = self.generate_filename(url)
+            try:
+                with open(filename, 'r', encoding='utf-8') as file:
+                    yield url, file.read()
+            except Exception as e:
+                logger.error(f'No se pudo leer el contenido HTML guardado en [{filename}]. Error: {e}')
+
+    def discard_page(self, url):
+        """
+        Elimina de la cache la copia de una pagina que no se pudo procesar
+        (renderizado parcial, pagina intermedia, etc.).
+        """
+        if not self.skip_scrap:
+            self.cache.invalidate(self.get_cache_key(url))
+
+    def get_cache_key(self, url):
+        """
+        Devuelve la clave de la cache para una URL (la URL normalizada por el driver).
+        """
+        try:
+            return self.driver._normalize_url(url)
+        except Exception:
+            return url
+
     def generate_filename(self, url):
         """
         Genera un alias para el nombre de archivo basado en la URL.
@@ -329,29 +397,18 @@ class SimilarWebManager:
         NOTA: Deberia reflejar lo mismo que hace fetch_data pero sin agregar
                 nada a la base de datos
         """
-        # Verifico que el driver esta listo para operar
-        if self.driver is None:
-            logger.error(f'Error al obtener datos. El driver no esta inicializado.')
-            return
-        
-        # Me aseguro de tener una espera
-        timeout = timeout or self.timeout
-        
         # Armo la URL
         url = get_similarweb_url_tuple(domain)[0]
         
         # Obtengo los datos del sitio
-        self.driver.open_multiple_urls(
-                urls = url,
-                timeout = timeout,
-                element_selector = '.app-section__content'
-            )
-
-        # Armo el nombre del archivo a leer
-        filename = self.generate_filename(url)
+        pages = dict(self.iter_pages([url], timeout=timeout))
+        if url not in pages:
+            logger.error(f'No se pudo obtener el contenido HTML del sitio [{url}].')
+            return
 
         # Obtengo la informacion a partir del contenido HTML
-        web_info = SimilarWebWebsite(filename=filename)
+        web_info = SimilarWebWebsite()
+        web_info.set_html_content(pages[url])
         web_info.fetch_data()
             
         if web_info.fetch_status:
@@ -366,7 +423,8 @@ class SimilarWebManager:
             logger.info(str(web_info))
             
         else:
-            logger.error(f'Se produjo un error al intentar obtener los datos para un sitio desde el archivo [{filename}].')
+            logger.error(f'Se produjo un error al intentar obtener los datos para el sitio [{url}].')
+            self.discard_page(url)
 
     def add_web(self, domain='youtube.com'):
         """
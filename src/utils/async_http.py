@@ -0,0 +1,223 @@
+# Imports estándar de Python
+import os
+import time
+import asyncio
+from urllib.parse import urlparse
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv, HEADER
+from src.utils.http_client import http_get
+from src.utils.http_cache import get_http_cache
+from src.utils.http_archive import get_http_archive
+from src.utils.rate_limiter import RateLimiter, THROTTLE_STATUS_CODES
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class AsyncFetcher:
+    """
+    Descarga el contenido de muchas URLs en paralelo usando asyncio.
+
+    Pensado para trabajo de I/O (scraping de HTML): con aiohttp un unico
+    proceso mantiene cientos de solicitudes en vuelo, limitadas por un
+    semaforo global y uno por host. Si aiohttp no esta instalado, cada
+    solicitud se hace con la sesion HTTP compartida en un hilo aparte
+    (asyncio.to_thread), y la concurrencia real queda limitada por los hilos
+    del ejecutor por defecto y por el pool de conexiones de la sesion.
+
+    Si se indica una funcion de procesamiento, cada pagina se procesa apenas
+    termina su descarga y solo se conserva el resultado, para no retener en
+    memoria el HTML de todas las paginas a la vez.
+
+    Las URLs que tienen que pasar por el archivo de grabaciones (modo record
+    o replay) o que tienen un TTL en la cache HTTP tambien se piden con la
+    sesion compartida, para no saltear esas capas.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Configuraciones por defecto
+    DEFAULT_MAX_CONCURRENCY = 100 # Solicitudes en vuelo en total
+    DEFAULT_MAX_PER_HOST = 20 # Solicitudes en vuelo por host
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_RETRY_ATTEMPTS = 2
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    def __init__(self, max_concurrency=None, max_per_host=None, timeout=None, retry_attempts=None):
+        self.max_concurrency = max_concurrency or getenv('ASYNC_HTTP_MAX_CONCURRENCY', self.DEFAULT_MAX_CONCURRENCY)
+        self.max_per_host = max_per_host or getenv('ASYNC_HTTP_MAX_PER_HOST', self.DEFAULT_MAX_PER_HOST)
+        self.timeout = timeout or getenv('ASYNC_HTTP_TIMEOUT', self.DEFAULT_TIMEOUT)
+        self.retry_attempts = retry_attempts if retry_attempts is not None else getenv('ASYNC_HTTP_RETRY_ATTEMPTS', self.DEFAULT_RETRY_ATTEMPTS)
+
+    ############################################################################
+    # Descarga de contenido
+    ############################################################################
+    def fetch_texts(self, urls, callback=None):
+        """
+        Descarga el texto de todas las URLs dadas.
+
+        Args:
+            urls (list): Lista de URLs a descargar.
+            callback (callable, optional): Funcion callback(url, texto) que
+                procesa cada pagina apenas se descarga. El texto es None si la
+                URL no se pudo descargar.
+
+        Returns:
+            dict: Diccionario {URL: texto}, o {URL: resultado de callback} si
+            se indico callback. El texto es None si la URL no se pudo descargar.
+        """
+        # Elimino duplicados manteniendo el orden
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        try:
+            return asyncio.run(self._fetch_all(urls, callback))
+        except Exception as e:
+            logger.error(f'Error al descargar las URLs de forma asincronica. Error: {e}')
+            return {url: self._process(callback, url, None) for url in urls}
+
+    def _process(self, callback, url, text):
+        """
+        Procesa el texto descargado de una URL con callback, si se indico.
+        """
+        if callback is None:
+            return text
+        try:
+            return callback(url, text)
+        except Exception as e:
+            logger.error(f'Error al procesar el contenido de la URL [{url}]. Error: {e}')
+            return None
+
+    async def _fetch_all(self, urls, callback=None):
+        """
+        Lanza una tarea por URL y espera a que terminen todas. Cada pagina se
+        procesa apenas termina su descarga.
+        """
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.host_semaphores = {}
+
+        if aiohttp is None:
+            if self.DEBUG:
+                logger.info('aiohttp no esta instalado. Se usa la sesion HTTP compartida en hilos.')
+            results = await asyncio.gather(*[self._fetch_and_process(None, url, callback) for url in urls])
+        else:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.max_per_host)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'user-agent': HEADER}) as session:
+                results = await asyncio.gather(*[
+                    self._fetch_and_process(None if self._use_shared_session(url) else session, url, callback) for url in urls
+                ])
+
+        if self.DEBUG:
+            n_ok = sum(1 for x in results if x is not None)
+            logger.info(f'Se obtuvieron {n_ok} de {len(urls)} URLs de forma asincronica.')
+        return dict(zip(urls, results))
+
+    async def _fetch_and_process(self, session, url, callback):
+        """
+        Descarga una URL y la procesa en cuanto termina, liberando el texto.
+        """
+        text = await self._fetch_one(session, url)
+        return self._process(callback, url, text)
+
+    def _use_shared_session(self, url):
+        """
+        Indica si la URL se tiene que pedir con la sesion HTTP compartida
+        porque la manejan el archivo de grabaciones o la cache HTTP.
+        """
+        if get_http_archive() is not None:
+            return True
+        cache = get_http_cache()
+        return cache is not None and cache.get_ttl(url) > 0
+
+    def _get_host_semaphore(self, url):
+        """
+        Devuelve el semaforo asociado al host de la URL.
+        """
+        host = urlparse(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self.host_semaphores[host]
+
+    async def _fetch_one(self, session, url):
+        """
+        Descarga una URL respetando los limites de concurrencia.
+
+        Returns:
+            str: El texto de la respuesta o None si fallaron todos los intentos.
+        """
+        async with self.semaphore, self._get_host_semaphore(url):
+            attempts = 0
+            while attempts <= self.retry_attempts:
+                try:
+                    retry_after = None
+                    if session is None:
+                        response = await asyncio.to_thread(http_get, url, timeout=self.timeout)
+                        status, text = response.status_code, response.text
+                        retry_after = response.headers.get('Retry-After')
+                    else:
+                        # La sesion de aiohttp no pasa por el adaptador de
+                        # requests, asi que uso el limitador directamente
+                        limiter = RateLimiter()
+                        await asyncio.to_thread(limiter.acquire, url)
+                        start = time.perf_counter()
+                        try:
+                            async with session.get(url) as response:
+                                status, text = response.status, await response.text()
+                                retry_after = response.headers.get('Retry-After')
+                        except Exception:
+                            limiter.report(url, None, time.perf_counter() - start)
+                            raise
+                        limiter.report(url, status, time.perf_counter() - start, retry_after)
+
+                    if 200 <= status < 300:
+                        return text
+
+                    # Si el servidor nos limita, reintento con backoff
+                    if status in THROTTLE_STATUS_CODES and attempts < self.retry_attempts:
+                        attempts += 1
+                        limiter = RateLimiter()
+                        if limiter.get_host(url) is None:
+                            await asyncio.sleep(limiter.get_backoff(attempts, retry_after))
+                        continue
+
+                    # El resto de los errores HTTP no se reintentan
+                    logger.error(f'URL [{url}], HTTP code [{status}], Message [ERROR! Ocurrió un error inesperado al cargar la URL seleccionada]')
+                    return None
+
+                except Exception as e:
+                    if self.DEBUG:
+                        logger.error(f'Error al descargar la URL [{url}]. Error: {e}')
+
+                    # Espero antes de reintentar, con backoff exponencial y jitter
+                    attempts += 1
+                    if attempts <= self.retry_attempts:
+                        await asyncio.sleep(RateLimiter().get_backoff(attempts))
+
+        logger.error(f"No se pudo obtener la respuesta HTTP para la URL [{url}] después de {self.retry_attempts} intentos.")
+        return None
+
+def fetch_texts(urls, callback=None):
+    """
+    Descarga el texto de todas las URLs dadas de forma asincronica.
+    """
+    return AsyncFetcher().fetch_texts(urls, callback)
@@ -1,9 +1,13 @@
 # Imports estándar de Python
 import os
+import json
 import time
+import shutil
+import subprocess
 from urllib.parse import urlparse, urlunparse
 from pathlib import Path
 import threading
+import queue
 # import sys
 
 # Añade el directorio raíz del proyecto a sys.path
@@ -30,7 +34,8 @@ from webdriver_manager.microsoft import EdgeChromiumDriverManager
 # Imports locales
 from src.logger.logger import Logger
 from src.utils.environment import set_environment
-from src.utils.utils import getenv
+from src.utils.utils import getenv, get_formatted_date
+from src.utils.exclusion_store import file_lock
 
 ################################################################################
 # Genero una instancia del Logger
@@ -46,11 +51,46 @@ class Driver:
     ############################################################################
     # Valores por defecto para los atributos de la clase
     DRIVERS_PATH = r'drivers/'
+    DRIVERS_MANIFEST = 'manifest.json' # Binarios fijados en DRIVERS_PATH
     RESULTS_PATH = r'results/similarweb/'
     DEFAULT_BROWSER = 'chrome'
     DEFAULT_TIMEOUT = 8
     DEFAULT_MAX_CONCURRENCE = 4
+    DEFAULT_RECYCLE_PAGES = 50 # Paginas que abre cada navegador del pool antes de reiniciarse
+    DEFAULT_RETRIES = 1 # Reintentos de una URL si el navegador falla
+    DEFAULT_LOAD_PROFILE = 'default' # 'default' o 'lean'
+    DEFAULT_HEADLESS = False
+    DEFAULT_NETWORK_IDLE = 0.5 # Segundos sin pedidos nuevos para considerar cargada la pagina
+    DEFAULT_SAVE_HTML = True # Guardar una copia en disco de las paginas del pool
+    DEFAULT_AUTO_RESOLVE = True # Descargar y fijar el binario si todavia no hay uno
+    LOAD_PROFILES = ['default', 'lean']
     DEBUG = False
+
+    # Recursos que no se descargan en el perfil 'lean' (patrones de URL)
+    BLOCKED_URL_PATTERNS = [
+        # Imagenes
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+        # Fuentes
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+        # Audio y video
+        '*.mp4', '*.webm', '*.mp3', '*.m4a', '*.ogg', '*.wav',
+        # Trackers y publicidad de terceros
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googlesyndication.com*', '*facebook.net*', '*hotjar.com*', '*hubspot.com*',
+        '*bing.com/bat*', '*clarity.ms*', '*linkedin.com/px*', '*adservice.google.com*',
+    ]
+
+    # Preferencias de Firefox para el perfil 'lean' (no admite bloquear por URL)
+    FIREFOX_LEAN_PREFERENCES = {
+        'permissions.default.image': 2,
+        'gfx.downloadable_fonts.enabled': False,
+        'media.autoplay.default': 5,
+        'media.play-stand-in-content': False,
+        'privacy.trackingprotection.enabled': True,
+    }
+    
+    # Bloqueo para que los hilos del pool no descarguen el mismo binario a la vez
+    resolve_lock = threading.Lock()
     
     def __init__(self):
         """
@@ -66,10 +106,26 @@ class Driver:
         self.default_browser = getenv('DRIVER_BROWSER', self.DEFAULT_BROWSER)
         self.timeout = getenv('DRIVER_TIMEOUT', self.DEFAULT_TIMEOUT)
         self.max_concurrent = getenv('DRIVER_MAX_CONCURRENCE', self.DEFAULT_MAX_CONCURRENCE) 
+        self.recycle_pages = getenv('DRIVER_RECYCLE_PAGES', self.DEFAULT_RECYCLE_PAGES)
+        self.retries = getenv('DRIVER_RETRIES', self.DEFAULT_RETRIES)
+        self.load_profile = getenv('DRIVER_LOAD_PROFILE', self.DEFAULT_LOAD_PROFILE)
+        self.headless = getenv('DRIVER_HEADLESS', self.DEFAULT_HEADLESS)
+        self.network_idle = getenv('DRIVER_NETWORK_IDLE', self.DEFAULT_NETWORK_IDLE)
+        self.save_html = getenv('DRIVER_SAVE_HTML', self.DEFAULT_SAVE_HTML)
+        self.auto_resolve = getenv('DRIVER_AUTO_RESOLVE', self.DEFAULT_AUTO_RESOLVE)
+        self.driver_paths = {}
         self.drivers_path = self.DRIVERS_PATH
         self.results_path = self.RESULTS_PATH
         self.html_contents = {}
         self.drivers = {}  # Diccionario para manejar múltiples instancias del driver
+        self.page_counts = {} # Paginas abiertas por cada navegador del pool
+        
+        # Comprobaciones de seguridad
+        self.max_concurrent = max(self.max_concurrent, 1)
+        self.retries = max(self.retries, 0)
+        if self.load_profile not in self.LOAD_PROFILES:
+            logger.warning(f'Perfil de carga no valido: {self.load_profile}. Se usara el valor por defecto [{self.DEFAULT_LOAD_PROFILE}].')
+            self.load_profile = self.DEFAULT_LOAD_PROFILE
     
     def __del__(self):
         """
@@ -93,9 +149,14 @@ class Driver:
         """
         Cierra el navegador y libera los recursos asociados.
         """
-        if driver_key in self.drivers:
-            self.drivers[driver_key].quit()
-            del self.drivers[driver_key]
+        driver = self.drivers.pop(driver_key, None)
+        self.page_counts.pop(driver_key, None)
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as e:
+                # Si el navegador se cayo, quit() puede fallar
+                logger.warning(f'Error al cerrar el driver [{driver_key}]. Error: {e}')
 
     def cleanup(self):
         """
@@ -122,10 +183,9 @@ class Driver:
 
         try:
             # Configuración del navegador
-            # Si quiero usar los drivers que tengo descargados
-            # service = browser_options["service"](os.path.join(self.drivers_path, browser_options["driver_name"]))
-            # Si quiero instalar los drivers cada vez
-            service = browser_options["service"]( browser_options["driver_manager"]().install() )
+            # Uso el binario fijado en drivers/ para no consultar versiones en
+            # Internet cada vez que se abre un navegador
+            service = browser_options["service"]( self.get_driver_path(browser) )
             options = browser_options["options"]()
 
             for arg in browser_options.get("args", []):
@@ -133,12 +193,141 @@ class Driver:
             
             for key, value in browser_options.get("experimental_options", {}).items():
                 options.add_experimental_option(key, value)
+            
+            # Perfil de carga liviano
+            if self.headless:
+                options.add_argument(browser_options["headless_arg"])
+            if self.load_profile == 'lean':
+                self._set_lean_options(browser, options)
 
             # Inicialización del WebDriver
-            return webdriver.__dict__[browser.capitalize()](service=service, options=options)
+            driver = webdriver.__dict__[browser.capitalize()](service=service, options=options)
+            if self.load_profile == 'lean':
+                self._block_resources(browser, driver)
+            return driver
 
         except Exception as e:
             logger.error(f"Error al abrir el navegador. Error: {e}")
+            if browser in self.driver_paths:
+                logger.error(f"Si el navegador se actualizo puede ser necesario actualizar el driver fijado con resolve_drivers(refresh=True).")
+
+    ############################################################################
+    # Binarios de los drivers
+    ############################################################################
+    def get_manifest_path(self):
+        """
+        Devuelve la ruta del manifiesto de los binarios fijados.
+        """
+        return os.path.join(self.drivers_path, self.DRIVERS_MANIFEST)
+
+    def load_manifest(self):
+        """
+        Lee el manifiesto de los binarios fijados: {navegador: {path, version, ...}}.
+        """
+        try:
+            with open(self.get_manifest_path(), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f'No se pudo leer el manifiesto de drivers [{self.get_manifest_path()}]. Error: {e}')
+            return {}
+
+    def save_manifest(self, manifest):
+        """
+        Guarda el manifiesto de los binarios fijados.
+        """
+        tmp_path = self.get_manifest_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(tmp_path, self.get_manifest_path())
+
+    def get_driver_path(self, browser):
+        """
+        Devuelve la ruta del binario del driver para el navegador. Se consulta
+        el manifiesto una sola vez por navegador.
+        """
+        if browser not in self.driver_paths:
+            self.driver_paths[browser] = self.resolve_driver(browser)
+        return self.driver_paths[browser]
+
+    def resolve_driver(self, browser, refresh=False):
+        """
+        Devuelve la ruta del binario fijado para el navegador.
+
+        Si no hay uno en el manifiesto (y DRIVER_AUTO_RESOLVE esta activo) o se
+        pide refresh, se descarga con webdriver_manager, se copia en
+        drivers/<navegador>/ y se registra en el manifiesto. Es el unico
+        momento en que se consulta la version disponible en Internet.
+
+        Args:
+            browser (str): El navegador: 'chrome', 'firefox' o 'edge'.
+            refresh (bool): Descargar el binario aunque ya haya uno fijado.
+
+        Returns:
+            str: Ruta del binario.
+
+        Raises:
+            FileNotFoundError: Si no hay un binario fijado y no se permite descargarlo.
+        """
+        browser_options = self._get_browser_options(browser)
+        os.makedirs(self.drivers_path, exist_ok=True)
+        
+        with self.resolve_lock, file_lock(self.get_manifest_path()):
+            manifest = self.load_manifest()
+            entry = manifest.get(browser)
+            if not refresh and entry and os.path.isfile(entry.get('path', '')):
+                return entry['path']
+            
+            if not refresh and not self.auto_resolve:
+                raise FileNotFoundError(f'No hay un driver fijado para el navegador [{browser}] en [{self.get_manifest_path()}].')
+            
+            # Descargo el binario y lo copio a la carpeta de drivers
+            logger.info(f'Se va a descargar el driver para el navegador [{browser}].')
+            installed_path = browser_options["driver_manager"]().install()
+            folder = os.path.join(self.drivers_path, browser)
+            os.makedirs(folder, exist_ok=True)
+            driver_path = os.path.join(folder, os.path.basename(installed_path))
+            shutil.copy2(installed_path, driver_path)
+            
+            manifest[browser] = {
+                'path': driver_path,
+                'version': self._get_driver_version(driver_path),
+                'source': installed_path,
+                'resolved_at': get_formatted_date(),
+            }
+            self.save_manifest(manifest)
+        
+        self.driver_paths[browser] = driver_path
+        logger.info(f"Se fijo el driver [{manifest[browser]['version']}] del navegador [{browser}] en [{driver_path}].")
+        return driver_path
+
+    def resolve_drivers(self, browsers=None, refresh=True):
+        """
+        Descarga y fija los binarios de los navegadores pedidos (por defecto
+        el navegador configurado en DRIVER_BROWSER).
+
+        Returns:
+            dict: {navegador: ruta del binario} de los que se pudieron fijar.
+        """
+        browsers = browsers or [self.default_browser]
+        paths = {}
+        for browser in browsers:
+            try:
+                paths[browser] = self.resolve_driver(browser, refresh=refresh)
+            except Exception as e:
+                logger.error(f'No se pudo fijar el driver del navegador [{browser}]. Error: {e}')
+        return paths
+
+    def _get_driver_version(self, driver_path):
+        """
+        Devuelve la version informada por el binario del driver.
+        """
+        try:
+            result = subprocess.run([driver_path, '--version'], capture_output=True, text=True, timeout=10)
+            return result.stdout.strip().splitlines()[0]
+        except Exception:
+            return ''
 
     def _get_browser_options(self, browser):
         """
@@ -157,7 +346,8 @@ class Driver:
                 "driver_manager": ChromeDriverManager,
                 "options": ChromeOptions,
                 "args": ["--disable-usb-device-detection", "--log-level=3"],
-                "experimental_options": {'excludeSwitches': ['enable-logging']}
+                "experimental_options": {'excludeSwitches': ['enable-logging']},
+                "headless_arg": "--headless=new",
             },
             "firefox": {
                 "driver_name": "geckodriver.exe",
@@ -165,7 +355,8 @@ class Driver:
                 "driver_manager": GeckoDriverManager,
                 "options": FirefoxOptions,
                 "args": [],
-                "experimental_options": {}
+                "experimental_options": {},
+                "headless_arg": "-headless",
             },
             "edge": {
                 "driver_name": "msedgedriver.exe",
@@ -173,7 +364,8 @@ class Driver:
                 "driver_manager": EdgeChromiumDriverManager,
                 "options": EdgeOptions,
                 "args": [],
-                "experimental_options": {}
+                "experimental_options": {},
+                "headless_arg": "--headless=new",
             }
         }
 
@@ -182,6 +374,57 @@ class Driver:
 
         return browser_options[browser]
     
+    def _set_lean_options(self, browser, options):
+        """
+        Configura las opciones del perfil 'lean': estrategia de carga 'eager'
+        (no se espera a imagenes ni iframes) y, en Firefox, preferencias que
+        desactivan imagenes, fuentes descargables, autoplay y trackers.
+        """
+        options.page_load_strategy = 'eager'
+        
+        if browser == 'firefox':
+            for key, value in self.FIREFOX_LEAN_PREFERENCES.items():
+                options.set_preference(key, value)
+        else:
+            # Chrome y Edge: ademas del bloqueo por URL desactivo las imagenes
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--mute-audio')
+
+    def _block_resources(self, browser, driver):
+        """
+        Bloquea las imagenes, fuentes, medios y trackers mediante la
+        intercepcion de pedidos de Chrome DevTools (Chrome y Edge).
+        """
+        if browser == 'firefox':
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f'No se pudo configurar el bloqueo de recursos en el navegador [{browser}]. Error: {e}')
+
+    def _wait_until_ready(self, driver, element_selector=None, timeout=None):
+        """
+        Espera a que la pagina este lista: hasta que aparezca el elemento
+        pedido o, si no se indica uno, hasta que la red quede inactiva.
+
+        Raises:
+            TimeoutException: Si el elemento no aparece a tiempo.
+        """
+        timeout = timeout or self.timeout
+        if element_selector:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, element_selector))
+            )
+            return
+        
+        # Si la red no queda inactiva uso lo que se cargo hasta el momento
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(NetworkIdle(self.network_idle))
+        except TimeoutException:
+            if self.DEBUG:
+                logger.info(f'La red no quedo inactiva luego de [{timeout}] segundos, se usa el contenido actual.')
+
     ############################################################################
     # Gestión del contenido HTML
     ############################################################################
@@ -249,13 +492,8 @@ class Driver:
             # Abro la URL y actualizo su contenido HTML
             self.drivers[driver_key].get(url)
             
-            # Establezco las condiciones
-            if element_selector:
-                WebDriverWait(self.drivers[driver_key], timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, element_selector))
-                )
-            elif timeout:
-                WebDriverWait(self.drivers[driver_key], timeout)
+            # Espero a que la pagina este lista
+            self._wait_until_ready(self.drivers[driver_key], element_selector, timeout)
             
             # Actualizo y guardo el contenido HTML
             self._update_html_content(driver_key)
@@ -274,18 +512,21 @@ class Driver:
             logger.error(f"Error desconocido al cargar la URL [{url}]. Error: {e}.")
             self.close_driver(driver_key)
 
-    def open_multiple_urls(self, urls, timeout=None, element_selector=None, browser=None):
+    def open_multiple_urls(self, urls, timeout=None, element_selector=None, browser=None, callback=None):
         """
-        Abre múltiples URLs en diferentes hilos.
+        Abre múltiples URLs en paralelo usando un pool de navegadores.
+
+        Se levantan hasta DRIVER_MAX_CONCURRENCE navegadores que toman las URLs
+        de una cola de trabajo. Los navegadores quedan abiertos entre llamadas
+        y se reinician luego de DRIVER_RECYCLE_PAGES paginas o si fallan.
 
         Args:
             urls (list): Lista de URLs a cargar.
-            timeout (int, optional): Tiempo en segundos que se espera antes de cerrar el navegador.
-            element_selector (str, optional): Selector del elemento HTML que se espera antes de cerrar el navegador.
+            timeout (int, optional): Tiempo máximo de espera del elemento en segundos.
+            element_selector (str, optional): Selector del elemento HTML que se espera antes de guardar el HTML.
+            callback (callable, optional): Funcion que recibe (url, html) cada vez
+                que se completa una pagina. Se llama desde los hilos del pool.
         """
-        # semaphore = threading.Semaphore(self.max_concurrent)
-        # threads = []
-        
         # Valores por defecto
         browser = browser or self.default_browser
         timeout = timeout or self.timeout
@@ -295,48 +536,139 @@ class Driver:
         if not isinstance(urls, list):
             urls = [urls]
         
-        # NOTA: Este ciclo for anda bien pero no ejecuta nada en paralelo.
-        # La espera del timeout frena la ejecucion del sistema directamente.
+        # Armo la cola de trabajo
+        url_queue = queue.Queue()
         for url in urls:
-            while len(self.drivers) >= self.max_concurrent:
-                logger.debug("Todos los drivers estan ocupados")
-                time.sleep(1)
-            
-            driver_key = f"driver_{str(time.time()).replace('.','')}"  # Usando un identificador único basado en el tiempo
-            
-            self.open_url(
-                driver_key=driver_key, url=url, timeout=timeout,
-                element_selector=element_selector, browser=browser
-            )
+            url_queue.put(url)
+        
+        # Cada hilo maneja su propio navegador del pool
+        n_workers = min(self.max_concurrent, len(urls))
+        args = (url_queue, timeout, element_selector, browser, callback)
+        if n_workers <= 1:
+            self._pool_worker('pool_0', *args)
+            return
+        
+        threads = []
+        for idx in range(n_workers):
+            thread = threading.Thread(target=self._pool_worker, args=(f'pool_{idx}', *args), daemon=True)
+            threads.append(thread)
+            thread.start()
+
+        for thread in threads:
+            thread.join()
 
-        # # Abro cada URL
-        # for i, url in enumerate(urls):
-        #     args = (url, semaphore, timeout, element_selector, browser)
-        #     thread = threading.Thread(target=self._open_url_with_semaphore, args=args)
-        #     threads.append(thread)
-        #     thread.start()
+    def iter_multiple_urls(self, urls, timeout=None, element_selector=None, browser=None):
+        """
+        Abre múltiples URLs con el pool de navegadores y devuelve el contenido
+        de cada pagina a medida que se completa, para poder procesarla
+        mientras se cargan las siguientes.
 
-        # for thread in threads:
-        #     thread.join()
+        Las URLs que fallan no se devuelven.
 
-    def _open_url_with_semaphore(self, url, semaphore, timeout=None, element_selector=None, browser='chrome'):
+        Yields:
+            tuple: (url, html) con la URL tal como se pidio y su codigo HTML.
         """
-        Función interna para abrir una URL con un semáforo para controlar el número máximo de páginas abiertas simultáneamente.
+        results = queue.Queue()
+        done = object()
+        
+        def run():
+            try:
+                self.open_multiple_urls(urls, timeout, element_selector, browser, callback=lambda url, html: results.put((url, html)))
+            finally:
+                results.put(done)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        while True:
+            item = results.get()
+            if item is done:
+                break
+            yield item
+        thread.join()
 
-        Args:
-            driver_key (str): Clave para identificar la instancia del driver.
-            url (str): La URL de la página web a cargar.
-            semaphore (threading.Semaphore): Semáforo para controlar el acceso concurrente.
-            timeout (int, optional): Tiempo en segundos que se espera antes de cerrar el navegador.
-            element_selector (str, optional): Selector del elemento HTML que se espera antes de cerrar el navegador.
+    def _get_pool_driver(self, driver_key, browser):
         """
-        with semaphore:
-            driver_key = f"driver_{threading.get_ident()}"
-            self.open_url(
-                driver_key=driver_key, url=url, timeout=timeout,
-                element_selector=element_selector, browser=browser
-            )
+        Devuelve el navegador del pool asociado a la clave, creandolo si no
+        existe y reiniciandolo si ya abrio DRIVER_RECYCLE_PAGES paginas.
+        """
+        if driver_key in self.drivers and self.page_counts.get(driver_key, 0) >= self.recycle_pages:
+            if self.DEBUG:
+                logger.info(f'Se reinicia el driver [{driver_key}] luego de {self.page_counts[driver_key]} paginas.')
             self.close_driver(driver_key)
+        
+        if self.drivers.get(driver_key) is None:
+            self.drivers[driver_key] = self.set_driver(browser)
+            self.page_counts[driver_key] = 0
+        return self.drivers[driver_key]
+
+    def _pool_worker(self, driver_key, url_queue, timeout=None, element_selector=None, browser=None, callback=None):
+        """
+        Toma URLs de la cola hasta vaciarla y las abre con un navegador del pool.
+
+        Args:
+            driver_key (str): Clave del navegador del pool que usa este hilo.
+            url_queue (queue.Queue): Cola de URLs pendientes.
+            timeout (int, optional): Tiempo máximo de espera del elemento en segundos.
+            element_selector (str, optional): Selector del elemento HTML que se espera antes de guardar el HTML.
+            callback (callable, optional): Funcion que recibe (url, html) de cada pagina completada.
+        """
+        while True:
+            try:
+                requested_url = url_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            try:
+                url = self._normalize_url(requested_url)
+            except ValueError as ve:
+                logger.error(f"URL inválida [{requested_url}]. Error: {ve}")
+                continue
+            
+            for attempt in range(self.retries + 1):
+                driver = self._get_pool_driver(driver_key, browser)
+                if driver is None:
+                    logger.error(f"El driver [{driver_key}] no está inicializado. No se puede obtener la URL [{url}].")
+                    self.drivers.pop(driver_key, None)
+                    break
+                
+                try:
+                    logger.info(f'Se va a abrir la URL [{url}] en el driver [{driver_key}]')
+                    html = self._load_page(driver_key, url, element_selector, timeout)
+                except TimeoutException:
+                    logger.error(f"Elemento HTML [{element_selector}] no encontrado en la URL [{url}] luego de [{timeout}] segundos.")
+                    break
+                except Exception as e:
+                    # Si el navegador fallo lo reinicio y vuelvo a intentar
+                    logger.error(f"Error al cargar la URL [{url}] en el driver [{driver_key}] (intento {attempt + 1}). Error: {e}.")
+                    self.close_driver(driver_key)
+                    continue
+                
+                # Entrego la pagina a quien la pidio
+                if callback is not None:
+                    try:
+                        callback(requested_url, html)
+                    except Exception as e:
+                        logger.error(f"Error al procesar el contenido de la URL [{url}]. Error: {e}.")
+                break
+
+    def _load_page(self, driver_key, url, element_selector=None, timeout=None):
+        """
+        Carga una URL en un navegador abierto y devuelve su contenido HTML.
+        Si DRIVER_SAVE_HTML esta activo tambien guarda una copia en disco.
+        Las excepciones de Selenium se propagan.
+        """
+        driver = self.drivers[driver_key]
+        driver.get(url)
+        self.page_counts[driver_key] = self.page_counts.get(driver_key, 0) + 1
+        
+        # Espero a que la pagina este lista
+        self._wait_until_ready(driver, element_selector, timeout)
+        
+        # Actualizo y guardo el contenido HTML
+        self._update_html_content(driver_key)
+        if self.save_html:
+            self.save_html_to_file(driver_key, filename=self.generate_filename(url))
+        return self.html_contents.get(driver_key, '')
 
     def open_url_and_wait(self, url, driver_key='0', timeout=10, browser=None):
         """
@@ -369,8 +701,8 @@ class Driver:
             # Abro la URL y actualizo su contenido HTML
             self.drivers[driver_key].get(url)
             
-            # Espero la cantidad de tiempo que el usuario pide
-            WebDriverWait(self.drivers[driver_key], timeout)
+            # Espero a que la pagina este lista
+            self._wait_until_ready(self.drivers[driver_key], timeout=timeout)
             
             # Actualizar y guardo el contenido HTML
             self._update_html_content(driver_key)
@@ -451,6 +783,30 @@ class Driver:
 
         return filepath
 
+################################################################################
+# Condiciones de espera
+################################################################################
+class NetworkIdle:
+    """
+    Condicion para WebDriverWait que se cumple cuando el documento termino de
+    parsearse y no se pidieron recursos nuevos durante idle_time segundos.
+    """
+    def __init__(self, idle_time=0.5):
+        self.idle_time = idle_time
+        self.last_count = None
+        self.last_change = time.time()
+
+    def __call__(self, driver):
+        state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.time()
+        if count != self.last_count:
+            self.last_count = count
+            self.last_change = now
+            return False
+        return state != 'loading' and now - self.last_change >= self.idle_time
+
 ################################################################################
 # Funciones de checkeo para el driver (FIXME: CODIGO QUE NO ESTOY USANDO)
 ################################################################################
@@ -499,18 +855,30 @@ def ajax_complete(driver):
 # Test principal del programa
 ################################################################################
 if __name__ == "__main__":
+    import argparse
+    
+    # Configuración del parser de argumentos
+    parser = argparse.ArgumentParser(description='Driver de navegadores')
+    parser.add_argument('--refresh_drivers', type=str, nargs='*', help='Descargar y fijar los drivers de los navegadores indicados')
+    args = parser.parse_args()
+    
     set_environment('settings.json')
     
     # Creo el objeto de tipo driver
     driver_manager = Driver()
-    urls = [
-            "https://www.google.com",
-            "https://www.youtube.com",
-            "https://www.facebook.com",
-            "https://www.similarweb.com/website/google.com/#overview",
-            "https://www.similarweb.com/website/youtube.com/#overview"
-        ]
-    driver_manager.open_multiple_urls(urls, element_selector='.app-section__content')
+    
+    # Actualizo los drivers fijados
+    if args.refresh_drivers is not None:
+        driver_manager.resolve_drivers(args.refresh_drivers)
+    else:
+        urls = [
+                "https://www.google.com",
+                "https://www.youtube.com",
+                "https://www.facebook.com",
+                "https://www.similarweb.com/website/google.com/#overview",
+                "https://www.similarweb.com/website/youtube.com/#overview"
+            ]
+        driver_manager.open_multiple_urls(urls, element_selector='.app-section__content')
     
     # # Armo una lista de webs a visitar
     # url_list =[
@@ -42,7 +42,8 @@ def load_json(filename='', verbose=DEFAULT_ENVIRONMENT_VERBOSE):
             datos_json = json.load(archivo)
             
             # Crear un diccionario con las variables de entorno a partir del JSON
-            entorno = {clave: str(valor) for clave, valor in datos_json.items()}
+            # Las listas y diccionarios se guardan como JSON para que getenv() los pueda leer
+            entorno = {clave: json.dumps(valor) if isinstance(valor, (dict, list)) else str(valor) for clave, valor in datos_json.items()}
             os.environ.update(entorno)  # Actualizar las variables de entorno
             
             # Imprimir mensajes informativos si verbose es True
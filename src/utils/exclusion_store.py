@@ -0,0 +1,202 @@
+# Imports estándar de Python
+import os
+import threading
+from contextlib import contextmanager
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Imports locales
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+@contextmanager
+def file_lock(file_path):
+    """
+    Bloqueo exclusivo entre procesos asociado a un archivo, usando un
+    archivo '.lock' al lado del original.
+    """
+    lock_path = file_path + '.lock'
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+class ExclusionStore:
+    """
+    Almacen de los IDs y tematicas excluidos (archivos excluded/*.dat).
+
+    Cada proceso guarda en memoria el conjunto de valores de cada archivo y
+    solo vuelve a leerlo si cambio: si el archivo crecio se leen unicamente
+    las lineas nuevas, y si fue reescrito se lee completo. Los valores nuevos
+    se agregan al final del archivo y cada tanto se compacta (se eliminan
+    repetidos y se ordena). Las escrituras se protegen con un bloqueo de
+    archivo para que varios trabajadores del pool puedan agregar a la vez.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    COMPACT_MIN_LINES = 100 # No se compactan archivos mas chicos que esto
+    COMPACT_RATIO = 2 # Se compacta si hay el doble de lineas que de valores
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.entries = {} # {ruta: {'ino', 'offset', 'lines', 'values'}}
+            self.lock = threading.Lock()
+            self.initialized = True
+
+    ############################################################################
+    # Lectura
+    ############################################################################
+    def _refresh(self, file_path):
+        """
+        Actualiza la entrada en memoria de un archivo si este cambio.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self.entries[file_path] = {'ino': None, 'offset': 0, 'lines': 0, 'values': set()}
+            return self.entries[file_path]
+
+        entry = self.entries.get(file_path)
+        if entry is not None and entry['ino'] == stat.st_ino and entry['offset'] == stat.st_size:
+            return entry
+
+        # Si el archivo es el mismo y solo crecio, leo unicamente lo agregado
+        if entry is None or entry['ino'] != stat.st_ino or stat.st_size < entry['offset']:
+            entry = {'ino': stat.st_ino, 'offset': 0, 'lines': 0, 'values': set()}
+
+        with open(file_path, 'rb') as file:
+            file.seek(entry['offset'])
+            data = file.read()
+
+        # Una linea sin terminar puede estar escribiendose, la leo la proxima vez
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].decode('utf-8').splitlines():
+            line = line.strip()
+            if line:
+                entry['values'].add(line)
+                entry['lines'] += 1
+        entry['offset'] += end
+        self.entries[file_path] = entry
+
+        if self.DEBUG:
+            logger.info(f"Se leyo el archivo de excluidos [{file_path}] ({len(entry['values'])} valores).")
+        return entry
+
+    def get(self, file_path):
+        """
+        Devuelve el conjunto de valores excluidos de un archivo.
+
+        Returns:
+            frozenset: Valores excluidos.
+        """
+        with self.lock:
+            return frozenset(self._refresh(file_path)['values'])
+
+    ############################################################################
+    # Escritura
+    ############################################################################
+    def _rewrite(self, file_path, values):
+        """
+        Reescribe el archivo con los valores ordenados y sin repetidos.
+        Se llama con el bloqueo de archivo tomado.
+        """
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            for value in sorted(values):
+                file.write(value + '\n')
+        os.replace(tmp_path, file_path)
+        self.entries.pop(file_path, None)
+
+    def add(self, file_path, values):
+        """
+        Agrega valores al final del archivo, salvo los que ya estaban.
+        """
+        folder = os.path.dirname(file_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with self.lock, file_lock(file_path):
+            entry = self._refresh(file_path)
+            new_values = [x for x in dict.fromkeys(values) if x not in entry['values']]
+            if new_values:
+                with open(file_path, 'a', encoding='utf-8') as file:
+                    file.write(''.join(x + '\n' for x in new_values))
+                entry = self._refresh(file_path)
+
+            # Compacto el archivo si acumulo muchas lineas repetidas
+            if entry['lines'] > self.COMPACT_MIN_LINES and entry['lines'] > self.COMPACT_RATIO * len(entry['values']):
+                self._rewrite(file_path, entry['values'])
+
+    def remove(self, file_path, values):
+        """
+        Elimina valores del archivo.
+        """
+        if not os.path.exists(file_path):
+            raise ValueError(f"No existe el archivo: {file_path}")
+
+        with self.lock, file_lock(file_path):
+            entry = self._refresh(file_path)
+            self._rewrite(file_path, entry['values'] - set(values))
+
+def get_excluded_file_path(filename):
+    """Devuelve la ruta de un archivo de excluidos."""
+    return os.path.join(os.environ.get("SOFT_EXCLUDED", r'excluded/'), filename)
+
+def get_excluded_ids(category):
+    """
+    Devuelve el conjunto de IDs excluidos de una categoria.
+    """
+    return ExclusionStore().get(get_excluded_file_path(f"excluded_{category}_ids.dat"))
+
+def get_excluded_topics(platform):
+    """
+    Devuelve el conjunto de tematicas excluidas de una plataforma.
+    """
+    return ExclusionStore().get(get_excluded_file_path(f"excluded_topics_{platform}.dat"))
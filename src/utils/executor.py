@@ -0,0 +1,162 @@
+# Imports estándar de Python
+import os
+import atexit
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+from multiprocessing import cpu_count
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class ExecutorService:
+    """
+    Servicio central de ejecucion en paralelo compartido por todos los managers.
+
+    Los pools de trabajadores se crean recien cuando se usan por primera vez
+    y se reutilizan entre llamadas. Cada tipo de tarea puede usar un pool de
+    hilos ('thread') o de procesos ('process') segun EXECUTOR_BACKENDS.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_N_CORES = -1
+    DEFAULT_BACKEND = 'process'
+    DEFAULT_BACKENDS = {} # {tipo de tarea: 'thread' o 'process'}
+    BACKENDS = ['thread', 'process']
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma. Los pools no se heredan entre procesos.
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.n_workers = self.set_n_workers()
+            self.backends = getenv('EXECUTOR_BACKENDS', self.DEFAULT_BACKENDS)
+            self.executors = {}
+            self.initialized = True
+
+    def set_n_workers(self):
+        """
+        Obtiene el número de trabajadores a utilizar según la configuración.
+        """
+        max_n_cores = cpu_count()
+        n_cores = getenv('MP_N_CORES', self.DEFAULT_N_CORES)
+        if n_cores < 0 or n_cores > max_n_cores:
+            return max_n_cores
+        return n_cores
+
+    def get_backend(self, task_type):
+        """
+        Devuelve el tipo de pool ('thread' o 'process') para un tipo de tarea.
+        """
+        backend = self.DEFAULT_BACKEND
+        if isinstance(self.backends, dict):
+            backend = self.backends.get(task_type, self.DEFAULT_BACKEND)
+
+        if backend not in self.BACKENDS:
+            logger.warning(f'Tipo de pool [{backend}] no valido para la tarea [{task_type}], se usara [{self.DEFAULT_BACKEND}].')
+            backend = self.DEFAULT_BACKEND
+        return backend
+
+    def get_executor(self, backend):
+        """
+        Devuelve el pool del tipo pedido, creandolo si todavia no existe.
+        """
+        if backend not in self.executors:
+            if backend == 'thread':
+                self.executors[backend] = ThreadPoolExecutor(max_workers=self.n_workers)
+            else:
+                self.executors[backend] = ProcessPoolExecutor(max_workers=self.n_workers)
+
+            if self.DEBUG:
+                logger.info(f'Se creo el pool de tipo [{backend}] con {self.n_workers} trabajadores.')
+        return self.executors[backend]
+
+    ############################################################################
+    # Metodos de de uso
+    ############################################################################
+    def map(self, func, iterable, task_type=None):
+        """
+        Aplica una funcion a cada elemento usando el pool del tipo de tarea.
+
+        Args:
+            func (callable): Funcion a ejecutar. Para el pool de procesos debe poder serializarse.
+            iterable (iterable): Elementos a procesar.
+            task_type (str, optional): Tipo de tarea ('youtube', 'news', 'products', ...).
+
+        Returns:
+            list: Resultados en el mismo orden que los elementos de entrada.
+        """
+        executor = self.get_executor(self.get_backend(task_type))
+        return list(executor.map(func, iterable))
+
+    def imap_unordered(self, func, iterable, task_type=None):
+        """
+        Aplica una funcion a cada elemento y devuelve los resultados a medida
+        que terminan, sin esperar al resto ni respetar el orden de entrada.
+
+        Args:
+            func (callable): Funcion a ejecutar. Para el pool de procesos debe poder serializarse.
+            iterable (iterable): Elementos a procesar.
+            task_type (str, optional): Tipo de tarea ('youtube', 'news', 'products', ...).
+
+        Yields:
+            El resultado de cada elemento apenas esta disponible.
+        """
+        executor = self.get_executor(self.get_backend(task_type))
+        
+        # No guardo referencias a los futures para que cada resultado se
+        # libere de memoria una vez consumido
+        for future in as_completed([executor.submit(func, item) for item in iterable]):
+            yield future.result()
+
+    def shutdown(self):
+        """
+        Cierra todos los pools creados y espera a que terminen sus trabajadores.
+        """
+        for backend, executor in self.executors.items():
+            try:
+                executor.shutdown(wait=True)
+                if self.DEBUG:
+                    logger.info(f'Se cerro el pool de tipo [{backend}].')
+            except Exception as e:
+                logger.error(f'Error al cerrar el pool de tipo [{backend}]. Error: {e}')
+        self.executors = {}
+
+def shutdown_executor():
+    """
+    Cierra los pools del servicio de ejecucion si alguno fue creado en este proceso.
+    """
+    instance = ExecutorService._instance
+    if instance is not None and instance.pid == os.getpid():
+        instance.shutdown()
+
+# Me aseguro de no dejar procesos abiertos al salir
+atexit.register(shutdown_executor)
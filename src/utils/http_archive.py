@@ -0,0 +1,163 @@
+# Imports estándar de Python
+import os
+import json
+import time
+import hashlib
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+# Ninguno en este set
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+from src.utils.http_cache import build_response
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class HttpArchive:
+    """
+    Archivo de paginas HTTP para grabar y reproducir las solicitudes de los
+    scrapers sin conexion.
+
+    Con HTTP_ARCHIVE_MODE='record' cada respuesta obtenida por el cliente HTTP
+    se guarda en HTTP_ARCHIVE_PATH. Con 'replay' las respuestas se sirven
+    desde el archivo y nunca se consulta al servidor; una URL que no fue
+    grabada responde con un 404. Cada entrada se guarda en sus propios
+    archivos para que varios procesos puedan grabar a la vez.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_MODE = 'off' # 'off', 'record' o 'replay'
+    MODES = ['off', 'record', 'replay']
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.mode = getenv('HTTP_ARCHIVE_MODE', self.DEFAULT_MODE)
+            self.path = getenv('HTTP_ARCHIVE_PATH', self.get_default_path())
+
+            if self.mode not in self.MODES:
+                logger.warning(f'Modo de archivo HTTP [{self.mode}] no valido, se usara [{self.DEFAULT_MODE}].')
+                self.mode = self.DEFAULT_MODE
+            if self.mode != 'off':
+                os.makedirs(self.path, exist_ok=True)
+            self.initialized = True
+
+    def get_default_path(self):
+        """
+        Devuelve la ruta por defecto del archivo de paginas.
+        """
+        return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'bench', 'fixtures')
+
+    ############################################################################
+    # Lectura y escritura de entradas
+    ############################################################################
+    def get_filenames(self, url):
+        """
+        Devuelve las rutas de los datos y del contenido de la entrada de una URL.
+        """
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.path, key)
+        return base + '.json', base + '.body'
+
+    def has(self, url):
+        """Indica si la URL tiene una entrada grabada."""
+        return os.path.exists(self.get_filenames(url)[0])
+
+    def store(self, url, status_code, headers, content, encoding=None):
+        """
+        Guarda una respuesta en el archivo.
+        """
+        meta_filename, body_filename = self.get_filenames(url)
+        with open(body_filename, 'wb') as file:
+            file.write(content or b'')
+
+        # Los datos se escriben al final para no dejar entradas incompletas
+        meta = {
+            'url': url,
+            'status_code': status_code,
+            'headers': dict(headers or {}),
+            'encoding': encoding,
+            'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        with open(meta_filename, 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+    def load(self, url):
+        """
+        Devuelve la respuesta grabada para la URL o None si no existe.
+        """
+        meta_filename, body_filename = self.get_filenames(url)
+        if not os.path.exists(meta_filename):
+            return None
+        with open(meta_filename, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+        with open(body_filename, 'rb') as file:
+            content = file.read()
+        return build_response(meta['url'], meta['status_code'], meta['headers'], content, meta['encoding'])
+
+    ############################################################################
+    # Metodos de de uso
+    ############################################################################
+    def get(self, session, url, headers=None, timeout=None):
+        """
+        Realiza una solicitud GET grabandola o reproduciendola segun el modo.
+
+        Args:
+            session (requests.Session): Sesion con la que se consulta al servidor al grabar.
+            url (str): URL a consultar.
+            headers (dict, optional): Headers adicionales para esta solicitud.
+            timeout (int, optional): Tiempo máximo de espera en segundos.
+
+        Returns:
+            requests.Response: La respuesta del servidor o la grabada en el archivo.
+        """
+        if self.mode == 'replay':
+            response = self.load(url)
+            if response is None:
+                logger.warning(f'La URL [{url}] no esta grabada en el archivo HTTP.')
+                return build_response(url, 404, {}, b'')
+            return response
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        try:
+            self.store(url, response.status_code, response.headers, response.content, response.encoding)
+            if self.DEBUG:
+                logger.info(f'Se grabo la respuesta de la URL [{url}].')
+        except Exception as e:
+            logger.error(f'Error al grabar la respuesta de la URL [{url}]. Error: {e}')
+        return response
+
+def get_http_archive():
+    """
+    Devuelve el archivo HTTP del proceso o None si no se esta grabando ni reproduciendo.
+    """
+    archive = HttpArchive()
+    return archive if archive.mode != 'off' else None
@@ -0,0 +1,327 @@
+# Imports estándar de Python
+import os
+import time
+import json
+import hashlib
+import sqlite3
+import threading
+from fnmatch import fnmatchcase
+from urllib.parse import urlparse
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+def build_response(url, status_code, headers, content, encoding=None):
+    """
+    Arma un objeto requests.Response con los datos de una respuesta guardada.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = encoding
+    response._content = content
+    return response
+
+class HttpCache:
+    """
+    Cache en disco de las respuestas HTTP, guardada en una base SQLite.
+
+    Cada entrada se identifica por la URL y los headers de la solicitud. Las
+    respuestas se reutilizan sin consultar al servidor mientras no supere el
+    TTL del dominio (HTTP_CACHE_DOMAIN_TTL). Una vez vencidas, si el servidor
+    informo ETag o Last-Modified, se revalidan con una solicitud condicional
+    y una respuesta 304 reutiliza el contenido guardado. Las URLs con TTL 0
+    no pasan por la cache.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_ENABLE = False
+    DEFAULT_TTL = 0 # Segundos. Con 0 las respuestas no se guardan
+    DEFAULT_DOMAIN_TTL = {} # {dominio o dominio/ruta: segundos}, incluye los subdominios
+    DEFAULT_MAX_AGE = 7 * 24 * 3600 # Antigüedad maxima de una entrada en segundos
+    DEFAULT_FILENAME = 'http_cache.db'
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma. Las conexiones SQLite no se
+    # comparten entre procesos.
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self, path=None):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.enable = getenv('HTTP_CACHE_ENABLE', self.DEFAULT_ENABLE)
+            self.ttl = getenv('HTTP_CACHE_TTL', self.DEFAULT_TTL)
+            self.domain_ttl = getenv('HTTP_CACHE_DOMAIN_TTL', self.DEFAULT_DOMAIN_TTL)
+            self.max_age = getenv('HTTP_CACHE_MAX_AGE', self.DEFAULT_MAX_AGE)
+            self.path = path or self.get_default_path()
+            self.lock = threading.Lock()
+            self.conn = None
+
+            if self.enable:
+                self.connect()
+            self.initialized = True
+
+    def get_default_path(self):
+        """
+        Devuelve la ruta por defecto del archivo de cache.
+        """
+        return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'cache', self.DEFAULT_FILENAME)
+
+    def connect(self):
+        """
+        Abre la base de la cache, crea la tabla si no existe y elimina las
+        entradas demasiado antiguas.
+        """
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+
+            # Varios procesos pueden escribir a la vez, por eso uso WAL
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode = WAL')
+            self.conn.execute('PRAGMA synchronous = NORMAL')
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS HTTP_CACHE (
+                    CACHE_KEY TEXT PRIMARY KEY,
+                    URL TEXT,
+                    STATUS_CODE INTEGER,
+                    HEADERS TEXT,
+                    CONTENT BLOB,
+                    ENCODING TEXT,
+                    ETAG TEXT,
+                    LAST_MODIFIED TEXT,
+                    STORED_AT REAL
+                )
+            """)
+            self.conn.execute('DELETE FROM HTTP_CACHE WHERE STORED_AT < ?', (time.time() - self.max_age,))
+            self.conn.commit()
+
+            if self.DEBUG:
+                logger.info(f'Se abrio la cache HTTP en [{self.path}].')
+        except Exception as e:
+            logger.error(f'Error al abrir la cache HTTP en [{self.path}]. Se deshabilita la cache. Error: {e}')
+            self.conn = None
+            self.enable = False
+
+    ############################################################################
+    # Claves y tiempos de vida
+    ############################################################################
+    def make_key(self, url, headers=None):
+        """
+        Genera la clave de una entrada a partir de la URL y los headers de la solicitud.
+        """
+        headers = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+        raw = url + '\n' + json.dumps(headers, sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get_ttl(self, url):
+        """
+        Devuelve el tiempo de vida en segundos para la URL segun su dominio.
+
+        Las claves de HTTP_CACHE_DOMAIN_TTL pueden ser un dominio, que incluye
+        a todos sus subdominios y rutas ('ebay.com'), o un dominio
+        seguido de un patron de ruta ('youtube.com/channel/*/shorts'). Si
+        varias claves coinciden se usa la mas especifica (la mas larga).
+        """
+        if not isinstance(self.domain_ttl, dict):
+            return self.ttl
+
+        parsed_url = urlparse(url)
+        host = parsed_url.netloc.lower()
+        path = parsed_url.path or '/'
+
+        best_key = None
+        for key in self.domain_ttl:
+            domain, _, pattern = key.partition('/')
+            if host != domain and not host.endswith('.' + domain):
+                continue
+            if pattern and not fnmatchcase(path, '/' + pattern):
+                continue
+            if best_key is None or len(key) > len(best_key):
+                best_key = key
+
+        return self.domain_ttl[best_key] if best_key is not None else self.ttl
+
+    ############################################################################
+    # Lectura y escritura de entradas
+    ############################################################################
+    def load(self, key):
+        """
+        Devuelve la entrada guardada para la clave o None si no existe.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT URL, STATUS_CODE, HEADERS, CONTENT, ENCODING, ETAG, LAST_MODIFIED, STORED_AT FROM HTTP_CACHE WHERE CACHE_KEY = ?',
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ['url', 'status_code', 'headers', 'content', 'encoding', 'etag', 'last_modified', 'stored_at']
+        return dict(zip(keys, row))
+
+    def store(self, key, url, response):
+        """
+        Guarda una respuesta en la cache.
+        """
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO HTTP_CACHE VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.content,
+                    response.encoding,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    time.time(),
+                )
+            )
+            self.conn.commit()
+
+    def touch(self, key):
+        """
+        Renueva el momento de guardado de una entrada revalidada por el servidor.
+        """
+        with self.lock:
+            self.conn.execute('UPDATE HTTP_CACHE SET STORED_AT = ? WHERE CACHE_KEY = ?', (time.time(), key))
+            self.conn.commit()
+
+    def clear(self):
+        """
+        Elimina todas las entradas de la cache.
+        """
+        if self.conn is None:
+            return
+        with self.lock:
+            self.conn.execute('DELETE FROM HTTP_CACHE')
+            self.conn.commit()
+
+    def build_response(self, entry):
+        """
+        Reconstruye un objeto requests.Response a partir de una entrada guardada.
+        """
+        return build_response(
+            url=entry['url'],
+            status_code=entry['status_code'],
+            headers=json.loads(entry['headers']),
+            content=entry['content'],
+            encoding=entry['encoding'],
+        )
+
+    def is_cacheable(self, response, ttl):
+        """
+        Indica si vale la pena guardar la respuesta: tiene que ser exitosa y
+        la URL tiene que tener un TTL.
+        """
+        if ttl <= 0 or response.status_code != 200:
+            return False
+        return 'no-store' not in response.headers.get('Cache-Control', '')
+
+    ############################################################################
+    # Metodos de de uso
+    ############################################################################
+    def get(self, session, url, headers=None, timeout=None):
+        """
+        Realiza una solicitud GET pasando por la cache.
+
+        Args:
+            session (requests.Session): Sesion con la que se consulta al servidor.
+            url (str): URL a consultar.
+            headers (dict, optional): Headers adicionales para esta solicitud.
+            timeout (int, optional): Tiempo máximo de espera en segundos.
+
+        Returns:
+            requests.Response: La respuesta del servidor o la reconstruida desde la cache.
+        """
+        ttl = self.get_ttl(url)
+
+        # Sin TTL la respuesta siempre se pide al servidor y no se guarda
+        if ttl <= 0:
+            return session.get(url, headers=headers, timeout=timeout)
+
+        key = self.make_key(url, headers)
+        try:
+            entry = self.load(key)
+        except Exception as e:
+            logger.error(f'Error al leer la cache HTTP para la URL [{url}]. Error: {e}')
+            entry = None
+
+        # Entrada vigente: no consulto al servidor
+        if entry and time.time() - entry['stored_at'] < ttl:
+            if self.DEBUG:
+                logger.info(f'Respuesta obtenida desde la cache para la URL [{url}].')
+            return self.build_response(entry)
+
+        # Entrada vencida: pido al servidor que la revalide
+        request_headers = dict(headers or {})
+        if entry:
+            if entry['etag']:
+                request_headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=request_headers or None, timeout=timeout)
+
+        try:
+            if entry and response.status_code == 304:
+                self.touch(key)
+                if self.DEBUG:
+                    logger.info(f'Respuesta revalidada desde la cache para la URL [{url}].')
+                return self.build_response(entry)
+
+            if self.is_cacheable(response, ttl):
+                self.store(key, url, response)
+        except Exception as e:
+            logger.error(f'Error al actualizar la cache HTTP para la URL [{url}]. Error: {e}')
+
+        return response
+
+    def close(self):
+        """Cierra la conexion con la base de la cache."""
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception as e:
+                logger.error(f'Error al cerrar la cache HTTP. Error: {e}')
+            self.conn = None
+
+def get_http_cache():
+    """
+    Devuelve la cache HTTP del proceso o None si esta deshabilitada.
+    """
+    cache = HttpCache()
+    return cache if cache.enable else None
@@ -0,0 +1,162 @@
+# Imports estándar de Python
+import os
+import time
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv, HEADER
+from src.utils.http_cache import get_http_cache
+from src.utils.http_archive import get_http_archive
+from src.utils.rate_limiter import RateLimiter
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Adaptador que pasa cada solicitud que sale a la red por el limitador de
+    solicitudes compartido entre procesos. Las respuestas servidas desde la
+    cache o el archivo de grabaciones no consumen tokens.
+    """
+    def send(self, request, **kwargs):
+        limiter = RateLimiter()
+        limiter.acquire(request.url)
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            limiter.report(request.url, None, time.perf_counter() - start)
+            raise
+        limiter.report(request.url, response.status_code, time.perf_counter() - start, response.headers.get('Retry-After'))
+        return response
+
+class HttpClient:
+    """
+    Cliente HTTP compartido por todo el proceso.
+
+    Mantiene una unica requests.Session por proceso para reutilizar las
+    conexiones TCP/TLS entre solicitudes. Cada worker de multiprocessing
+    crea su propia sesion la primera vez que la usa (las sesiones no se
+    comparten entre procesos).
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_POOL_CONNECTIONS = 10 # Cantidad de hosts con conexiones guardadas
+    DEFAULT_POOL_MAXSIZE = 10 # Conexiones por host
+    DEFAULT_HOST_MAX_CONNECTIONS = {} # {host: conexiones} para limitar hosts puntuales
+    DEFAULT_TIMEOUT = 10
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma. Si el proceso cambio (fork), creo
+    # una nueva para no compartir sockets entre procesos.
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.pool_connections = getenv('HTTP_POOL_CONNECTIONS', self.DEFAULT_POOL_CONNECTIONS)
+            self.pool_maxsize = getenv('HTTP_POOL_MAXSIZE', self.DEFAULT_POOL_MAXSIZE)
+            self.host_max_connections = getenv('HTTP_HOST_MAX_CONNECTIONS', self.DEFAULT_HOST_MAX_CONNECTIONS)
+            self.timeout = getenv('HTTP_TIMEOUT', self.DEFAULT_TIMEOUT)
+
+            self.session = self.create_session()
+            self.initialized = True
+
+            if self.DEBUG:
+                logger.info(f'Se creo la sesion HTTP para el proceso [{self.pid}].')
+
+    def create_session(self):
+        """
+        Crea la sesion HTTP con los adaptadores y headers por defecto.
+        """
+        session = requests.Session()
+
+        # Adaptador general. Con pool_block=True nunca se abren mas de
+        # pool_maxsize conexiones a un mismo host
+        adapter = RateLimitedAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # Adaptadores para los hosts con un limite propio de conexiones
+        if isinstance(self.host_max_connections, dict):
+            for host, max_connections in self.host_max_connections.items():
+                host_adapter = RateLimitedAdapter(pool_connections=1, pool_maxsize=int(max_connections), pool_block=True)
+                session.mount(f'https://{host}/', host_adapter)
+                session.mount(f'http://{host}/', host_adapter)
+
+        # ACCEPT_ENCODING incluye 'br' solo si la libreria Brotli (requirements.txt) esta instalada
+        session.headers.update({
+            'user-agent': HEADER,
+            'accept-encoding': ACCEPT_ENCODING,
+        })
+        return session
+
+    def get(self, url, headers=None, timeout=None, use_cache=True, **kwargs):
+        """
+        Realiza una solicitud GET usando la sesion compartida.
+
+        Args:
+            url (str): URL a consultar.
+            headers (dict, optional): Headers adicionales para esta solicitud.
+            timeout (int, optional): Tiempo máximo de espera en segundos.
+            use_cache (bool, optional): Si es False, no se usa la cache HTTP en disco.
+
+        Returns:
+            requests.Response: La respuesta de la solicitud.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+
+        # Al grabar o reproducir paginas para las pruebas de rendimiento no se usa la cache
+        archive = get_http_archive()
+        if archive is not None:
+            return archive.get(self.session, url, headers=headers, timeout=timeout)
+
+        # Las solicitudes con parametros extra (params, stream, ...) no pasan por la cache
+        cache = get_http_cache() if use_cache and not kwargs else None
+        if cache is not None:
+            return cache.get(self.session, url, headers=headers, timeout=timeout)
+        return self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    def close(self):
+        """Cierra las conexiones abiertas de la sesion."""
+        try:
+            self.session.close()
+        except Exception as e:
+            logger.error(f'Error al cerrar la sesion HTTP. Error: {e}')
+
+def http_get(url, headers=None, timeout=None, use_cache=True, **kwargs):
+    """
+    Realiza una solicitud GET usando el cliente HTTP compartido del proceso.
+    """
+    return HttpClient().get(url, headers=headers, timeout=timeout, use_cache=use_cache, **kwargs)
@@ -0,0 +1,306 @@
+# Imports estándar de Python
+import os
+import json
+import time
+import random
+import threading
+import email.utils
+from urllib.parse import urlsplit
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+# Ninguno en este set
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+from src.utils.exclusion_store import file_lock
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+# Codigos HTTP que indican que el servidor nos esta limitando
+THROTTLE_STATUS_CODES = [429, 503]
+
+def parse_retry_after(value):
+    """
+    Convierte el header Retry-After (segundos o fecha HTTP) a segundos.
+
+    Returns:
+        float: Segundos a esperar o None si el valor no es valido.
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except Exception:
+        return None
+
+def backoff_delay(attempt, base=1.0, max_delay=60.0):
+    """
+    Calcula la espera antes de un reintento con backoff exponencial y
+    jitter ("full jitter": un valor al azar entre 0 y base * 2^intento).
+
+    Args:
+        attempt (int): Numero de reintento (empezando en 1).
+        base (float): Espera base en segundos.
+        max_delay (float): Espera maxima en segundos.
+    """
+    return random.uniform(0, min(max_delay, base * 2 ** max(attempt - 1, 0)))
+
+class RateLimiter:
+    """
+    Limitador de solicitudes por host compartido entre todos los procesos.
+
+    Cada host configurado en RATE_LIMIT_HOSTS ({host: solicitudes por
+    segundo}, incluye los subdominios) tiene un token bucket cuyo estado se
+    guarda en un archivo protegido con un bloqueo, de forma que los
+    trabajadores del pool comparten el mismo limite. Cuando el servidor
+    responde 429 o 503 el host se bloquea durante lo que indique Retry-After
+    o, si no lo indica, con backoff exponencial y jitter.
+
+    Con RATE_LIMIT_ADAPTIVE el ritmo de cada host se ajusta solo: sube de a
+    poco mientras las respuestas son rapidas y sin errores, y baja a la mitad
+    ante un rechazo o un error de conexion.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_ENABLE = True
+    DEFAULT_HOSTS = {} # {host: solicitudes por segundo}
+    DEFAULT_BURST = 5 # Solicitudes que se pueden hacer seguidas
+    DEFAULT_BACKOFF_BASE = 1.0 # Segundos
+    DEFAULT_BACKOFF_MAX = 60.0 # Segundos
+    DEFAULT_ADAPTIVE = False
+    DEFAULT_TARGET_LATENCY = 2.0 # Segundos, por encima se deja de subir el ritmo
+    DEFAULT_STATE_TTL = 3600 # Segundos sin uso tras los que se reinicia un host
+    DEFAULT_FILENAME = 'rate_limiter.json'
+
+    # Limites del modo adaptativo, relativos al ritmo configurado
+    ADAPTIVE_MIN_FACTOR = 0.1
+    ADAPTIVE_MAX_FACTOR = 4.0
+    ADAPTIVE_STEP = 0.05
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self, path=None):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.enable = getenv('RATE_LIMIT_ENABLE', self.DEFAULT_ENABLE)
+            self.hosts = getenv('RATE_LIMIT_HOSTS', self.DEFAULT_HOSTS)
+            self.burst = getenv('RATE_LIMIT_BURST', self.DEFAULT_BURST)
+            self.backoff_base = getenv('RATE_LIMIT_BACKOFF_BASE', self.DEFAULT_BACKOFF_BASE)
+            self.backoff_max = getenv('RATE_LIMIT_BACKOFF_MAX', self.DEFAULT_BACKOFF_MAX)
+            self.adaptive = getenv('RATE_LIMIT_ADAPTIVE', self.DEFAULT_ADAPTIVE)
+            self.target_latency = getenv('RATE_LIMIT_TARGET_LATENCY', self.DEFAULT_TARGET_LATENCY)
+            self.path = path or self.get_default_path()
+            self.lock = threading.Lock()
+
+            # Comprobaciones de seguridad
+            if not isinstance(self.hosts, dict):
+                logger.warning(f'RATE_LIMIT_HOSTS debe ser un diccionario, no se limitara ningun host.')
+                self.hosts = {}
+            self.burst = max(self.burst, 1)
+            self.initialized = True
+
+    def get_default_path(self):
+        """
+        Devuelve la ruta por defecto del archivo de estado.
+        """
+        return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'cache', self.DEFAULT_FILENAME)
+
+    ############################################################################
+    # Estado compartido
+    ############################################################################
+    def get_host(self, url):
+        """
+        Devuelve el host configurado que corresponde a una URL, o None si el
+        host no esta limitado.
+        """
+        if not self.enable or not self.hosts:
+            return None
+
+        hostname = (urlsplit(url).hostname or '').lower()
+        for host in self.hosts:
+            if hostname == host or hostname.endswith('.' + host):
+                return host
+        return None
+
+    def load(self):
+        """
+        Lee el estado de todos los hosts. Se llama con el bloqueo tomado.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f'No se pudo leer el estado del limitador [{self.path}]. Error: {e}')
+            return {}
+
+    def save(self, state):
+        """
+        Guarda el estado de todos los hosts. Se llama con el bloqueo tomado.
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(tmp_path, self.path)
+
+    def update(self, host, func):
+        """
+        Aplica una funcion al estado de un host con el bloqueo tomado.
+
+        Args:
+            host (str): Host configurado.
+            func (callable): Recibe el estado del host y el momento actual,
+                             lo modifica y devuelve un resultado.
+
+        Returns:
+            El resultado de func.
+        """
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with self.lock, file_lock(self.path):
+            state = self.load()
+            now = time.time()
+            rate = float(self.hosts[host])
+
+            # Los hosts sin uso reciente empiezan de cero
+            entry = state.get(host)
+            if entry is None or now - entry.get('updated', 0) > self.DEFAULT_STATE_TTL:
+                entry = {'tokens': float(self.burst), 'updated': now, 'rate': rate, 'blocked_until': 0, 'failures': 0}
+
+            # Recargo los tokens segun el tiempo transcurrido
+            entry['tokens'] = min(float(self.burst), entry['tokens'] + (now - entry['updated']) * entry['rate'])
+            entry['updated'] = now
+
+            result = func(entry, now)
+            state[host] = entry
+            self.save(state)
+        return result
+
+    ############################################################################
+    # Uso
+    ############################################################################
+    def acquire(self, url):
+        """
+        Espera hasta que se pueda hacer una solicitud a la URL.
+
+        Returns:
+            float: Segundos que se espero.
+        """
+        host = self.get_host(url)
+        if host is None:
+            return 0.0
+
+        def take(entry, now):
+            if now < entry['blocked_until']:
+                return entry['blocked_until'] - now
+            if entry['tokens'] >= 1:
+                entry['tokens'] -= 1
+                return 0.0
+            return (1 - entry['tokens']) / max(entry['rate'], 1e-6)
+
+        waited = 0.0
+        while True:
+            try:
+                wait = self.update(host, take)
+            except Exception as e:
+                logger.error(f'Error en el limitador de solicitudes para [{host}]. Error: {e}')
+                return waited
+            if wait <= 0:
+                return waited
+            if self.DEBUG:
+                logger.info(f'Esperando {wait:.2f} s para hacer una solicitud a [{host}].')
+            time.sleep(wait)
+            waited += wait
+
+    def report(self, url, status_code=None, latency=None, retry_after=None):
+        """
+        Registra el resultado de una solicitud.
+
+        Args:
+            url (str): URL consultada.
+            status_code (int, optional): Codigo HTTP. None si hubo un error de conexion.
+            latency (float, optional): Duracion de la solicitud en segundos.
+            retry_after (str, optional): Valor del header Retry-After.
+        """
+        host = self.get_host(url)
+        if host is None:
+            return
+
+        base_rate = float(self.hosts[host])
+        min_rate = base_rate * self.ADAPTIVE_MIN_FACTOR
+        max_rate = base_rate * self.ADAPTIVE_MAX_FACTOR
+
+        def register(entry, now):
+            if status_code in THROTTLE_STATUS_CODES:
+                entry['failures'] += 1
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = backoff_delay(entry['failures'], self.backoff_base, self.backoff_max)
+                entry['blocked_until'] = max(entry['blocked_until'], now + delay)
+                if self.adaptive:
+                    entry['rate'] = max(min_rate, entry['rate'] / 2)
+                logger.warning(f"El host [{host}] respondio {status_code}, se pausan sus solicitudes {delay:.1f} s (ritmo {entry['rate']:.2f}/s).")
+            elif status_code is None:
+                if self.adaptive:
+                    entry['rate'] = max(min_rate, entry['rate'] / 2)
+            else:
+                entry['failures'] = 0
+                if self.adaptive:
+                    if latency is not None and latency > self.target_latency:
+                        entry['rate'] = max(min_rate, entry['rate'] * 0.9)
+                    else:
+                        entry['rate'] = min(max_rate, entry['rate'] + base_rate * self.ADAPTIVE_STEP)
+
+        try:
+            self.update(host, register)
+        except Exception as e:
+            logger.error(f'Error al registrar la respuesta de [{host}] en el limitador. Error: {e}')
+
+    def get_backoff(self, attempt, retry_after=None):
+        """
+        Devuelve la espera antes de reintentar una solicitud.
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.backoff_max)
+        return backoff_delay(attempt, self.backoff_base, self.backoff_max)
+
+def get_rate_limiter():
+    """
+    Devuelve el limitador del proceso o None si esta deshabilitado.
+    """
+    limiter = RateLimiter()
+    return limiter if limiter.enable else None
@@ -11,7 +11,7 @@ import time
 # sys.path.append(project_root)
 
 # Imports de terceros
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 import requests
 import re
 import random
@@ -20,6 +20,7 @@ import platform
 
 # Imports locales
 from src.logger.logger import Logger
+from src.utils.exclusion_store import ExclusionStore, get_excluded_file_path
 
 ################################################################################
 # Genero una instancia del Logger
@@ -30,8 +31,34 @@ logger = Logger(os.path.basename(__file__)).get_logger()
 HEADER = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36'
 SIMILARWEB_BASE_URL = 'https://www.similarweb.com/'
 DEFAULT_UTILS_VERBOSE = False
+DEFAULT_HTML_PARSER = 'html.parser'
 
-def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_UTILS_VERBOSE, debug=False, timeout=10, retry_attempts=3):
+# Parsers de BeautifulSoup que no se pudieron usar (para avisar una sola vez)
+MISSING_HTML_PARSERS = set()
+
+def make_soup(markup, parser=None):
+    """
+    Construye un objeto BeautifulSoup con el parser configurado.
+
+    Args:
+        markup (str or file): Contenido HTML a procesar.
+        parser (str, optional): Parser a usar ('html.parser', 'lxml', 'html5lib').
+            Si no se indica se usa el de la variable HTML_PARSER.
+
+    Returns:
+        BeautifulSoup: El arbol del documento. Si el parser pedido no esta
+        instalado se usa 'html.parser'.
+    """
+    parser = parser or getenv('HTML_PARSER', DEFAULT_HTML_PARSER)
+    if parser not in MISSING_HTML_PARSERS:
+        try:
+            return BeautifulSoup(markup, parser)
+        except FeatureNotFound:
+            MISSING_HTML_PARSERS.add(parser)
+            logger.warning(f'El parser HTML [{parser}] no esta instalado, se usara [{DEFAULT_HTML_PARSER}].')
+    return BeautifulSoup(markup, DEFAULT_HTML_PARSER)
+
+def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_UTILS_VERBOSE, debug=False, timeout=10, retry_attempts=3, parser=None):
     """
     Obtiene la respuesta HTML de una URL.
     Puede aceptar headers personalizados; si no se proporcionan, utiliza unos por defecto.
@@ -45,6 +72,7 @@ def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_U
         debug (bool, optional): Si es True, imprime la respuesta HTTP completa.
         timeout (int, optional): Tiempo máximo de espera para la solicitud HTTP en segundos.
         retry_attempts (int, optional): Número de intentos de reintentos en caso de fallo.
+        parser (str, optional): Parser de BeautifulSoup a usar cuando response_type es 'page'.
 
     Returns:
         BeautifulSoup object or str: Dependiendo de response_type, retorna un objeto BeautifulSoup o texto plano.
@@ -69,6 +97,10 @@ def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_U
     if not isinstance(retry_attempts, int) or retry_attempts < 0:
         raise ValueError("El número de intentos de reintentos debe ser un entero no negativo.")
 
+    # NOTA: Se importa aca porque http_client y rate_limiter dependen de este modulo
+    from src.utils.http_client import http_get
+    from src.utils.rate_limiter import RateLimiter, THROTTLE_STATUS_CODES
+
     # Definimos los headers por defecto
     if headers is None:
         headers = {
@@ -79,15 +111,13 @@ def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_U
     while attempts <= retry_attempts:
         try:
             # Realizamos una solicitud a la página web con timeout
-            response = requests.get(url, headers=headers, timeout=timeout)
+            # usando la sesion HTTP compartida del proceso
+            response = http_get(url, headers=headers, timeout=timeout)
 
             # Debug: Imprimimos la respuesta completa si debug es True
             if debug:
                 logger.debug(f'HTTP response: {response}')
 
-            # Analizamos el contenido HTML de la página web utilizando BeautifulSoup
-            page = BeautifulSoup(response.content, 'html.parser')
-
             # Verbose: Imprimimos información detallada si verbose es True
             if verbose:
                 msg  = f'URL [{url}], '
@@ -100,7 +130,17 @@ def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_U
                 if response_type == 'text':
                     return response.text
                 else:
-                    return page
+                    # Solo se construye el arbol HTML cuando se lo pide
+                    return make_soup(response.content, parser)
+            elif response.status_code in THROTTLE_STATUS_CODES and attempts < retry_attempts:
+                # El servidor nos esta limitando, reintento con backoff. Si el
+                # host esta en RATE_LIMIT_HOSTS la espera la hace el limitador
+                attempts += 1
+                logger.warning(f'URL [{url}], HTTP code [{response.status_code}], reintento {attempts} de {retry_attempts}.')
+                limiter = RateLimiter()
+                if limiter.get_host(url) is None:
+                    time.sleep(limiter.get_backoff(attempts, response.headers.get('Retry-After')))
+                continue
             else:
                 msg  = f'URL [{url}], '
                 msg += f'HTTP status [{response.ok}], '
@@ -116,7 +156,8 @@ def get_http_response(url, headers=None, response_type='page', verbose=DEFAULT_U
             # Incrementamos el contador de intentos y esperamos antes de reintentar
             attempts += 1
             if attempts <= retry_attempts:
-                time.sleep(1)  # Esperamos 1 segundo antes de realizar el siguiente intento
+                # Esperamos con backoff exponencial y jitter antes del siguiente intento
+                time.sleep(RateLimiter().get_backoff(attempts))
 
     # Si llegamos aquí, significa que todos los intentos de reintentos fallaron
     logger.error(f"No se pudo obtener la respuesta HTTP para la URL [{url}] después de {retry_attempts} intentos.")
@@ -756,28 +797,41 @@ def get_param(target='', default=None, args_pos=0, *args, **kwargs):
         # Capturar cualquier excepción y elevarla con un mensaje descriptivo
         raise ValueError(f"Error al obtener el parámetro: {str(e)}")
 
-def is_video_online(video_id):
+# Codigos HTTP del endpoint oEmbed que indican que el video no esta disponible
+OEMBED_OFFLINE_STATUS_CODES = [401, 403, 404]
+
+def get_video_status(video_id):
     """
-    Verifica si un video de YouTube está disponible usando el endpoint oEmbed.
+    Consulta el endpoint oEmbed para saber si un video de YouTube esta disponible.
 
     :param video_id: str: ID del video de YouTube
-    :return: bool: True si el video está disponible, False en caso contrario
+    :return: bool o None: True si el video esta disponible, False si no existe
+             o es privado (401, 403 o 404) y None si no se pudo verificar
+             (limite de solicitudes, error del servidor, etc.)
     """
     # Construir la URL usando el video ID proporcionado
     url = f'https://www.youtube.com/oembed?url=http://www.youtube.com/watch?v={video_id}&format=json'
     
+    # NOTA: Se importa aca porque http_client depende de este modulo
+    from src.utils.http_client import http_get
+
     # Realizar una solicitud GET a la URL
-    response = requests.get(url)
+    response = http_get(url)
 
-    # Si la respuesta tiene un código de estado 200, el video está disponible
     if response.status_code == 200:
         return True
-    # Si la respuesta tiene un código de estado 403, el video no está disponible
-    elif response.status_code == 403:
-        return False
-    else:
-        # Puedes manejar otros códigos de estado si es necesario
+    elif response.status_code in OEMBED_OFFLINE_STATUS_CODES:
         return False
+    return None
+
+def is_video_online(video_id):
+    """
+    Verifica si un video de YouTube está disponible usando el endpoint oEmbed.
+
+    :param video_id: str: ID del video de YouTube
+    :return: bool: True si el video está disponible, False en caso contrario
+    """
+    return get_video_status(video_id) is True
 
 def fetch_excluded_topics(platform, method, topics=None):
     """
@@ -804,44 +858,23 @@ def fetch_excluded_topics(platform, method, topics=None):
         if len(topics) <= 0:
             return
             
-    file_path = os.path.join(os.environ.get("SOFT_EXCLUDED", r'excluded/'), f"excluded_topics_{platform}.dat")
+    file_path = get_excluded_file_path(f"excluded_topics_{platform}.dat")
     
     if method == 'get':
-        # Leer y devolver la lista de temáticas excluidas desde el archivo
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                current_topics = [line.strip() for line in file]
-            unique_topics = sorted(set(current_topics))
-            return unique_topics
-        else:
-            return []
+        # Devolver la lista de temáticas excluidas ordenadas alfabéticamente
+        return sorted(ExclusionStore().get(file_path))
     
     elif method == 'add':
-        # Agregar una nueva temática excluida al archivo
+        # Agregar las nuevas temáticas excluidas al final del archivo
         if topics:
-            current_topics = []
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as file:
-                    current_topics = [line.strip() for line in file]
-            combined_topics = sorted(set(current_topics + topics))
-            with open(file_path, 'w') as file:
-                for topic in combined_topics:
-                    file.write(topic + '\n')
+            ExclusionStore().add(file_path, topics)
         else:
             raise ValueError("Se debe proporcionar una temática para el método 'add'")
     
     elif method == 'remove':
-        # Eliminar temática(s) excluida(s) del archivo y ordenarlas
+        # Eliminar temática(s) excluida(s) del archivo
         if topics:
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as file:
-                    current_topics = [line.strip() for line in file]
-                updated_topics = sorted([topic for topic in current_topics if topic not in topics])
-                with open(file_path, 'w') as file:
-                    for topic in updated_topics:
-                        file.write(topic + '\n')
-            else:
-                raise ValueError(f"No existe el archivo: {file_path}")
+            ExclusionStore().remove(file_path, topics)
         else:
             raise ValueError("Se debe proporcionar una temática para el método 'remove'")
     
@@ -873,44 +906,23 @@ def fetch_excluded_ids(category, method, ids=None):
         if len(ids) <= 0:
             return
             
-    file_path = os.path.join(os.environ.get("SOFT_EXCLUDED", r'excluded/'), f"excluded_{category}_ids.dat")
+    file_path = get_excluded_file_path(f"excluded_{category}_ids.dat")
     
     if method == 'get':
-        # Leer y devolver la lista de IDs excluidos desde el archivo, ordenados alfabéticamente
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                current_ids = [line.strip() for line in file]
-            unique_ids = sorted(set(current_ids))
-            return unique_ids
-        else:
-            return []
+        # Devolver la lista de IDs excluidos ordenados alfabéticamente
+        return sorted(ExclusionStore().get(file_path))
     
     elif method == 'add':
-        # Agregar nuevo(s) ID(s) excluido(s) al archivo y ordenarlos
+        # Agregar los nuevos IDs excluidos al final del archivo
         if ids:
-            current_ids = []
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as file:
-                    current_ids = [line.strip() for line in file]
-            combined_ids = sorted(set(current_ids + ids))
-            with open(file_path, 'w') as file:
-                for id in combined_ids:
-                    file.write(id + '\n')
+            ExclusionStore().add(file_path, ids)
         else:
             raise ValueError("Se debe proporcionar un ID o lista de IDs para el método 'add'")
     
     elif method == 'remove':
-        # Eliminar ID(s) excluido(s) del archivo y ordenarlos
+        # Eliminar ID(s) excluido(s) del archivo
         if ids:
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as file:
-                    current_ids = [line.strip() for line in file]
-                updated_ids = sorted([id for id in current_ids if id not in ids])
-                with open(file_path, 'w') as file:
-                    for id in updated_ids:
-                        file.write(id + '\n')
-            else:
-                raise ValueError(f"No existe el archivo: {file_path}")
+            ExclusionStore().remove(file_path, ids)
         else:
             raise ValueError("Se debe proporcionar un ID o lista de IDs para el método 'remove'")
     
@@ -962,4 +974,4 @@ def cprint(msg, logfile=None):
     with open(filename, "a", encoding='utf-8') as console_log_file:
         print(msg)
         console_log_file.write(date + ': ' + msg + "\n")
-        console_log_file.close()
\ No newline at end of file
+        console_log_file.close()
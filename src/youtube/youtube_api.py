@@ -1,5 +1,6 @@
 # Imports estándar de Python
 import os
+import math
 from datetime import datetime
 import json
 # import sys
@@ -16,6 +17,7 @@ import pandas as pd
 
 # Imports locales
 from src.utils.utils import transform_duration_format, safe_get_from_json, cprint, getenv
+from src.youtube.youtube_quota import QuotaLedger
 from src.logger.logger import Logger
 
 ################################################################################
@@ -37,6 +39,9 @@ class YoutubeAPI:
     DEFAULT_PAGE_RESULTS = 50
     DEBUG = False
 
+    # Cantidad maxima de IDs que admite la API en una sola solicitud
+    MAX_IDS_PER_REQUEST = 50
+
     # Lista de códigos de error considerados críticos
     CRITICAL_ERRORS = [400, 403, 500]
 
@@ -147,9 +152,22 @@ class YoutubeAPI:
             self.last_request_success = False
             return {'message': 'La API está deshabilitada'}
         
+        # Verifico que quede cuota para el metodo. Los metodos opcionales se
+        # omiten sin deshabilitar la API; si no alcanza para el resto, el
+        # trabajo que falta se hace mediante el HTML
+        ledger = QuotaLedger()
+        method = getattr(self.request, 'methodId', None)
+        if not ledger.can_spend(method):
+            self.last_request_success = False
+            if ledger.normalize_method(method) not in ledger.OPTIONAL_METHODS:
+                logger.warning(f'No queda cuota en la API de YouTube para [{method}] ({ledger.get_remaining()} unidades), será deshabilitada')
+                self.disable_api()
+            return {'message': f'Sin cuota disponible para {method}', 'quota_exceeded': True}
+        
         # Se intenta ejecutar la solicitud almacenada en self.request
-        # dentro de un bloque try
+        # dentro de un bloque try. Las solicitudes fallidas tambien consumen cuota
         try:
+            ledger.charge(method)
             response = self.request.execute()
             # Si la solicitud se ejecuta con éxito, se devuelve la respuesta.
             self.last_request_success = True
@@ -169,6 +187,7 @@ class YoutubeAPI:
             # y que la cuota fue excedida.
             if 'quota' in error_message.lower():
                 logger.warning('Se alcanzó la cuota máxima en la API de YouTube, será deshabilitada')
+                ledger.exhaust()
                 self.disable_api()
                 # Si se produjo un error, dejamos registro
                 self.last_request_success = False
@@ -489,45 +508,7 @@ class YoutubeAPI:
             
             # Obtener los datos del video si la respuesta es válida
             if 'items' in response and response['items']:
-                item = response['items'][0]
-                
-                # Obtener el ID del video
-                data['video_id'] = item.get('id', video_id)
-                
-                # Obtener el título del video
-                data['title'] = item['snippet'].get('title', 'Unknown')
-                
-                # Obtener el ID y nombre del canal del video
-                snippet = item.get('snippet', {})
-                data['channel_id'] = snippet.get('channelId', 'Unknown channel ID')
-                data['channel_name'] = snippet.get('channelTitle', 'Unknown channel name')
-                
-                # Obtener la fecha de publicación del video
-                published_at = snippet.get('publishedAt')
-                if published_at:
-                    publish_date = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%SZ')
-                    data['publish_date'] = publish_date.strftime('%Y/%m/%d %H:%M:%S')
-                else:
-                    data['publish_date'] = '00/00/00'
-                
-                # Obtener las etiquetas del video
-                tags = snippet.get('tags', [])
-                data['tags'] = '/'.join(tags)
-                
-                # Obtener el número de vistas del video
-                statistics = item.get('statistics', {})
-                data['views'] = statistics.get('viewCount', 0)
-                
-                # Obtener el número de "me gusta" del video
-                data['likes'] = statistics.get('likeCount', 0)
-                
-                # Obtener el número de comentarios del video
-                data['comment_count'] = statistics.get('commentCount', 0)
-                
-                # Obtener la duración del video
-                content_details = item.get('contentDetails', {})
-                duration = content_details.get('duration', 'PT0S')
-                data['length'] = transform_duration_format(duration)
+                data = self.parse_video_item(response['items'][0], video_id)
             
         except Exception as e:
             logger.error(f'Se produjo un error al obtener la información para el video {video_id}. Error: {e}')
@@ -537,6 +518,155 @@ class YoutubeAPI:
         
         return data
     
+    def parse_video_item(self, item, video_id=None):
+        """
+        Convierte un elemento de la respuesta de videos().list en el diccionario
+        de datos del video.
+        
+        Args:
+            item (dict): Elemento de la lista 'items' de la respuesta.
+            video_id (str, optional): ID a usar si el elemento no trae el campo 'id'.
+        
+        Returns:
+            dict: Diccionario con los datos del video (ver fetch_video_data()).
+        """
+        data = {}
+        
+        # Obtener el ID del video
+        data['video_id'] = item.get('id', video_id)
+        
+        # Obtener el título del video
+        snippet = item.get('snippet', {})
+        data['title'] = snippet.get('title', 'Unknown')
+        
+        # Obtener el ID y nombre del canal del video
+        data['channel_id'] = snippet.get('channelId', 'Unknown channel ID')
+        data['channel_name'] = snippet.get('channelTitle', 'Unknown channel name')
+        
+        # Obtener la fecha de publicación del video
+        published_at = snippet.get('publishedAt')
+        if published_at:
+            publish_date = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%SZ')
+            data['publish_date'] = publish_date.strftime('%Y/%m/%d %H:%M:%S')
+        else:
+            data['publish_date'] = '00/00/00'
+        
+        # Obtener las etiquetas del video
+        tags = snippet.get('tags', [])
+        data['tags'] = '/'.join(tags)
+        
+        # Obtener el número de vistas del video
+        statistics = item.get('statistics', {})
+        data['views'] = statistics.get('viewCount', 0)
+        
+        # Obtener el número de "me gusta" del video
+        data['likes'] = statistics.get('likeCount', 0)
+        
+        # Obtener el número de comentarios del video
+        data['comment_count'] = statistics.get('commentCount', 0)
+        
+        # Obtener la duración del video
+        content_details = item.get('contentDetails', {})
+        duration = content_details.get('duration', 'PT0S')
+        data['length'] = transform_duration_format(duration)
+        
+        # Placeholder para el tiempo medio de visualización del video (actualmente no implementado)
+        data['mvm'] = '00:00:00'
+        
+        return data
+    
+    def fetch_batch_items(self, resource, ids, part, batch_size=None):
+        """
+        Obtiene los elementos de un recurso de la API de YouTube (videos,
+        playlists) pidiendo hasta MAX_IDS_PER_REQUEST IDs por solicitud.
+        
+        Si una solicitud falla, se registra el error y se continua con el
+        siguiente lote, de forma que un lote fallido no invalida al resto.
+        
+        Args:
+            resource (str): Nombre del recurso de la API ('videos', 'playlists').
+            ids (list): Lista de IDs a consultar.
+            part (str): Partes de la respuesta a solicitar.
+            batch_size (int, optional): Cantidad de IDs por solicitud.
+        
+        Returns:
+            dict: Diccionario {ID: elemento de la respuesta} con los IDs que devolvio la API.
+        """
+        # Establecer el tamaño del lote, la API no admite mas de 50 IDs por solicitud
+        batch_size = batch_size if batch_size is not None else self.MAX_IDS_PER_REQUEST
+        batch_size = min(max(batch_size, 1), self.MAX_IDS_PER_REQUEST)
+        
+        # Elimino los IDs vacios y repetidos manteniendo el orden
+        ids = list(dict.fromkeys([x for x in ids if x]))
+        
+        items = {}
+        for idx in range(0, len(ids), batch_size):
+            # Si la API se deshabilito en medio del proceso (cuota), dejo de pedir
+            if not self.is_enabled():
+                logger.warning(f'La API de YouTube se deshabilitó, quedaron {len(ids) - idx} IDs sin consultar.')
+                break
+            
+            batch = ids[idx:idx + batch_size]
+            try:
+                self.request = getattr(self.youtube, resource)().list(
+                    part=part,
+                    id=','.join(batch),
+                    maxResults=len(batch)
+                )
+                response = self.execute()
+                
+                if not self.last_request_success:
+                    logger.error(f'Falló la solicitud por lotes a {resource}().list para los IDs {batch}. Respuesta: {response}')
+                    continue
+                
+                for item in response.get('items', []):
+                    if item.get('id'):
+                        items[item['id']] = item
+                    
+            except Exception as e:
+                logger.error(f'Se produjo un error al obtener el lote de {resource} {batch}. Error: {e}')
+        
+        return items
+    
+    def fetch_videos_data(self, video_ids, batch_size=None):
+        """
+        Obtiene los datos de varios videos de YouTube pidiendo hasta 50 IDs
+        por solicitud a la API.
+        
+        Los IDs que la API no devuelve (privados, eliminados o de un lote
+        fallido) se informan uno a uno y no se incluyen en el resultado.
+        
+        Args:
+            video_ids (list): Lista de IDs de videos de YouTube.
+            batch_size (int, optional): Cantidad de IDs por solicitud.
+        
+        Returns:
+            dict: Diccionario {video_id: datos} con el mismo formato que fetch_video_data().
+        """
+        # Verificar si la API de YouTube está habilitada
+        if not self.is_enabled():
+            logger.warning('La API de YouTube no está habilitada. Saliendo de la función fetch_videos_data.')
+            return {}
+        
+        items = self.fetch_batch_items('videos', video_ids, 'contentDetails,id,snippet,statistics', batch_size)
+        
+        data = {}
+        for video_id, item in items.items():
+            try:
+                data[video_id] = self.parse_video_item(item, video_id)
+            except Exception as e:
+                logger.error(f'Se produjo un error al procesar la información para el video {video_id}. Error: {e}')
+        
+        # Informo los IDs que no se pudieron obtener
+        for video_id in video_ids:
+            if video_id and video_id not in data:
+                logger.warning(f'La API de YouTube no devolvió datos para el video {video_id}.')
+        
+        if self.DEBUG:
+            logger.info(f'Se obtuvieron datos para {len(data)} de {len(video_ids)} videos mediante solicitudes por lotes.')
+        
+        return data
+    
     def fetch_short_data(self, short_id):
         """
         Obtiene datos relevantes de un short de YouTube dado su ID.
@@ -552,6 +682,23 @@ class YoutubeAPI:
         del data['video_id']
         return data
     
+    def fetch_shorts_data(self, short_ids, batch_size=None):
+        """
+        Obtiene los datos de varios shorts de YouTube pidiendo hasta 50 IDs
+        por solicitud a la API.
+        
+        Args:
+            short_ids (list): Lista de IDs de shorts de YouTube.
+            batch_size (int, optional): Cantidad de IDs por solicitud.
+        
+        Returns:
+            dict: Diccionario {short_id: datos} con el mismo formato que fetch_short_data().
+        """
+        data = self.fetch_videos_data(short_ids, batch_size)
+        for short_data in data.values():
+            short_data['short_id'] = short_data.pop('video_id')
+        return data
+    
     def fetch_playlist_data(self, playlist_id):
         """
         Obtiene datos relevantes de una playlist de YouTube dado su ID.
@@ -611,6 +758,62 @@ class YoutubeAPI:
         
         return data
 
+    def fetch_playlists_data(self, playlist_ids, batch_size=None):
+        """
+        Obtiene los datos de varias playlists de YouTube pidiendo hasta 50 IDs
+        por solicitud a la API.
+        
+        NOTA: Los IDs de los videos de cada playlist se siguen pidiendo de a
+        una playlist por vez porque playlistItems().list no admite lotes.
+        Antes de pedirlos se verifica que la cuota alcance para todas las
+        paginas de la playlist; si no alcanza, la playlist no se incluye en
+        el resultado y se obtiene mediante el HTML.
+        
+        Args:
+            playlist_ids (list): Lista de IDs de playlists de YouTube.
+            batch_size (int, optional): Cantidad de IDs por solicitud.
+        
+        Returns:
+            dict: Diccionario {playlist_id: datos} con el mismo formato que fetch_playlist_data().
+        """
+        # Verificar si la API de YouTube está habilitada
+        if not self.is_enabled():
+            logger.warning('La API de YouTube no está habilitada. Saliendo de la función fetch_playlists_data.')
+            return {}
+        
+        items = self.fetch_batch_items('playlists', playlist_ids, 'contentDetails,id,snippet', batch_size)
+        
+        data = {}
+        ledger = QuotaLedger()
+        for playlist_id, item in items.items():
+            try:
+                # Verifico que la cuota alcance para todas las paginas de videos
+                n_pages = max(math.ceil(int(item['contentDetails']['itemCount']) / self.page_results), 1)
+                if ledger.get_remaining() < n_pages * ledger.get_cost('playlistItems.list'):
+                    logger.warning(f'No queda cuota en la API de YouTube para las {n_pages} paginas de videos de la playlist {playlist_id}, se obtendra mediante el HTML.')
+                    continue
+                
+                data[playlist_id] = {
+                    'playlist_id': playlist_id,
+                    'publish_date': item['snippet']['publishedAt'],
+                    'channel_id': item['snippet']['channelId'],
+                    'channel_name': item['snippet']['channelTitle'],
+                    'title': item['snippet']['title'],
+                    'views': 0,
+                    'likes': 0,
+                    'n_videos': item['contentDetails']['itemCount'],
+                    'video_ids': self.fetch_playlist_videos(playlist_id=playlist_id, n_videos_fetch=9999999),
+                }
+            except Exception as e:
+                logger.error(f'Se produjo un error al procesar la información para la playlist {playlist_id}. Error: {e}')
+        
+        # Informo los IDs que no se pudieron obtener
+        for playlist_id in playlist_ids:
+            if playlist_id and playlist_id not in data:
+                logger.warning(f'La API de YouTube no devolvió datos para la playlist {playlist_id}.')
+        
+        return data
+
 if __name__ == '__main__':
     # Ejemplo de uso
     youtube_api = YoutubeAPI()
\ No newline at end of file
@@ -0,0 +1,200 @@
+# Imports estándar de Python
+import os
+import time
+import threading
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+# Ninguno en este set
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv, get_video_status
+from src.utils.executor import ExecutorService
+from src.youtube.youtube_api import YoutubeAPI
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+def probe_video_online(video_id):
+    """
+    Consulta el endpoint oEmbed para un video.
+
+    Returns:
+        bool: True si esta disponible, False si no existe o es privado y
+              None si no se pudo consultar (error de red, 429, 5xx, etc.).
+    """
+    try:
+        online = get_video_status(video_id)
+    except Exception as e:
+        logger.warning(f'No se pudo verificar la disponibilidad del video [{video_id}]. Error: {e}')
+        return None
+    if online is None:
+        logger.warning(f'No se pudo verificar la disponibilidad del video [{video_id}].')
+    return online
+
+class VideoAvailability:
+    """
+    Verifica en bloque si los videos o shorts de YouTube estan disponibles.
+
+    Si la API de YouTube esta habilitada se consulta videos().list con hasta
+    50 IDs por solicitud. Si no, se consulta el endpoint oEmbed en paralelo
+    con la sesion HTTP compartida. Los resultados se guardan por ID durante
+    YOUTUBE_AVAILABILITY_TTL segundos.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_TTL = 3600 # Segundos que se recuerda el estado de cada video
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.ttl = getenv('YOUTUBE_AVAILABILITY_TTL', self.DEFAULT_TTL)
+            self.cache = {} # {video_id: (disponible, momento de la consulta)}
+            self.lock = threading.Lock()
+            self.initialized = True
+
+    ############################################################################
+    # Cache de resultados
+    ############################################################################
+    def get_cached(self, video_id):
+        """
+        Devuelve el estado guardado de un video o None si no hay uno vigente.
+        """
+        with self.lock:
+            entry = self.cache.get(video_id)
+        if entry and time.time() - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    def set_cached(self, results):
+        """
+        Guarda el estado de los videos que se pudieron consultar.
+        """
+        now = time.time()
+        with self.lock:
+            for video_id, online in results.items():
+                if online is not None:
+                    self.cache[video_id] = (online, now)
+
+    ############################################################################
+    # Consultas
+    ############################################################################
+    def check_with_api(self, video_ids):
+        """
+        Consulta la disponibilidad mediante videos().list en lotes de 50 IDs.
+
+        Returns:
+            dict: {video_id: bool} para los lotes que la API respondio. Los
+                  lotes fallidos no se incluyen.
+        """
+        youtube_api = YoutubeAPI()
+        batch_size = youtube_api.MAX_IDS_PER_REQUEST
+        results = {}
+
+        for idx in range(0, len(video_ids), batch_size):
+            if not youtube_api.is_enabled():
+                break
+
+            batch = video_ids[idx:idx + batch_size]
+            items = youtube_api.fetch_batch_items('videos', batch, 'id,status')
+            if not youtube_api.last_request_success:
+                continue
+
+            # Los videos eliminados no se devuelven y los privados no se pueden ver
+            for video_id in batch:
+                item = items.get(video_id)
+                results[video_id] = item is not None and item.get('status', {}).get('privacyStatus') != 'private'
+        return results
+
+    def check_with_oembed(self, video_ids):
+        """
+        Consulta la disponibilidad mediante el endpoint oEmbed en paralelo.
+
+        Returns:
+            dict: {video_id: bool o None}. None si la consulta fallo.
+        """
+        results = ExecutorService().map(probe_video_online, video_ids, task_type='availability')
+        return dict(zip(video_ids, results))
+
+    def check(self, video_ids):
+        """
+        Verifica la disponibilidad de varios videos.
+
+        Args:
+            video_ids (list): IDs de videos o shorts.
+
+        Returns:
+            dict: {video_id: bool o None}. None indica que no se pudo verificar.
+        """
+        video_ids = list(dict.fromkeys([x for x in video_ids if x]))
+        results = {}
+        pending = []
+        for video_id in video_ids:
+            online = self.get_cached(video_id)
+            if online is None:
+                pending.append(video_id)
+            else:
+                results[video_id] = online
+
+        if pending:
+            checked = {}
+            try:
+                if YoutubeAPI().is_enabled():
+                    checked = self.check_with_api(pending)
+            except Exception as e:
+                logger.error(f'Error al verificar la disponibilidad de los videos con la API. Error: {e}')
+
+            # Lo que no resolvio la API se consulta por oEmbed
+            missing = [x for x in pending if x not in checked]
+            if missing:
+                checked.update(self.check_with_oembed(missing))
+
+            self.set_cached(checked)
+            results.update(checked)
+
+            if self.DEBUG:
+                logger.info(f'Se verifico la disponibilidad de {len(pending)} videos ({len(video_ids) - len(pending)} desde la cache).')
+
+        return results
+
+def split_by_availability(video_ids):
+    """
+    Separa una lista de IDs en videos disponibles y no disponibles,
+    manteniendo el orden original.
+
+    Los IDs que no se pudieron verificar no aparecen en ninguna de las dos
+    listas, para no excluirlos por un error de red.
+
+    Returns:
+        tuple: (IDs disponibles, IDs no disponibles)
+    """
+    results = VideoAvailability().check(video_ids)
+    online = [x for x in video_ids if results.get(x) is True]
+    offline = [x for x in video_ids if results.get(x) is False]
+    return online, offline
@@ -13,9 +13,11 @@ import json
 from bs4 import BeautifulSoup
 
 # Imports locales
-from src.utils.utils import get_http_response, get_formatted_date, clean_and_parse_number, getenv, is_video_online, fetch_excluded_ids
+from src.utils.utils import get_http_response, get_formatted_date, clean_and_parse_number, getenv, fetch_excluded_ids
 from src.logger.logger import Logger
 from src.youtube.youtube_api import YoutubeAPI
+from src.youtube.youtube_availability import split_by_availability
+from src.utils.exclusion_store import get_excluded_ids
 from src.database.db import Database
 
 ################################################################################
@@ -57,6 +59,16 @@ class YoutubeChannel:
         'shorts': [], # Aca se guardan los objetos de tipo YoutubeShort
     }
 
+    # Atributos de cada objeto. Con __slots__ los objetos ocupan menos memoria
+    # y se serializan mas rapido al volver de los procesos del pool
+    __slots__ = tuple(DEFAULT_VALUES) + (
+        'data_loaded', 'html_content', 'fetch_status', 'save_html',
+        'fetch_channel_videos', 'fetch_channel_playlists', 'fetch_channel_shorts',
+        'n_videos_fetch', 'n_playlists_fetch', 'n_shorts_fetch',
+        'video_ids_list_db', 'video_ids_list_constructor', 'video_ids_list_others', 'video_ids_list_not_in_db',
+        'priority_order', 'excluded_video_ids', 'excluded_short_ids', 'excluded_playlist_ids'
+    )
+
     def __init__(self, channel_id=None, info_dict=None):
         # Inicialización de la clase
         
@@ -101,18 +113,18 @@ class YoutubeChannel:
         
         if self.channel_id:
             # Obtengo la lista de IDs excluidos
-            self.excluded_video_ids = fetch_excluded_ids(f'{self.channel_id}_video', 'get')
-            self.excluded_short_ids = fetch_excluded_ids(f'{self.channel_id}_short', 'get')
-            self.excluded_playlist_ids = fetch_excluded_ids(f'{self.channel_id}_playlist', 'get')
+            self.excluded_video_ids = get_excluded_ids(f'{self.channel_id}_video')
+            self.excluded_short_ids = get_excluded_ids(f'{self.channel_id}_short')
+            self.excluded_playlist_ids = get_excluded_ids(f'{self.channel_id}_playlist')
                 
             if self.DEBUG:
                 logger.info(f'Lista de videos excluidos para el canal [{self.channel_id}]: {self.excluded_video_ids}')
                 logger.info(f'Lista de shorts excluidos para el canal [{self.channel_id}]: {self.excluded_short_ids}')
                 logger.info(f'Lista de playlists excluidos para el canal [{self.channel_id}]: {self.excluded_playlist_ids}')
         else:
-            self.excluded_video_ids = []
-            self.excluded_short_ids = []
-            self.excluded_playlist_ids = []
+            self.excluded_video_ids = frozenset()
+            self.excluded_short_ids = frozenset()
+            self.excluded_playlist_ids = frozenset()
 
     def set_default_values(self):
         """Establece los valores por defecto de los atributos de la clase."""
@@ -190,6 +202,14 @@ class YoutubeChannel:
         self.html_content = html_content
         logger.info(f"Contenido HTML establecido con éxito para el canal [{self.channel_id}].")
         
+    def release_html(self):
+        """
+        Libera el contenido HTML una vez procesado, salvo que se este
+        depurando o guardando el HTML.
+        """
+        if not (self.DEBUG or self.save_html):
+            self.html_content = None
+
     def fetch_html_content(self, url_type='id', ovr_id=None, scrap_url=None):
         """ 
         Obtiene el contenido HTML del canal de YouTube dado.
@@ -455,6 +475,9 @@ class YoutubeChannel:
         
         except Exception as e:
             logger.warning(f"Fallo al cargar datos mediante scraping de contenido HTML: {e}")
+        finally:
+            # El HTML ya no se necesita una vez extraidos los datos
+            self.release_html()
 
         return False
 
@@ -638,12 +661,13 @@ class YoutubeChannel:
             filtered_new_short_ids = [x for x in new_short_ids if x not in self.excluded_short_ids]
             filtered_old_short_ids = [x for x in old_short_ids if x not in self.excluded_short_ids]
             
-            # Filtro los shorts que no estan online
-            new_online_shorts = [x for x in filtered_new_short_ids if is_video_online(x)]
-            old_online_shorts = [x for x in filtered_old_short_ids if is_video_online(x)]
+            # Filtro los shorts que no estan online, verificandolos todos juntos
+            online_shorts, no_online_shorts = split_by_availability(filtered_new_short_ids + filtered_old_short_ids)
+            online_shorts = set(online_shorts)
+            new_online_shorts = [x for x in filtered_new_short_ids if x in online_shorts]
+            old_online_shorts = [x for x in filtered_old_short_ids if x in online_shorts]
             
             # Los shorts que no estan disponibles los agrego a una base de datos
-            no_online_shorts = [x for x in filtered_new_short_ids if x not in new_online_shorts] + [x for x in filtered_old_short_ids if x not in old_online_shorts]
             if no_online_shorts:
                 fetch_excluded_ids(f'{self.channel_id}_short', 'add', no_online_shorts)
                 logger.info(f'Los siguientes shorts del canal [{self.channel_id}] no estan online y van a ser excluidos: {no_online_shorts}.')
@@ -824,11 +848,10 @@ class YoutubeChannel:
         # Elimino los IDs que estan en la lista de excluidos
         new_video_ids = [x for x in new_video_ids if x not in self.excluded_video_ids]
         
-        # Filtro los videos que no estan online
-        online_videos = [x for x in new_video_ids if is_video_online(x)]
+        # Filtro los videos que no estan online, verificandolos todos juntos
+        online_videos, no_online_videos = split_by_availability(new_video_ids)
         
         # Los videos que no estan disponibles los agrego a una base de datos
-        no_online_videos = [x for x in new_video_ids if x not in online_videos]
         
         if no_online_videos:
             fetch_excluded_ids(f'{self.channel_id}_video', 'add', no_online_videos)
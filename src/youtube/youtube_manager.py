@@ -9,7 +9,7 @@ import os
 
 # Imports de terceros
 from functools import partial
-from multiprocessing import Pool, cpu_count
+from itertools import chain
 
 # Imports locales
 from src.youtube.youtube_channel import YoutubeChannel
@@ -17,9 +17,13 @@ from src.youtube.youtube_video import YoutubeVideo
 from src.youtube.youtube_short import YoutubeShort
 from src.youtube.youtube_playlist import YoutubePlaylist
 from src.youtube.youtube_api import YoutubeAPI
+from src.youtube.youtube_scheduler import RefreshScheduler
+from src.youtube.youtube_quota import QuotaLedger
 from src.logger.logger import Logger
 from src.database.db import Database
 from src.utils.utils import is_url_arg, getenv
+from src.utils.async_http import fetch_texts
+from src.utils.executor import ExecutorService
 
 ################################################################################
 # Genero una instancia del Logger
@@ -191,8 +195,10 @@ class YoutubeManager:
     # Configuraciones por defecto
     DEFAULT_N_CHANNELS_FETCH = 10
     DEFAULT_ENABLE_MP = True
-    DEFAULT_N_CORES = -1
     DEFAULT_DB_NAME = "latinframe.db"
+    DEFAULT_FETCH_ENGINE = 'pool' # 'pool' (ExecutorService) o 'async' (asyncio)
+    DEFAULT_STREAM_TO_DB = False
+    DEFAULT_DB_BATCH_SIZE = 100
     DEBUG = False
 
     ############################################################################
@@ -217,19 +223,17 @@ class YoutubeManager:
             self.n_channels_fetch = getenv('YOUTUBE_MANAGER_N_CHANNELS_FETCH', self.DEFAULT_N_CHANNELS_FETCH)
             self.enable_mp = getenv('ENABLE_MP', self.DEFAULT_ENABLE_MP)
             self.db_name = getenv('DB_NAME', self.DEFAULT_DB_NAME)
-            self.n_cores = self.set_n_cores()
+            self.fetch_engine = getenv('YOUTUBE_FETCH_ENGINE', self.DEFAULT_FETCH_ENGINE)
+            self.stream_to_db = getenv('YOUTUBE_MANAGER_STREAM_TO_DB', self.DEFAULT_STREAM_TO_DB)
+            self.db_batch_size = getenv('YOUTUBE_MANAGER_DB_BATCH_SIZE', self.DEFAULT_DB_BATCH_SIZE)
+            self.streaming = False
+            self.pending_writes = []
             self.load_channels_from_database = load_channels_from_database
             self.load_videos_from_database = load_videos_from_database
             
             # Inicializar la API de Youtube
             self.youtube_api = self.initialize_youtube_api()
 
-            # Inicializar el objeto Pool para el procesamiento paralelo
-            if self.enable_mp:
-                self.pool = Pool(processes=self.n_cores)
-            else:
-                self.pool = None
-
             # Inicializar la base de datos
             self.database = self.initialize_database()
             
@@ -257,7 +261,8 @@ class YoutubeManager:
         info_str = (
             f"- Número de canales a analizar: {len(self.channel_ids)}\n"
             f"- IDs de los canales a analizar: {self.channel_ids}\n"
-            f"- Número de núcleos a utilizar (solo si se usa multithreading): {self.n_cores}\n"
+            f"- Número de núcleos a utilizar (solo si se usa multithreading): {ExecutorService().n_workers}\n"
+            f"- Motor de descarga de HTML: {self.fetch_engine}\n"
             f"- Nombre de la base de datos: {self.db_name}\n"
             f"- {youtube_api_msg}\n"
             f"- {database_msg}\n"
@@ -265,18 +270,11 @@ class YoutubeManager:
         )
         return info_str
     
-    def set_n_cores(self):
+    def use_async_engine(self):
         """
-        Obtiene el número de procesos a utilizar según la configuración.
+        Indica si se debe usar el motor asincronico para descargar el HTML.
         """
-        max_n_cores = cpu_count()
-        if getenv('MP_N_CORES', self.DEFAULT_N_CORES) < 0:
-            return max_n_cores
-        else:
-            if getenv('MP_N_CORES', self.DEFAULT_N_CORES) > max_n_cores:
-                return max_n_cores
-            else:
-                return getenv('MP_N_CORES', self.DEFAULT_N_CORES)
+        return str(self.fetch_engine).lower() == 'async'
 
     def initialize_youtube_api(self):
         """
@@ -306,18 +304,36 @@ class YoutubeManager:
     def fetch_data(self, initialize_channels=True, initialize_videos=True, initialize_shorts=True, initialize_playlists=True, insert_data_to_db=True):
         """
         Ejecuta el proceso de scrap según las opciones proporcionadas.
+
+        Si YOUTUBE_MANAGER_STREAM_TO_DB esta habilitado, los datos se escriben
+        en la base de datos por lotes a medida que se obtienen y los videos,
+        shorts y playlists no se retienen en memoria.
         """
+        self.streaming = bool(self.stream_to_db and insert_data_to_db and self.database)
+        
         if initialize_channels:
             self.initialize_channels()
         
             if self.DEBUG:
                 self.log_channels_info()
             
+            # En modo streaming guardo los canales apenas se obtienen
+            if self.streaming:
+                for channel in self.channels:
+                    if channel and channel.fetch_status:
+                        self.stream_write(self.insert_channel_data_to_db, channel)
+                self.flush_writes()
+            
             # Inicializar la base de datos si load_from_database es True
             if self.load_videos_from_database:
                 self.load_video_ids_from_database()
+            
+            # Si la planificacion esta habilitada, solo actualizo lo que vence
+            use_schedule = RefreshScheduler().is_enabled()
     
             if initialize_shorts:
+                if use_schedule:
+                    self.apply_refresh_schedule(kinds=['short'])
                 self.initialize_shorts()
         
                 if self.DEBUG:
@@ -331,11 +347,18 @@ class YoutubeManager:
             
             # Esto va a ser lo ultimo que hagamos
             if initialize_videos:
+                # Los videos se filtran despues de las playlists porque al
+                # agregar sus IDs cada canal vuelve a armar su lista de videos
+                if use_schedule:
+                    self.apply_refresh_schedule(kinds=['video'])
                 self.initialize_videos()
                 self.log_videos_info()
         
         if insert_data_to_db:
-            self.insert_data_to_db()
+            if self.streaming:
+                self.flush_writes()
+            else:
+                self.insert_data_to_db()
         
     def initialize_channels(self):
         """
@@ -344,7 +367,12 @@ class YoutubeManager:
         Utiliza multiprocessing para inicializar los canales en paralelo si ENABLE_MP es True,
         de lo contrario, inicializa los canales de forma serial.
         """
-        if self.enable_mp:
+        # El HTML de los canales solo se usa si la API no esta habilitada
+        if self.use_async_engine() and not (self.youtube_api and self.youtube_api.is_enabled()):
+            if self.DEBUG:
+                logger.info('Inicializando canales de Youtube de forma asincronica')
+            self.async_channel_initialize()
+        elif self.enable_mp:
             if self.DEBUG:
                 logger.info('Inicializando canales de Youtube en paralelo')
             self.parallel_channel_initialize()
@@ -355,16 +383,30 @@ class YoutubeManager:
 
     def parallel_channel_initialize(self):
         """
-        Inicializa los canales de YouTube en paralelo utilizando multiprocessing.Pool.
+        Inicializa los canales de YouTube en paralelo utilizando el servicio de ejecucion compartido.
         """
         try:
             # Utiliza functools.partial para pasar los argumentos fijos a initialize_youtube_channel
             init_func = partial(initialize_youtube_channel)
             # Ejecuta initialize_youtube_channel para cada ID de canal en paralelo
-            self.channels = self.pool.map(init_func, self.channel_ids)
+            self.channels = ExecutorService().map(init_func, self.channel_ids, task_type='youtube')
         except Exception as e:
             logger.error(f'Error al inicializar los canales en paralelo: {str(e)}')
             
+    def async_channel_initialize(self):
+        """
+        Inicializa los canales de YouTube descargando su HTML de forma asincronica.
+        """
+        self.channels = []
+        try:
+            # Los canales indicados mediante una URL se inicializan por la via tradicional
+            channel_ids = [x for x in self.channel_ids if not is_url_arg(x)]
+            channels = self.async_initialize(channel_ids, YoutubeChannel, 'https://www.youtube.com/channel/{}')
+            channels += [initialize_youtube_channel(x) for x in self.channel_ids if is_url_arg(x)]
+            self.channels = channels
+        except Exception as e:
+            logger.error(f'Error al inicializar los canales de forma asincronica: {str(e)}')
+
     def serial_channel_initialize(self):
         """
         Inicializa los canales de YouTube de forma serial.
@@ -384,6 +426,238 @@ class YoutubeManager:
         for channel in self.channels:
             logger.info(str(channel))
 
+    ############################################################################
+    # Obtencion de datos por lotes mediante la API de Youtube
+    ############################################################################
+    def fetch_batch_data_from_api(self, id_list_attr, fetch_func):
+        """
+        Obtiene mediante la API de YouTube los datos de todos los IDs de los
+        canales en solicitudes por lotes.
+
+        Solo se piden los IDs que alcanza a cubrir la cuota restante del dia
+        (ver QuotaLedger); el resto se obtiene mediante el HTML.
+
+        Args:
+            id_list_attr (str): Atributo del canal con la lista de IDs ('video_id_list', 'short_id_list', 'playlist_id_list').
+            fetch_func (callable): Funcion de la API que recibe una lista de IDs y devuelve un diccionario {ID: datos}.
+
+        Returns:
+            dict: Diccionario {ID: datos}. Vacio si la API no esta habilitada o si hubo un error.
+        """
+        if fetch_func is None or not self.youtube_api.is_enabled():
+            return {}
+        
+        try:
+            id_list = [x for channel in self.channels if channel for x in getattr(channel, id_list_attr, [])]
+            
+            # Recorto la lista a lo que se puede pagar con la cuota restante
+            # Las playlists ademas piden sus videos con playlistItems.list
+            if id_list_attr == 'playlist_id_list':
+                method, per_id_method = 'playlists.list', 'playlistItems.list'
+            else:
+                method, per_id_method = 'videos.list', None
+            n_ids = QuotaLedger().plan_batch(len(id_list), method, self.youtube_api.MAX_IDS_PER_REQUEST, per_id_method)
+            if n_ids < len(id_list):
+                logger.warning(f'La cuota de la API de YouTube alcanza para {n_ids} de {len(id_list)} elementos de [{id_list_attr}], el resto se obtendra mediante el HTML.')
+                id_list = id_list[:n_ids]
+            
+            batch_data = fetch_func(id_list)
+            if self.DEBUG:
+                logger.info(f'Se obtuvieron {len(batch_data)} de {len(id_list)} elementos de [{id_list_attr}] mediante la API por lotes.')
+            return batch_data
+        except Exception as e:
+            logger.error(f'Error al obtener los datos por lotes de [{id_list_attr}] mediante la API. Error: {str(e)}')
+            return {}
+
+    ############################################################################
+    # Obtencion de datos mediante el motor asincronico
+    ############################################################################
+    def async_initialize(self, id_list, obj_class, url_template):
+        """
+        Descarga de forma asincronica el HTML de todos los IDs y carga los
+        datos de cada objeto con sus parsers habituales apenas termina su
+        descarga, para no retener todas las paginas en memoria.
+
+        Args:
+            id_list (list): Lista de IDs a inicializar.
+            obj_class (type): Clase del objeto a crear (YoutubeChannel, YoutubeVideo, YoutubeShort, YoutubePlaylist).
+            url_template (str): Plantilla de la URL a descargar, con {} en el lugar del ID.
+
+        Returns:
+            list: Lista de objetos inicializados.
+        """
+        urls = {item_id: url_template.format(item_id) for item_id in id_list}
+        url_ids = {url: item_id for item_id, url in urls.items()}
+        
+        def init_object(url, html_content):
+            item_id = url_ids[url]
+            try:
+                obj = obj_class(item_id)
+                
+                # Si la descarga fallo marco el HTML como no disponible
+                # para no volver a pedirlo de forma sincronica
+                obj.set_html(html_content if html_content is not None else False)
+                obj.fetch_data()
+                return obj
+            except Exception as e:
+                logger.error(f'Error al inicializar [{item_id}] de forma asincronica. Error: {str(e)}')
+                return None
+        
+        objects = fetch_texts(list(urls.values()), callback=init_object)
+        return [objects.get(urls[item_id]) for item_id in id_list]
+
+    def async_initialize_channels(self, id_list_attr, batch_data, obj_class, url_template):
+        """
+        Inicializa de forma asincronica los objetos de todos los canales con
+        una unica descarga, para tener en vuelo los IDs de todos los canales
+        a la vez, y luego reparte los objetos entre sus canales.
+
+        Args:
+            id_list_attr (str): Atributo del canal con la lista de IDs ('video_id_list', 'short_id_list', 'playlist_id_list').
+            batch_data (dict): Diccionario {ID: datos} devuelto por la API por lotes.
+            obj_class (type): Clase del objeto a crear (YoutubeVideo, YoutubeShort, YoutubePlaylist).
+            url_template (str): Plantilla de la URL a descargar, con {} en el lugar del ID.
+
+        Returns:
+            list: Una lista de objetos por cada canal de self.channels, en el mismo orden.
+        """
+        # Creo los objetos que ya se obtuvieron desde la API y junto el resto
+        # de los IDs de todos los canales
+        channel_batches = []
+        pending_ids = []
+        for channel in self.channels:
+            batch_objects, id_list = self.batch_initialize(getattr(channel, id_list_attr, []), batch_data, obj_class)
+            channel_batches.append((batch_objects, id_list))
+            pending_ids.extend(id_list)
+        pending_ids = list(dict.fromkeys(pending_ids))
+        
+        objects = dict(zip(pending_ids, self.async_initialize(pending_ids, obj_class, url_template)))
+        return [batch_objects + [objects[x] for x in id_list] for batch_objects, id_list in channel_batches]
+
+    ############################################################################
+    # Escritura en la base de datos a medida que se obtienen los datos
+    ############################################################################
+    def iter_initialize(self, id_list, init_func, obj_class, url_template):
+        """
+        Inicializa los objetos y los devuelve a medida que se completan.
+
+        Args:
+            id_list (list): Lista de IDs a inicializar.
+            init_func (callable): Funcion de inicializacion para un ID (initialize_youtube_video, ...).
+            obj_class (type): Clase del objeto a crear, usada por el motor asincronico.
+            url_template (str): Plantilla de la URL a descargar, usada por el motor asincronico.
+
+        Yields:
+            Cada objeto inicializado (o None si fallo su inicializacion).
+        """
+        if self.use_async_engine():
+            # Descargo por tandas para no tener todo el HTML en memoria
+            for i in range(0, len(id_list), self.db_batch_size):
+                yield from self.async_initialize(id_list[i:i+self.db_batch_size], obj_class, url_template)
+        elif self.enable_mp:
+            yield from ExecutorService().imap_unordered(partial(init_func, verbose=False), id_list, task_type='youtube')
+        else:
+            for item_id in id_list:
+                yield init_func(item_id, verbose=False)
+
+    def stream_initialize(self, id_list_attr, batch_data, obj_class, init_func, url_template, insert_func, on_item=None):
+        """
+        Inicializa los objetos de todos los canales exitosos y los escribe en la
+        base de datos por lotes a medida que se completan, sin retenerlos.
+
+        Args:
+            id_list_attr (str): Atributo del canal con la lista de IDs ('video_id_list', 'short_id_list', 'playlist_id_list').
+            batch_data (dict): Diccionario {ID: datos} devuelto por la API por lotes.
+            obj_class (type): Clase del objeto a crear (YoutubeVideo, YoutubeShort, YoutubePlaylist).
+            init_func (callable): Funcion de inicializacion para un ID.
+            url_template (str): Plantilla de la URL a descargar, usada por el motor asincronico.
+            insert_func (callable): Metodo que inserta un objeto en la base de datos.
+            on_item (callable, optional): Funcion a llamar con (canal, objeto) antes de escribir cada objeto.
+        """
+        # Relaciono cada ID con su canal para no perder la referencia
+        owners = {}
+        for channel in self.channels:
+            if channel and channel.fetch_status:
+                for item_id in getattr(channel, id_list_attr, []):
+                    owners.setdefault(item_id, channel)
+
+        id_attr = id_list_attr.replace('_list', '')
+        batch_objects, pending_ids = self.batch_initialize(list(owners), batch_data, obj_class)
+        
+        n_written = 0
+        for obj in chain(batch_objects, self.iter_initialize(pending_ids, init_func, obj_class, url_template)):
+            if obj is None or not obj.fetch_status:
+                continue
+            if on_item:
+                on_item(owners.get(getattr(obj, id_attr)), obj)
+            self.stream_write(insert_func, obj)
+            n_written += 1
+        self.flush_writes()
+        
+        logger.info(f'Se escribieron {n_written} de {len(owners)} elementos de [{id_list_attr}] en la base de datos.')
+
+    def stream_write(self, insert_func, obj):
+        """
+        Agrega un objeto a la cola de escritura y la vacia si se completo un lote.
+        """
+        self.pending_writes.append((insert_func, obj))
+        
+        # Si un lote anterior volvio a la cola, se reintenta al completar el siguiente
+        if len(self.pending_writes) % max(self.db_batch_size, 1) == 0:
+            self.flush_writes()
+
+    def flush_writes(self):
+        """
+        Escribe en la base de datos todos los objetos pendientes en una unica transaccion.
+
+        Las filas invalidas se descartan de a una dentro de Database.bulk_flush.
+        Si la transaccion completa no se puede confirmar (base bloqueada,
+        disco lleno, etc.), los objetos vuelven a la cola y se reintentan en
+        la proxima escritura.
+        """
+        if not self.pending_writes:
+            return
+        
+        pending_writes, self.pending_writes = self.pending_writes, []
+        try:
+            with self.database.bulk():
+                for insert_func, obj in pending_writes:
+                    insert_func(obj)
+            if not self.database.bulk_success:
+                raise Exception('No se pudo confirmar la transaccion.')
+            if self.DEBUG:
+                logger.info(f'Se escribio un lote de {len(pending_writes)} elementos en la base de datos.')
+        except Exception as e:
+            logger.error(f'Error al escribir un lote de {len(pending_writes)} elementos en la base de datos, se reintentara en la proxima escritura. Error: {str(e)}')
+            self.pending_writes = pending_writes + self.pending_writes
+    
+    def batch_initialize(self, id_list, batch_data, obj_class):
+        """
+        Crea los objetos cuyos datos ya se obtuvieron por lotes desde la API.
+
+        Args:
+            id_list (list): Lista de IDs a inicializar.
+            batch_data (dict): Diccionario {ID: datos} devuelto por la API.
+            obj_class (type): Clase del objeto a crear (YoutubeVideo, YoutubeShort, YoutubePlaylist).
+
+        Returns:
+            tuple: (objetos creados, IDs pendientes que se deben inicializar por la via tradicional).
+        """
+        objects = []
+        pending_ids = []
+        for item_id in id_list:
+            if item_id not in batch_data:
+                pending_ids.append(item_id)
+                continue
+            try:
+                obj = obj_class(item_id)
+                obj.fetch_data(info_dict=batch_data[item_id])
+                objects.append(obj)
+            except Exception as e:
+                logger.error(f'Error al inicializar [{item_id}] desde los datos por lotes. Error: {str(e)}')
+                pending_ids.append(item_id)
+        return objects, pending_ids
+
     ############################################################################
     # Gestion de videos de Youtube
     ############################################################################
@@ -394,9 +668,25 @@ class YoutubeManager:
         Utiliza multiprocessing para inicializar los videos en paralelo si ENABLE_MP es True,
         de lo contrario, inicializa los videos de forma serial.
         """
+        # Si la API esta habilitada pido los datos de todos los videos por lotes
+        batch_data = self.fetch_batch_data_from_api('video_id_list', self.youtube_api.fetch_videos_data if self.youtube_api else None)
+        
+        if self.streaming:
+            self.stream_initialize('video_id_list', batch_data, YoutubeVideo, initialize_youtube_video, 'https://www.youtube.com/watch?v={}', self.insert_video_data_to_db)
+            return
+        
+        # Con el motor asincronico descargo los IDs de todos los canales juntos
+        if self.use_async_engine():
+            if self.DEBUG:
+                logger.info('Inicializando videos de Youtube de forma asincronica')
+            for channel, objects in zip(self.channels, self.async_initialize_channels('video_id_list', batch_data, YoutubeVideo, 'https://www.youtube.com/watch?v={}')):
+                channel.videos = objects
+            return
+        
         for channel in self.channels:
             # Obtengo la lista de IDs para el canal actual
-            video_id_list = channel.video_id_list
+            # y creo los videos que ya se obtuvieron desde la API
+            batch_videos, video_id_list = self.batch_initialize(channel.video_id_list, batch_data, YoutubeVideo)
             
             if self.enable_mp:
                 if self.DEBUG:
@@ -409,16 +699,17 @@ class YoutubeManager:
             
             # Cuando termino le asigno los objetos de tipo video
             # al objeto de tipo canal
+            self.videos = batch_videos + self.videos
             channel.videos = self.videos
 
     def parallel_video_initialize(self, video_id_list):
         """
-        Inicializa los canales de YouTube en paralelo utilizando multiprocessing.Pool.
+        Inicializa los canales de YouTube en paralelo utilizando el servicio de ejecucion compartido.
         """
         self.videos = []
         try:
             init_func = partial(initialize_youtube_video, verbose=False)
-            self.videos = self.pool.map(init_func, video_id_list)
+            self.videos = ExecutorService().map(init_func, video_id_list, task_type='youtube')
         except Exception as e:
             logger.error(f'Error al inicializar los videos en paralelo: {str(e)}')
         
@@ -452,9 +743,25 @@ class YoutubeManager:
         Utiliza multiprocessing para inicializar los shorts en paralelo si ENABLE_MP es True,
         de lo contrario, inicializa los shorts de forma serial.
         """
+        # Si la API esta habilitada pido los datos de todos los shorts por lotes
+        batch_data = self.fetch_batch_data_from_api('short_id_list', self.youtube_api.fetch_shorts_data if self.youtube_api else None)
+        
+        if self.streaming:
+            self.stream_initialize('short_id_list', batch_data, YoutubeShort, initialize_youtube_short, 'https://www.youtube.com/watch?v={}', self.insert_short_data_to_db)
+            return
+        
+        # Con el motor asincronico descargo los IDs de todos los canales juntos
+        if self.use_async_engine():
+            if self.DEBUG:
+                logger.info('Inicializando shorts de Youtube de forma asincronica')
+            for channel, objects in zip(self.channels, self.async_initialize_channels('short_id_list', batch_data, YoutubeShort, 'https://www.youtube.com/watch?v={}')):
+                channel.shorts = objects
+            return
+        
         for channel in self.channels:
             # Obtengo la lista de IDs para el short actual
-            short_id_list = channel.short_id_list
+            # y creo los shorts que ya se obtuvieron desde la API
+            batch_shorts, short_id_list = self.batch_initialize(channel.short_id_list, batch_data, YoutubeShort)
             
             if self.enable_mp:
                 if self.DEBUG:
@@ -467,6 +774,7 @@ class YoutubeManager:
             
             # Cuando termino le asigno los objetos de tipo short
             # al objeto de tipo short
+            self.shorts = batch_shorts + self.shorts
             channel.shorts = self.shorts
             
             # # Agrego los videos de cada playlist a la lista de IDs
@@ -476,12 +784,12 @@ class YoutubeManager:
 
     def parallel_short_initialize(self, short_id_list):
         """
-        Inicializa los shorts de YouTube en paralelo utilizando multiprocessing.Pool.
+        Inicializa los shorts de YouTube en paralelo utilizando el servicio de ejecucion compartido.
         """
         self.shorts = []
         try:
             init_func = partial(initialize_youtube_short, verbose=False)
-            self.shorts = self.pool.map(init_func, short_id_list)
+            self.shorts = ExecutorService().map(init_func, short_id_list, task_type='youtube')
         except Exception as e:
             logger.error(f'Error al inicializar los shorts en paralelo: {str(e)}')
         
@@ -515,9 +823,27 @@ class YoutubeManager:
         Utiliza multiprocessing para inicializar las playlists en paralelo si ENABLE_MP es True,
         de lo contrario, inicializa las playlists de forma serial.
         """
+        # Si la API esta habilitada pido los datos de todas las playlists por lotes
+        batch_data = self.fetch_batch_data_from_api('playlist_id_list', self.youtube_api.fetch_playlists_data if self.youtube_api else None)
+        
+        if self.streaming:
+            # Agrego los videos de cada playlist a la lista de IDs de su canal
+            add_video_ids = lambda channel, playlist: channel.add_video_ids_to_list(new_video_ids=playlist.video_ids, source='playlist')
+            self.stream_initialize('playlist_id_list', batch_data, YoutubePlaylist, initialize_youtube_playlist, 'https://www.youtube.com/playlist?list={}', self.insert_playlist_data_to_db, on_item=add_video_ids)
+            return
+        
+        # Con el motor asincronico descargo los IDs de todos los canales juntos
+        if self.use_async_engine():
+            if self.DEBUG:
+                logger.info('Inicializando playlists de Youtube de forma asincronica')
+            for channel, objects in zip(self.channels, self.async_initialize_channels('playlist_id_list', batch_data, YoutubePlaylist, 'https://www.youtube.com/playlist?list={}')):
+                channel.playlists = objects
+            return
+        
         for channel in self.channels:
             # Obtengo la lista de IDs para el playlist actual
-            playlist_id_list = channel.playlist_id_list
+            # y creo las playlists que ya se obtuvieron desde la API
+            batch_playlists, playlist_id_list = self.batch_initialize(channel.playlist_id_list, batch_data, YoutubePlaylist)
             
             if self.enable_mp:
                 if self.DEBUG:
@@ -530,6 +856,7 @@ class YoutubeManager:
             
             # Cuando termino le asigno los objetos de tipo playlist
             # al objeto de tipo playlist
+            self.playlists = batch_playlists + self.playlists
             channel.playlists = self.playlists
             
             # Agrego los videos de cada playlist a la lista de IDs
@@ -538,12 +865,12 @@ class YoutubeManager:
 
     def parallel_playlist_initialize(self, playlist_id_list):
         """
-        Inicializa las playlists de YouTube en paralelo utilizando multiprocessing.Pool.
+        Inicializa las playlists de YouTube en paralelo utilizando el servicio de ejecucion compartido.
         """
         self.playlists = []
         try:
             init_func = partial(initialize_youtube_playlist, verbose=False)
-            self.playlists = self.pool.map(init_func, playlist_id_list)
+            self.playlists = ExecutorService().map(init_func, playlist_id_list, task_type='youtube')
         except Exception as e:
             logger.error(f'Error al inicializar las playlists en paralelo: {str(e)}')
         
@@ -607,61 +934,106 @@ class YoutubeManager:
             return
 
         try:
-            # Para cada canal obtengo los videos
-            for channel in self.channels:
-                if self.DEBUG:
-                    logger.info(f'Cargando videos de YouTube desde la base de datos para el canal [{channel.channel_id}].')
-                    
-                video_id_list = self.database.get_youtube_video_ids(channel_id_list=channel.channel_id)
+            # Pido los videos de todos los canales en una sola consulta.
+            # El limite de cada canal contempla los videos excluidos porque
+            # se descartan recien al agregarlos al canal
+            channels = [channel for channel in self.channels if channel]
+            channel_limits = {
+                channel.channel_id: channel.n_videos_fetch + len(channel.excluded_video_ids)
+                for channel in channels
+            }
+            
+            # Con la planificacion habilitada pido los videos que vencen en
+            # esta corrida en lugar de los mas vistos
+            if RefreshScheduler().is_enabled():
+                video_ids = RefreshScheduler().get_due('video', channel_limits)
+            else:
+                video_ids = self.database.get_youtube_video_ids_by_channel(channel_limits)
+            
+            # Para cada canal agrego los videos
+            for channel in channels:
+                video_id_list = video_ids.get(channel.channel_id, [])
                 if self.DEBUG:
-                    logger.info(f'Lista de videos a cargar: {video_id_list}')
+                    logger.info(f'Videos de YouTube a cargar desde la base de datos para el canal [{channel.channel_id}]: {video_id_list}')
                 
                 channel.add_video_ids_to_list(video_id_list, source='database')
                 
         except Exception as e:
             logger.error(f"Error al cargar los canales desde la base de datos. Error: {e}.")
     
+    def apply_refresh_schedule(self, kinds=('video', 'short')):
+        """
+        Quita de las listas de videos y shorts de cada canal los que ya estan
+        en la base de datos y todavia no vencen segun RefreshScheduler.
+
+        Se debe llamar justo antes de inicializar cada tipo, ya que
+        initialize_playlists reconstruye la lista de videos de cada canal.
+
+        Args:
+            kinds (list): Tipos a filtrar ('video' y/o 'short').
+        """
+        channels = [channel for channel in self.channels if channel]
+        scheduler = RefreshScheduler()
+        id_list_attrs = {'video': 'video_id_list', 'short': 'short_id_list'}
+        
+        for kind in kinds:
+            id_list_attr = id_list_attrs[kind]
+            try:
+                id_lists = {channel.channel_id: getattr(channel, id_list_attr) or [] for channel in channels}
+                filtered = scheduler.filter_due(kind, id_lists)
+                for channel in channels:
+                    setattr(channel, id_list_attr, filtered.get(channel.channel_id, []))
+            except Exception as e:
+                logger.error(f"Error al planificar la actualizacion de los {kind}s. Error: {e}.")
+    
     def insert_data_to_db(self):
         """
         Inserta los datos obtenidos de YouTube en la base de datos.
+
+        Todas las escrituras se agrupan en una unica transaccion.
         """
-        try:
-            # Inserto los datos de los canales que resultaron exitosos
-            for channel in self.channels:
-                if channel.fetch_status:
-                    self.insert_channel_data_to_db(channel)
-        except Exception as e:
-            logger.error(f"Error al insertar datos para los canales de Youtube en la base de datos. Error: {str(e)}")
+        if not self.database:
+            logger.error("La base de datos no está inicializada.")
+            return
+        
+        with self.database.bulk():
+            try:
+                # Inserto los datos de los canales que resultaron exitosos
+                for channel in self.channels:
+                    if channel.fetch_status:
+                        self.insert_channel_data_to_db(channel)
+            except Exception as e:
+                logger.error(f"Error al insertar datos para los canales de Youtube en la base de datos. Error: {str(e)}")
             
-        try:
-            # Inserto los datos de los videos que resultaron exitosos
-            for channel in self.channels:
-                if channel.fetch_status:
-                    for video in channel.videos:
-                        if video.fetch_status:
-                            self.insert_video_data_to_db(video)
-        except Exception as e:
-            logger.error(f"Error al insertar datos para los videos de Youtube en la base de datos. Error: {str(e)}")
+            try:
+                # Inserto los datos de los videos que resultaron exitosos
+                for channel in self.channels:
+                    if channel.fetch_status:
+                        for video in channel.videos:
+                            if video.fetch_status:
+                                self.insert_video_data_to_db(video)
+            except Exception as e:
+                logger.error(f"Error al insertar datos para los videos de Youtube en la base de datos. Error: {str(e)}")
             
-        try:
-            # Inserto los datos de los shorts que resultaron exitosos
-            for channel in self.channels:
-                if channel.fetch_status:
-                    for short in channel.shorts:
-                        if short.fetch_status:
-                            self.insert_short_data_to_db(short)
-        except Exception as e:
-            logger.error(f"Error al insertar datos para los shorts de Youtube en la base de datos. Error: {str(e)}")
+            try:
+                # Inserto los datos de los shorts que resultaron exitosos
+                for channel in self.channels:
+                    if channel.fetch_status:
+                        for short in channel.shorts:
+                            if short.fetch_status:
+                                self.insert_short_data_to_db(short)
+            except Exception as e:
+                logger.error(f"Error al insertar datos para los shorts de Youtube en la base de datos. Error: {str(e)}")
             
-        try:
-            # Inserto los datos de los shorts que resultaron exitosos
-            for channel in self.channels:
-                if channel.fetch_status:
-                    for playlist in channel.playlists:
-                        if playlist.fetch_status:
-                            self.insert_playlist_data_to_db(playlist)
-        except Exception as e:
-            logger.error(f"Error al insertar datos para las playlists de Youtube en la base de datos. Error: {str(e)}")
+            try:
+                # Inserto los datos de los shorts que resultaron exitosos
+                for channel in self.channels:
+                    if channel.fetch_status:
+                        for playlist in channel.playlists:
+                            if playlist.fetch_status:
+                                self.insert_playlist_data_to_db(playlist)
+            except Exception as e:
+                logger.error(f"Error al insertar datos para las playlists de Youtube en la base de datos. Error: {str(e)}")
     
     def insert_channel_data_to_db(self, channel):
         """
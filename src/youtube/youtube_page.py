@@ -0,0 +1,210 @@
+# Imports estándar de Python
+import os
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+import re
+import json
+from collections import deque
+from datetime import datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import clean_and_parse_number, get_time_len
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+################################################################################
+# Extraccion de los datos embebidos en las paginas de videos y shorts
+################################################################################
+# Marcadores de los objetos JSON que YouTube embebe en la pagina
+PLAYER_RESPONSE_MARKER = 'ytInitialPlayerResponse = '
+INITIAL_DATA_MARKER = 'ytInitialData = '
+
+# Claves que se buscan en todo el arbol de ytInitialData/ytInitialPlayerResponse
+SEARCH_KEYS = (
+    'likeCount',
+    'expandedLikeCountIfLiked',
+    'expandedLikeCountIfDisliked',
+    'expandedLikeCountIfIndifferent',
+    'commentCount',
+    'decorationTimeMillis',
+)
+
+def json_loads(text):
+    """
+    Decodifica un texto JSON usando orjson si esta instalado.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def extract_json_blob(html, marker):
+    """
+    Extrae y decodifica el objeto JSON asignado a una variable en la pagina.
+
+    Args:
+        html (str): Contenido HTML de la pagina.
+        marker (str): Texto que precede al objeto JSON (por ejemplo 'ytInitialData = ').
+
+    Returns:
+        dict: El objeto decodificado o None si no se encontro.
+    """
+    start = html.find(marker)
+    if start < 0:
+        return None
+    start = html.find('{', start + len(marker))
+    if start < 0:
+        return None
+
+    # Lo habitual es que el objeto termine justo antes de ';</script>'
+    end = html.find(';</script>', start)
+    if end > 0:
+        try:
+            return json_loads(html[start:end])
+        except ValueError:
+            pass
+
+    # Si hay codigo despues del objeto, dejo que el decodificador encuentre el final
+    try:
+        blob, _ = json.JSONDecoder().raw_decode(html, start)
+        return blob
+    except ValueError as e:
+        logger.warning(f'No se pudo decodificar el objeto JSON [{marker.strip()}]. Error: {e}')
+    return None
+
+def find_keys(tree, keys):
+    """
+    Recorre una unica vez el arbol JSON y devuelve el primer valor encontrado
+    para cada una de las claves pedidas.
+
+    Args:
+        tree (dict or list): Arbol JSON a recorrer.
+        keys (tuple): Claves a buscar.
+
+    Returns:
+        dict: Diccionario {clave: valor} con las claves encontradas.
+    """
+    found = {}
+    pending = set(keys)
+    queue = deque([tree])
+    while queue and pending:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in pending:
+                    found[key] = value
+                    pending.discard(key)
+                if isinstance(value, (dict, list)):
+                    queue.append(value)
+        elif isinstance(node, list):
+            queue.extend(x for x in node if isinstance(x, (dict, list)))
+    return found
+
+def format_date(date_str):
+    """
+    Convierte una fecha ISO al formato usado en la base de datos.
+    """
+    return datetime.fromisoformat(date_str).strftime("%Y-%m-%d %H:%M:%S")
+
+def format_tags(keywords):
+    """
+    Convierte la lista de etiquetas al formato 'tag1/tag2/...'.
+    """
+    return '/'.join(x.replace(',', '/').replace('\n', ' ').replace('"', '') for x in keywords)
+
+def parse_count(value):
+    """
+    Obtiene un numero a partir de un valor de ytInitialData, que puede venir
+    como numero, como texto ('1,2 K') o como objeto ({'simpleText': ...}, {'content': ...}, {'runs': [...]}).
+    """
+    if isinstance(value, dict):
+        if 'runs' in value:
+            value = ''.join(x.get('text', '') for x in value['runs'])
+        else:
+            value = value.get('simpleText', value.get('content'))
+    if isinstance(value, (int, float)):
+        return int(value)
+    if not value:
+        return None
+
+    # Los textos abreviados ('1,2 K') se resuelven con clean_and_parse_number
+    match = re.search(r'(\d+[\d.,]*\s*[kKmMgGtTu])', value)
+    if match:
+        return clean_and_parse_number(match.group(1))
+    digits = re.sub(r'\D', '', value)
+    return int(digits) if digits else None
+
+def parse_watch_page(html):
+    """
+    Extrae todos los datos de una pagina de video o short de YouTube a partir
+    de ytInitialPlayerResponse y ytInitialData, decodificados una sola vez.
+
+    Args:
+        html (str): Contenido HTML de la pagina.
+
+    Returns:
+        dict: Datos encontrados (channel_id, channel_name, title, views, likes,
+              length, comment_count, mvm, tags, publish_date). Solo incluye las
+              claves que se pudieron obtener. None si la pagina no tiene
+              ytInitialPlayerResponse.
+    """
+    if not isinstance(html, str):
+        return None
+
+    player_response = extract_json_blob(html, PLAYER_RESPONSE_MARKER)
+    if not isinstance(player_response, dict):
+        return None
+    initial_data = extract_json_blob(html, INITIAL_DATA_MARKER) or {}
+
+    data = {}
+    details = player_response.get('videoDetails', {})
+    microformat = player_response.get('microformat', {}).get('playerMicroformatRenderer', {})
+
+    try:
+        if details.get('channelId'):
+            data['channel_id'] = details['channelId']
+        if microformat.get('ownerChannelName') or details.get('author'):
+            data['channel_name'] = microformat.get('ownerChannelName') or details.get('author')
+        if details.get('title'):
+            data['title'] = details['title']
+        if details.get('viewCount'):
+            data['views'] = int(details['viewCount'])
+        if details.get('lengthSeconds'):
+            data['length'] = get_time_len(int(details['lengthSeconds']))
+        if details.get('keywords'):
+            data['tags'] = format_tags(details['keywords'])
+        if microformat.get('uploadDate') or microformat.get('publishDate'):
+            data['publish_date'] = format_date(microformat.get('uploadDate') or microformat.get('publishDate'))
+    except (ValueError, TypeError) as e:
+        logger.warning(f'Error al interpretar ytInitialPlayerResponse. Error: {e}')
+
+    # Los likes, comentarios y el mapa de calor estan en ytInitialData
+    found = find_keys(initial_data, SEARCH_KEYS)
+    try:
+        for key in SEARCH_KEYS[:4]:
+            likes = parse_count(found.get(key))
+            if likes is not None:
+                data['likes'] = likes
+                break
+        comment_count = parse_count(found.get('commentCount'))
+        if comment_count is not None:
+            data['comment_count'] = comment_count
+        if found.get('decorationTimeMillis') is not None:
+            data['mvm'] = get_time_len(int(found['decorationTimeMillis']) // 1000)
+    except (ValueError, TypeError) as e:
+        logger.warning(f'Error al interpretar ytInitialData. Error: {e}')
+
+    return data
@@ -9,13 +9,13 @@ import os
 
 # Imports de terceros
 import re
-import requests
 import json
 import datetime
 
 # Imports locales
 from src.utils.utils import get_http_response, get_formatted_date, getenv
 from src.database.db import Database
+from src.utils.http_client import http_get
 from src.logger.logger import Logger
 from src.youtube.youtube_api import YoutubeAPI
 
@@ -42,6 +42,10 @@ class YoutubePlaylist:
         'publish_date': "00/00/00",
         'video_ids': [],
     }
+
+    # Atributos de cada objeto. Con __slots__ los objetos ocupan menos memoria
+    # y se serializan mas rapido al volver de los procesos del pool
+    __slots__ = tuple(DEFAULT_VALUES) + ('data_loaded', 'html_content', 'fetch_status', 'save_html')
     
     def __init__(self, playlist_id=None, info_dict=None):
         # Inicialización de la clase
@@ -129,6 +133,14 @@ class YoutubePlaylist:
         if self.DEBUG:
             logger.info(f"Contenido HTML establecido con éxito para la playlist {self.playlist_id}.")
         
+    def release_html(self):
+        """
+        Libera el contenido HTML una vez procesado, salvo que se este
+        depurando o guardando el HTML.
+        """
+        if not (self.DEBUG or self.save_html):
+            self.html_content = None
+
     def fetch_html_content(self, url_type='id', ovr_id=None, scrap_url=None):
         """ 
         Obtiene el contenido HTML de la playlist de YouTube dado.
@@ -247,6 +259,9 @@ class YoutubePlaylist:
 
         except Exception as e:
             logger.warning(f"Fallo al cargar datos mediante scraping de contenido HTML: {e}")
+        finally:
+            # El HTML ya no se necesita una vez extraidos los datos
+            self.release_html()
 
         return False
 
@@ -344,7 +359,7 @@ class YoutubePlaylist:
             # Obtengo el ID desde el formato JSON
             url = f'https://www.youtube.com/oembed?url=http://www.youtube.com/playlist?list={self.playlist_id}&format=json'
             # Obtener la respuesta HTTP
-            response = requests.get(url)
+            response = http_get(url)
             # Transformar a datos JSON
             data = json.loads(response.text)
             # Obtener el título de la playlist
@@ -387,7 +402,7 @@ class YoutubePlaylist:
             # Construir una URL alternativa para hacer scraping si el método principal falla
             url = f'https://www.youtube.com/oembed?url=http://www.youtube.com/playlist?list={self.playlist_id}&format=json'
             # Obtener la respuesta HTTP
-            response = requests.get(url)
+            response = http_get(url)
             # Transformar a datos JSON
             data = json.loads(response.text)
             # Obtener el título de la playlist
@@ -0,0 +1,248 @@
+# Imports estándar de Python
+import os
+import json
+import datetime
+import threading
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+# Imports locales
+from src.logger.logger import Logger
+from src.utils.utils import getenv
+from src.utils.exclusion_store import file_lock
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class QuotaLedger:
+    """
+    Registro del consumo diario de cuota de la API de YouTube.
+
+    Cada solicitud tiene un costo en unidades segun el metodo (COSTS) y el
+    consumo del dia se guarda en un archivo JSON compartido por todos los
+    procesos. La cuota se reinicia a la medianoche de la hora del Pacifico,
+    igual que en la consola de Google.
+
+    Los metodos de OPTIONAL_METHODS solo se ejecutan si despues de pagarlos
+    quedan al menos YOUTUBE_API_QUOTA_RESERVE unidades, de forma que la
+    reserva queda para las solicitudes por lotes (videos().list, etc.).
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_DAILY_QUOTA = 10000 # Unidades por dia del proyecto de Google
+    DEFAULT_RESERVE = 1000 # Unidades reservadas para las solicitudes por lotes
+    DEFAULT_FILENAME = 'youtube_quota.json'
+    DEBUG = False
+
+    # Costo en unidades de cada metodo de la API
+    COSTS = {
+        'search.list': 100,
+        'channels.list': 1,
+        'videos.list': 1,
+        'playlists.list': 1,
+        'playlistItems.list': 1,
+        'subscriptions.list': 1,
+    }
+    DEFAULT_COST = 1
+
+    # Metodos que se omiten cuando la cuota restante entra en la reserva
+    OPTIONAL_METHODS = ['search.list', 'subscriptions.list']
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self, path=None):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.daily_quota = getenv('YOUTUBE_API_DAILY_QUOTA', self.DEFAULT_DAILY_QUOTA)
+            self.reserve = getenv('YOUTUBE_API_QUOTA_RESERVE', self.DEFAULT_RESERVE)
+            self.path = path or self.get_default_path()
+            self.lock = threading.Lock()
+            self.initialized = True
+
+    def get_default_path(self):
+        """
+        Devuelve la ruta por defecto del archivo de consumo.
+        """
+        return os.path.join(os.environ.get('SOFT_RESULTS', ''), 'cache', self.DEFAULT_FILENAME)
+
+    def make_folder(self):
+        """
+        Crea la carpeta del archivo de consumo si no existe.
+        """
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    ############################################################################
+    # Lectura y escritura del consumo
+    ############################################################################
+    @staticmethod
+    def get_quota_day():
+        """
+        Devuelve el dia de cuota actual (hora del Pacifico).
+        """
+        if ZoneInfo is not None:
+            try:
+                return datetime.datetime.now(ZoneInfo('America/Los_Angeles')).strftime('%Y-%m-%d')
+            except Exception:
+                pass
+        # Sin base de zonas horarias uso UTC-8
+        return (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=8)).strftime('%Y-%m-%d')
+
+    def load(self):
+        """
+        Lee el consumo del dia. Si el archivo es de otro dia, el consumo es cero.
+
+        Returns:
+            dict: {'day', 'used', 'calls': {metodo: cantidad}}
+        """
+        day = self.get_quota_day()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                usage = json.load(file)
+            if usage.get('day') == day:
+                return usage
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f'No se pudo leer el consumo de cuota de [{self.path}]. Error: {e}')
+        return {'day': day, 'used': 0, 'calls': {}}
+
+    def save(self, usage):
+        """
+        Guarda el consumo del dia. Se llama con el bloqueo de archivo tomado.
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(usage, file)
+        os.replace(tmp_path, self.path)
+
+    ############################################################################
+    # Consultas
+    ############################################################################
+    def get_cost(self, method):
+        """
+        Devuelve el costo en unidades de un metodo ('videos.list' o
+        'youtube.videos.list').
+        """
+        method = self.normalize_method(method)
+        return self.COSTS.get(method, self.DEFAULT_COST)
+
+    @staticmethod
+    def normalize_method(method):
+        """
+        Convierte el methodId de googleapiclient ('youtube.videos.list') al
+        nombre usado en COSTS ('videos.list').
+        """
+        method = str(method or '')
+        if method.startswith('youtube.'):
+            method = method[len('youtube.'):]
+        return method
+
+    def get_used(self):
+        """Devuelve las unidades consumidas en el dia."""
+        return self.load()['used']
+
+    def get_remaining(self):
+        """Devuelve las unidades que quedan en el dia."""
+        return max(self.daily_quota - self.get_used(), 0)
+
+    def can_spend(self, method):
+        """
+        Indica si hay cuota suficiente para ejecutar un metodo.
+        """
+        method = self.normalize_method(method)
+        remaining = self.get_remaining() - self.get_cost(method)
+        if method in self.OPTIONAL_METHODS:
+            return remaining >= self.reserve
+        return remaining >= 0
+
+    def plan_batch(self, n_ids, method, batch_size=50, per_id_method=None):
+        """
+        Calcula cuantos IDs se pueden pedir por lotes con la cuota restante.
+
+        Args:
+            n_ids (int): Cantidad de IDs a consultar.
+            method (str): Metodo de la API ('videos.list', 'playlists.list').
+            batch_size (int): IDs por solicitud.
+            per_id_method (str, optional): Metodo que ademas se ejecuta al
+                menos una vez por cada ID (por ejemplo 'playlistItems.list'
+                para los videos de cada playlist).
+
+        Returns:
+            int: Cantidad de IDs que se pueden pedir a la API. El resto se
+                 obtiene mediante el HTML.
+        """
+        remaining = self.get_remaining()
+        cost = max(self.get_cost(method), 1)
+        if per_id_method is None:
+            return min(n_ids, (remaining // cost) * batch_size)
+
+        # Cada lote completo cuesta su solicitud mas una solicitud por ID
+        per_id_cost = max(self.get_cost(per_id_method), 1)
+        n_batches, rest = divmod(remaining, cost + batch_size * per_id_cost)
+        n_rest = max(rest - cost, 0) // per_id_cost
+        return min(n_ids, n_batches * batch_size + n_rest)
+
+    ############################################################################
+    # Registro del consumo
+    ############################################################################
+    def charge(self, method, units=None):
+        """
+        Suma al consumo del dia el costo de una solicitud.
+        """
+        method = self.normalize_method(method)
+        units = self.get_cost(method) if units is None else units
+
+        try:
+            self.make_folder()
+            with self.lock, file_lock(self.path):
+                usage = self.load()
+                usage['used'] += units
+                usage['calls'][method] = usage['calls'].get(method, 0) + 1
+                self.save(usage)
+
+            if self.DEBUG:
+                logger.info(f"Cuota de la API de YouTube: {usage['used']}/{self.daily_quota} unidades ({method}).")
+        except Exception as e:
+            logger.error(f'No se pudo registrar el consumo de cuota de [{method}]. Error: {e}')
+
+    def exhaust(self):
+        """
+        Marca la cuota del dia como agotada (la API respondio quotaExceeded).
+        """
+        try:
+            self.make_folder()
+            with self.lock, file_lock(self.path):
+                usage = self.load()
+                usage['used'] = max(usage['used'], self.daily_quota)
+                self.save(usage)
+        except Exception as e:
+            logger.error(f'No se pudo registrar la cuota agotada. Error: {e}')
@@ -0,0 +1,247 @@
+# Imports estándar de Python
+import os
+import datetime
+# import sys
+
+# Añade el directorio raíz del proyecto a sys.path
+# current_path = os.path.dirname(os.path.abspath(__file__))
+# project_root = os.path.abspath(os.path.join(current_path, '..', '..'))  # Ajusta según la estructura de tu proyecto
+# sys.path.append(project_root)
+
+# Imports de terceros
+# Ninguno en este set
+
+# Imports locales
+from src.logger.logger import Logger
+from src.database.db import Database
+from src.utils.utils import getenv
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class RefreshScheduler:
+    """
+    Planifica que videos y shorts de YouTube conviene actualizar en cada
+    corrida segun la velocidad con la que crecen sus vistas.
+
+    Para cada entidad se calculan las vistas por hora a partir de los
+    registros de VIDEO_RECORDS / SHORT_RECORDS de los ultimos dias y se le
+    asigna un intervalo de actualizacion: el tiempo que tarda en sumar
+    YOUTUBE_SCHEDULER_TARGET_VIEWS vistas, acotado entre el intervalo minimo
+    y el maximo. Una entidad vence cuando paso ese intervalo desde su ultimo
+    registro, y entre las vencidas se prioriza a las mas atrasadas hasta
+    completar el presupuesto de la corrida.
+    """
+    ############################################################################
+    # Atributos globables
+    ############################################################################
+    # Atributo de clase para almacenar la instancia única
+    _instance = None
+
+    # Configuraciones por defecto
+    DEFAULT_ENABLE = False
+    DEFAULT_BUDGET = 500 # Entidades de cada tipo por corrida (negativo: sin limite)
+    DEFAULT_MIN_INTERVAL = 6 # Horas
+    DEFAULT_MAX_INTERVAL = 168 # Horas
+    DEFAULT_TARGET_VIEWS = 1000 # Vistas que se quieren entre dos registros
+    DEFAULT_WINDOW = 7 # Dias de historial para medir el crecimiento
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    DEBUG = False
+
+    ############################################################################
+    # Metodos de incializacion
+    ############################################################################
+    # Cuando solicito crear una instancia me aseguro que si ya hay una creada
+    # en este proceso, devuelvo esa misma
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None or cls._instance.pid != os.getpid():
+            cls._instance = super().__new__(cls)
+            cls._instance.pid = os.getpid()
+        return cls._instance
+
+    def __init__(self):
+        # Evitar la inicialización múltiple
+        # verificando si existe el atributo initialized en la clase
+        if not hasattr(self, 'initialized'):
+            self.enable = getenv('YOUTUBE_SCHEDULER_ENABLE', self.DEFAULT_ENABLE)
+            self.budget = getenv('YOUTUBE_SCHEDULER_BUDGET', self.DEFAULT_BUDGET)
+            self.min_interval = getenv('YOUTUBE_SCHEDULER_MIN_INTERVAL', self.DEFAULT_MIN_INTERVAL)
+            self.max_interval = getenv('YOUTUBE_SCHEDULER_MAX_INTERVAL', self.DEFAULT_MAX_INTERVAL)
+            self.target_views = getenv('YOUTUBE_SCHEDULER_TARGET_VIEWS', self.DEFAULT_TARGET_VIEWS)
+            self.window = getenv('YOUTUBE_SCHEDULER_WINDOW', self.DEFAULT_WINDOW)
+
+            # Comprobaciones de seguridad
+            self.min_interval = max(self.min_interval, 0)
+            self.max_interval = max(self.max_interval, self.min_interval)
+            self.initialized = True
+
+    def is_enabled(self):
+        """
+        Indica si la planificacion por velocidad esta habilitada.
+        """
+        return bool(self.enable)
+
+    ############################################################################
+    # Calculo de prioridades
+    ############################################################################
+    def get_interval(self, n_records, views_delta, hours):
+        """
+        Calcula cada cuantas horas conviene actualizar una entidad.
+
+        Args:
+            n_records (int): Cantidad de registros dentro de la ventana.
+            views_delta (int): Vistas ganadas entre el primer y el ultimo registro.
+            hours (float): Horas entre el primer y el ultimo registro.
+
+        Returns:
+            float: Intervalo de actualizacion en horas.
+        """
+        # Sin al menos dos registros no se puede medir el crecimiento, asi que
+        # se vuelve a medir lo antes posible
+        if not n_records or n_records < 2 or not hours or hours <= 0:
+            return self.min_interval
+
+        velocity = max(views_delta or 0, 0) / hours
+        if velocity <= 0:
+            return self.max_interval
+
+        return min(max(self.target_views / velocity, self.min_interval), self.max_interval)
+
+    def get_schedule(self, kind, channel_ids, now=None):
+        """
+        Arma el plan de actualizacion de los videos o shorts de varios canales.
+
+        Args:
+            kind (str): 'video' o 'short'.
+            channel_ids (list): IDs de los canales.
+            now (datetime, optional): Momento de referencia.
+
+        Returns:
+            list: Lista de diccionarios con las claves 'channel_id', 'id',
+                  'interval', 'next_due' y 'priority', ordenada de mayor a
+                  menor prioridad. La prioridad es el tiempo transcurrido
+                  desde el ultimo registro sobre el intervalo, por lo que
+                  una entidad esta vencida si su prioridad es al menos 1.
+        """
+        now = now or datetime.datetime.now()
+        since = (now - datetime.timedelta(days=self.window)).strftime(self.DATE_FORMAT)
+
+        try:
+            with Database() as db:
+                stats = db.get_youtube_refresh_stats(kind, channel_ids, since)
+        except Exception as e:
+            logger.error(f'Error al obtener el historial de {kind}s para planificar la actualizacion. Error: {e}')
+            return []
+
+        schedule = []
+        for channel_id, entity_id, last_update, n_records, views_delta, hours in stats:
+            interval = self.get_interval(n_records, views_delta, hours)
+            try:
+                last_update = datetime.datetime.strptime(str(last_update)[:19], self.DATE_FORMAT)
+                elapsed = (now - last_update).total_seconds() / 3600
+            except ValueError:
+                # Si la fecha no es valida la considero vencida
+                last_update = None
+                elapsed = float('inf')
+
+            schedule.append({
+                'channel_id': channel_id,
+                'id': entity_id,
+                'interval': interval,
+                'next_due': last_update + datetime.timedelta(hours=interval) if last_update else now,
+                'priority': elapsed / interval if interval > 0 else float('inf'),
+            })
+
+        schedule.sort(key=lambda x: x['priority'], reverse=True)
+        return schedule
+
+    def select_due(self, schedule, channel_limits=None):
+        """
+        Selecciona las entidades vencidas respetando el limite de cada canal
+        y el presupuesto de la corrida.
+
+        Args:
+            schedule (list): Plan devuelto por get_schedule().
+            channel_limits (dict, optional): {channel_id: limite}. Un limite
+                negativo o None indica sin limite.
+
+        Returns:
+            dict: {channel_id: [IDs]} ordenados de mayor a menor prioridad.
+        """
+        channel_limits = channel_limits or {}
+        due = {}
+        total = 0
+        for entry in schedule:
+            if entry['priority'] < 1:
+                break
+            if self.budget >= 0 and total >= self.budget:
+                break
+
+            ids = due.setdefault(entry['channel_id'], [])
+            limit = channel_limits.get(entry['channel_id'])
+            if limit is not None and 0 <= limit <= len(ids):
+                continue
+
+            ids.append(entry['id'])
+            total += 1
+
+        return due
+
+    ############################################################################
+    # Consultas
+    ############################################################################
+    def get_due(self, kind, channel_limits, now=None):
+        """
+        Devuelve los videos o shorts guardados en la base de datos que vencen
+        en esta corrida.
+
+        Args:
+            kind (str): 'video' o 'short'.
+            channel_limits (dict): {channel_id: limite}.
+            now (datetime, optional): Momento de referencia.
+
+        Returns:
+            dict: {channel_id: [IDs]}.
+        """
+        schedule = self.get_schedule(kind, list(channel_limits), now)
+        due = self.select_due(schedule, channel_limits)
+
+        if self.DEBUG:
+            logger.info(f'Se planificaron {sum(len(x) for x in due.values())} {kind}s vencidos de {len(schedule)} en la base de datos.')
+
+        return {channel_id: due.get(channel_id, []) for channel_id in channel_limits}
+
+    def filter_due(self, kind, id_lists, now=None):
+        """
+        Filtra listas de IDs de cada canal dejando los que no estan en la
+        base de datos (todavia no tienen registros) y los que vencen en esta
+        corrida, sin cambiar el orden.
+
+        Args:
+            kind (str): 'video' o 'short'.
+            id_lists (dict): {channel_id: [IDs]}.
+            now (datetime, optional): Momento de referencia.
+
+        Returns:
+            dict: {channel_id: [IDs]}.
+        """
+        schedule = self.get_schedule(kind, list(id_lists), now)
+
+        # Solo compito por el presupuesto con los IDs que se pidieron
+        requested = {(channel_id, x) for channel_id, ids in id_lists.items() for x in ids}
+        known = {(x['channel_id'], x['id']) for x in schedule}
+        due = self.select_due([x for x in schedule if (x['channel_id'], x['id']) in requested])
+        due = {(channel_id, x) for channel_id, ids in due.items() for x in ids}
+
+        filtered = {
+            channel_id: [x for x in ids if (channel_id, x) not in known or (channel_id, x) in due]
+            for channel_id, ids in id_lists.items()
+        }
+
+        if self.DEBUG:
+            skipped = sum(len(x) for x in id_lists.values()) - sum(len(x) for x in filtered.values())
+            logger.info(f'Se omitieron {skipped} {kind}s que todavia no vencen.')
+
+        return filtered
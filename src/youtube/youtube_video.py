@@ -10,15 +10,16 @@ import os
 # Imports de terceros
 import re
 import json
-import requests
 from pytube import YouTube
 from datetime import datetime
 from bs4 import BeautifulSoup
 
 # Imports locales
 from src.utils.utils import get_http_response, get_formatted_date, clean_and_parse_number, getenv, get_time_len, is_video_online
+from src.utils.http_client import http_get
 from src.logger.logger import Logger
 from src.youtube.youtube_api import YoutubeAPI
+from src.youtube.youtube_page import parse_watch_page
 
 ################################################################################
 # Genero una instancia del Logger
@@ -45,6 +46,10 @@ class YoutubeVideo:
         'tags': "None",
         'publish_date': "00/00/00"
     }
+
+    # Atributos de cada objeto. Con __slots__ los objetos ocupan menos memoria
+    # y se serializan mas rapido al volver de los procesos del pool
+    __slots__ = tuple(DEFAULT_VALUES) + ('data_loaded', 'html_content', 'fetch_status', 'save_html')
     
     def __init__(self, video_id=None, info_dict=None):
         # Inicialización de la clase
@@ -134,6 +139,14 @@ class YoutubeVideo:
         if self.DEBUG:
             logger.info(f"Contenido HTML establecido con éxito para el video [{self.video_id}].")
         
+    def release_html(self):
+        """
+        Libera el contenido HTML una vez procesado, salvo que se este
+        depurando o guardando el HTML.
+        """
+        if not (self.DEBUG or self.save_html):
+            self.html_content = None
+
     def fetch_html_content(self, url_type='id', ovr_id=None, scrap_url=None):
         """ 
         Obtiene el contenido HTML del video de YouTube dado.
@@ -229,20 +242,27 @@ class YoutubeVideo:
             if self.save_html:
                 self.save_html_content()
 
-            # Crear el diccionario para los datos
-            video_data = {
-                'video_id': self.video_id,  # Tiene que estar siempre este campo
-                'channel_id': self._fetch_channel_id(),
-                'channel_name': self._fetch_channel_name(),
-                'title': self._fetch_video_title(),
-                'views': self._fetch_video_views(),
-                'mvm': self._fetch_most_viewed_moment(),
-                'publish_date': self._fetch_publish_date(),
-                'likes': self._fetch_video_likes(),
-                'length': self._fetch_video_length(),
-                'tags': self._fetch_video_tags(),
-                'comment_count': self._fetch_video_comments_count()
-            }
+            # Intento obtener todos los datos de una sola vez a partir de
+            # ytInitialPlayerResponse y ytInitialData
+            page_data = parse_watch_page(self.html_content)
+            if page_data is not None:
+                video_data = {key: page_data.get(key, value) for key, value in self.DEFAULT_VALUES.items()}
+                video_data['video_id'] = self.video_id # Tiene que estar siempre este campo
+            else:
+                # Si la pagina no tiene los datos embebidos uso los patrones de cada campo
+                video_data = {
+                    'video_id': self.video_id,  # Tiene que estar siempre este campo
+                    'channel_id': self._fetch_channel_id(),
+                    'channel_name': self._fetch_channel_name(),
+                    'title': self._fetch_video_title(),
+                    'views': self._fetch_video_views(),
+                    'mvm': self._fetch_most_viewed_moment(),
+                    'publish_date': self._fetch_publish_date(),
+                    'likes': self._fetch_video_likes(),
+                    'length': self._fetch_video_length(),
+                    'tags': self._fetch_video_tags(),
+                    'comment_count': self._fetch_video_comments_count()
+                }
 
             # Actualiza la información del video con los datos obtenidos del scraping
             self.load_from_dict(video_data)
@@ -252,6 +272,9 @@ class YoutubeVideo:
 
         except Exception as e:
             logger.warning(f"Fallo al cargar datos mediante scraping de contenido HTML: {e}")
+        finally:
+            # El HTML ya no se necesita una vez extraidos los datos
+            self.release_html()
 
         return False
 
@@ -355,7 +378,7 @@ class YoutubeVideo:
             # Construir una URL alternativa para hacer scraping si el método principal falla
             url = f'https://www.youtube.com/oembed?url=http://www.youtube.com/watch?v={self.video_id}&format=json'
             # Obtener la respuesta HTTP
-            response = requests.get(url)
+            response = http_get(url)
             # Transformar a datos JSON
             data = json.loads(response.text)
             # Obtener el título del video
@@ -0,0 +1,75 @@
+# Imports estándar de Python
+import os
+import sys
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch, Mock
+
+# Imports locales
+from src.utils.async_http import AsyncFetcher
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestAsyncFetcher(unittest.TestCase):
+
+    @patch('src.utils.async_http.aiohttp', None)
+    @patch('src.utils.async_http.http_get')
+    def test_fetch_texts_partial_results(self, mock_get):
+        # Simula una URL que responde bien, una con error HTTP y una que falla
+        def fake_get(url, timeout=None):
+            if 'boom' in url:
+                raise RuntimeError('Error de conexion')
+            return Mock(status_code=200 if 'ok' in url else 404, text=f'<html>{url}</html>')
+        mock_get.side_effect = fake_get
+
+        fetcher = AsyncFetcher(max_concurrency=4, max_per_host=2, retry_attempts=0)
+        urls = ['https://a.com/ok', 'https://a.com/bad', 'https://b.com/boom', 'https://a.com/ok']
+        results = fetcher.fetch_texts(urls)
+
+        # Las URLs repetidas se descargan una sola vez
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(results['https://a.com/ok'], '<html>https://a.com/ok</html>')
+        self.assertIsNone(results['https://a.com/bad'])
+        self.assertIsNone(results['https://b.com/boom'])
+
+    @patch('src.utils.async_http.aiohttp', None)
+    @patch('src.utils.async_http.http_get')
+    def test_fetch_texts_callback(self, mock_get):
+        # Cada pagina se procesa apenas se descarga y solo se guarda el resultado
+        mock_get.side_effect = lambda url, timeout=None: Mock(status_code=404 if 'bad' in url else 200, text=f'<html>{url}</html>')
+        processed = []
+        def callback(url, text):
+            processed.append(url)
+            return None if text is None else len(text)
+
+        fetcher = AsyncFetcher(max_concurrency=4, max_per_host=2, retry_attempts=0)
+        results = fetcher.fetch_texts(['https://a.com/ok', 'https://a.com/bad'], callback=callback)
+
+        self.assertEqual(sorted(processed), ['https://a.com/bad', 'https://a.com/ok'])
+        self.assertEqual(results, {'https://a.com/ok': len('<html>https://a.com/ok</html>'), 'https://a.com/bad': None})
+
+    @patch('src.utils.async_http.get_http_archive', return_value=None)
+    @patch('src.utils.async_http.get_http_cache')
+    def test_cached_urls_use_shared_session(self, mock_cache, mock_archive):
+        # Solo las URLs con TTL en la cache HTTP evitan la sesion de aiohttp
+        mock_cache.return_value.get_ttl.side_effect = lambda url: 3600 if 'shorts' in url else 0
+        fetcher = AsyncFetcher()
+        self.assertTrue(fetcher._use_shared_session('https://www.youtube.com/channel/UC1/shorts'))
+        self.assertFalse(fetcher._use_shared_session('https://www.youtube.com/watch?v=abc'))
+
+        # Al grabar o reproducir paginas todas pasan por el archivo
+        mock_archive.return_value = Mock()
+        self.assertTrue(fetcher._use_shared_session('https://www.youtube.com/watch?v=abc'))
+
+if __name__ == '__main__':
+    unittest.main()
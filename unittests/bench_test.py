@@ -0,0 +1,78 @@
+# Imports estándar de Python
+import os
+import sys
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import Mock
+
+# Imports locales
+from src.bench.bench import summarize, compare_with_baseline, get_case_url
+from src.utils.http_archive import HttpArchive
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestBench(unittest.TestCase):
+
+    def test_summarize(self):
+        stats = summarize([0.001 * x for x in range(1, 101)])
+        self.assertEqual(stats['n'], 100)
+        self.assertAlmostEqual(stats['p50_ms'], 50.0)
+        self.assertAlmostEqual(stats['p95_ms'], 95.0)
+        self.assertGreater(stats['throughput'], 0)
+
+    def test_compare_with_baseline(self):
+        baseline = {'results': {'db.insert_video_record': {'p95_ms': 1.0, 'throughput': 1000.0}}}
+        results = {'db.insert_video_record': {'p95_ms': 2.0, 'throughput': 950.0}}
+
+        regressions = compare_with_baseline(results, baseline, tolerance=0.2)
+        self.assertEqual([x['metric'] for x in regressions], ['p95_ms'])
+
+    def test_case_url(self):
+        self.assertEqual(get_case_url('meli_listing', 'Toy Story'), 'https://listado.mercadolibre.com.ar/toy+story/')
+
+class TestHttpArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        HttpArchive._instance = None
+        self.archive = HttpArchive()
+        self.archive.path = self.tmp_dir.name
+
+    def tearDown(self):
+        HttpArchive._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_record_and_replay(self):
+        url = 'https://www.example.com/page'
+        response = Mock()
+        response.status_code = 200
+        response.headers = {'ETag': '"abc"'}
+        response.content = b'<html>ok</html>'
+        response.encoding = 'utf-8'
+        session = Mock()
+        session.get.return_value = response
+
+        self.archive.mode = 'record'
+        self.archive.get(session, url)
+        self.assertTrue(self.archive.has(url))
+
+        # Al reproducir no se consulta al servidor
+        self.archive.mode = 'replay'
+        replayed = self.archive.get(session, url)
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(replayed.content, b'<html>ok</html>')
+        self.assertEqual(self.archive.get(session, 'https://www.example.com/missing').status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
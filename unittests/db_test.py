@@ -0,0 +1,153 @@
+# Imports estándar de Python
+import os
+import sys
+import sqlite3
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch
+
+# Imports locales
+from src.database.db import Database
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class DatabaseTestCase(unittest.TestCase):
+    """Crea una base de datos nueva en un directorio temporal para cada test."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'test.db')
+        with patch.dict(os.environ, {'DB_NAME': self.db_path}):
+            self.db = Database()
+
+    def tearDown(self):
+        self.db.db_close()
+        self.tmp_dir.cleanup()
+
+    def count_from_other_connection(self, table):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        finally:
+            conn.close()
+
+class TestBulk(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.exec('CREATE TABLE TEST_ROWS (ID INTEGER PRIMARY KEY, VALUE TEXT)')
+
+    def test_invalid_row_falls_back_to_single_rows(self):
+        with self.db.bulk():
+            self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (1, 'a'))
+            self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (1, 'duplicado'))
+            self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (2, 'b'))
+
+        # El lote falla por la clave repetida, pero las filas validas se escriben
+        self.assertEqual(self.db.select('SELECT ID, VALUE FROM TEST_ROWS ORDER BY ID'), [(1, 'a'), (2, 'b')])
+
+    def test_select_sees_pending_rows_and_failed_select_keeps_them(self):
+        with self.db.bulk():
+            self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (1, 'a'))
+            self.assertEqual(self.db.select('SELECT COUNT(*) FROM TEST_ROWS'), [(1,)])
+
+            # Una lectura invalida no descarta las filas ya volcadas
+            self.assertIsNone(self.db.select('SELECT * FROM TABLA_INEXISTENTE'))
+            self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (2, 'b'))
+
+        self.assertEqual(self.count_from_other_connection('TEST_ROWS'), 2)
+
+    def test_nested_blocks_commit_once(self):
+        with self.db.bulk():
+            with self.db.bulk():
+                self.db.exec('INSERT INTO TEST_ROWS VALUES (?, ?)', (1, 'a'))
+            self.db.select('SELECT COUNT(*) FROM TEST_ROWS')
+
+            # El bloque interno no confirma la transaccion
+            self.assertEqual(self.db.bulk_depth, 1)
+            self.assertTrue(self.db.conn.in_transaction)
+
+        self.assertEqual(self.db.bulk_depth, 0)
+        self.assertEqual(self.count_from_other_connection('TEST_ROWS'), 1)
+
+    def test_failed_commit_is_reported(self):
+        # La clave foranea diferida solo se verifica al confirmar la transaccion
+        self.db.exec('CREATE TABLE TEST_PARENT (ID INTEGER PRIMARY KEY)')
+        self.db.exec('CREATE TABLE TEST_CHILD (ID INTEGER, PARENT_ID INTEGER REFERENCES TEST_PARENT(ID) DEFERRABLE INITIALLY DEFERRED)')
+        self.db.exec('PRAGMA foreign_keys = ON')
+
+        with self.db.bulk():
+            self.db.exec('INSERT INTO TEST_CHILD VALUES (?, ?)', (1, 99))
+        self.assertFalse(self.db.bulk_success)
+        self.assertEqual(self.count_from_other_connection('TEST_CHILD'), 0)
+
+        with self.db.bulk():
+            self.db.exec('INSERT INTO TEST_PARENT VALUES (?)', (99,))
+            self.db.exec('INSERT INTO TEST_CHILD VALUES (?, ?)', (1, 99))
+        self.assertTrue(self.db.bulk_success)
+
+class TestLatestTables(DatabaseTestCase):
+
+    def insert_video_record(self, video_id, views, update_date):
+        self.db.exec(
+            'INSERT INTO VIDEO_RECORDS (VIDEO_ID, VIEWS, LIKES, UPDATE_DATE) VALUES (?, ?, ?, ?)',
+            (video_id, views, 0, update_date)
+        )
+
+    def get_latest(self, video_id):
+        return self.db.select('SELECT VIEWS, UPDATE_DATE FROM VIDEO_LATEST WHERE VIDEO_ID = ?', (video_id,))
+
+    def test_migrations_are_applied(self):
+        self.assertEqual(self.db.get_schema_version(), Database.MIGRATIONS[-1][0])
+
+    def test_out_of_order_insert_keeps_newest(self):
+        self.insert_video_record('v1', 200, '2024-01-02 00:00:00')
+        self.insert_video_record('v1', 100, '2024-01-01 00:00:00')
+        self.assertEqual(self.get_latest('v1'), [(200, '2024-01-02 00:00:00')])
+
+    def test_delete_latest_repopulates_from_history(self):
+        self.insert_video_record('v1', 100, '2024-01-01 00:00:00')
+        self.insert_video_record('v1', 200, '2024-01-02 00:00:00')
+
+        self.db.exec("DELETE FROM VIDEO_RECORDS WHERE VIDEO_ID = 'v1' AND UPDATE_DATE = '2024-01-02 00:00:00'")
+        self.assertEqual(self.get_latest('v1'), [(100, '2024-01-01 00:00:00')])
+
+        # Al borrar el ultimo registro el video desaparece de la tabla
+        self.db.exec("DELETE FROM VIDEO_RECORDS WHERE VIDEO_ID = 'v1'")
+        self.assertEqual(self.get_latest('v1'), [])
+
+    def test_backfill_matches_max_update_date(self):
+        for idx, (video_id, update_date) in enumerate([
+            ('v1', '2024-01-03 00:00:00'), ('v1', '2024-01-01 00:00:00'),
+            ('v2', '2024-02-01 00:00:00'), ('v3', '2024-01-05 00:00:00'), ('v3', '2024-01-07 00:00:00'),
+        ]):
+            self.insert_video_record(video_id, idx, update_date)
+
+        # Borro la tabla y la reconstruyo desde el historial
+        self.db.exec('DELETE FROM VIDEO_LATEST')
+        self.db.backfill_latest_tables()
+
+        expected = self.db.select('SELECT VIDEO_ID, MAX(UPDATE_DATE) FROM VIDEO_RECORDS GROUP BY VIDEO_ID ORDER BY VIDEO_ID')
+        latest = self.db.select('SELECT VIDEO_ID, UPDATE_DATE FROM VIDEO_LATEST ORDER BY VIDEO_ID')
+        self.assertEqual(latest, expected)
+
+    def test_similarweb_latest_ignores_missing_rank(self):
+        query = 'INSERT INTO SIMILARWEB_RECORDS (DOMAIN_ID, GLOBAL_RANK, UPDATE_DATE) VALUES (?, ?, ?)'
+        self.db.exec(query, (1, 5, '2024-01-01 00:00:00'))
+        self.db.exec(query, (1, 0, '2024-01-02 00:00:00'))
+        self.db.backfill_latest_tables()
+        self.assertEqual(self.db.select('SELECT GLOBAL_RANK, UPDATE_DATE FROM SIMILARWEB_LATEST WHERE DOMAIN_ID = 1'), [(5, '2024-01-01 00:00:00')])
+
+if __name__ == '__main__':
+    unittest.main()
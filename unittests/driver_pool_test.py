@@ -0,0 +1,173 @@
+# Imports estándar de Python
+import os
+import sys
+import time
+import threading
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch, Mock
+
+# Imports locales
+from src.utils.driver import Driver, NetworkIdle
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class FakeBrowser:
+    """Navegador falso que registra las URLs abiertas."""
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    created = 0
+
+    def __init__(self, fail_urls=()):
+        self.fail_urls = set(fail_urls)
+        self.page_source = ''
+        with FakeBrowser.lock:
+            FakeBrowser.created += 1
+
+    def get(self, url):
+        if url in self.fail_urls:
+            self.fail_urls.discard(url)
+            raise RuntimeError('El navegador se cayo')
+        with FakeBrowser.lock:
+            FakeBrowser.active += 1
+            FakeBrowser.max_active = max(FakeBrowser.max_active, FakeBrowser.active)
+        time.sleep(0.02)
+        self.page_source = f'<html>{url}</html>'
+        with FakeBrowser.lock:
+            FakeBrowser.active -= 1
+
+    def execute_script(self, script):
+        return ['complete', 1]
+
+    def quit(self):
+        pass
+
+class TestDriverPool(unittest.TestCase):
+
+    def setUp(self):
+        FakeBrowser.active = FakeBrowser.max_active = FakeBrowser.created = 0
+        self.driver = Driver()
+        self.driver.max_concurrent = 3
+        self.saved = {}
+        self.driver.save_html_to_file = lambda key, filename: self.saved.__setitem__(filename, self.driver.html_contents[key])
+
+    def tearDown(self):
+        self.driver.cleanup()
+
+    def test_pool_opens_all_urls_concurrently(self):
+        urls = [f'https://www.example.com/{i}' for i in range(12)]
+        with patch.object(Driver, 'set_driver', side_effect=lambda browser=None: FakeBrowser()):
+            self.driver.open_multiple_urls(urls)
+
+        self.assertEqual(len(self.saved), 12)
+        self.assertGreater(FakeBrowser.max_active, 1)
+        self.assertLessEqual(FakeBrowser.max_active, 3)
+
+        # Los navegadores quedan abiertos para la proxima llamada
+        self.assertEqual(FakeBrowser.created, 3)
+        self.assertEqual(len(self.driver.drivers), 3)
+
+    def test_recycle_and_crash(self):
+        self.driver.max_concurrent = 1
+        self.driver.recycle_pages = 2
+        urls = [f'https://www.example.com/{i}' for i in range(4)]
+        browsers = iter([FakeBrowser(fail_urls=[urls[1]]), FakeBrowser(), FakeBrowser()])
+        with patch.object(Driver, 'set_driver', side_effect=lambda browser=None: next(browsers)):
+            self.driver.open_multiple_urls(urls)
+
+        # La URL que fallo se reintenta en un navegador nuevo
+        self.assertEqual(len(self.saved), 4)
+        self.assertEqual(FakeBrowser.created, 3)
+
+    def test_iter_pages_in_memory(self):
+        self.driver.save_html = False
+        urls = [f'https://www.example.com/{i}' for i in range(6)]
+        with patch.object(Driver, 'set_driver', side_effect=lambda browser=None: FakeBrowser()):
+            pages = dict(self.driver.iter_multiple_urls(urls))
+
+        # Se devuelven las URLs tal como se pidieron y no se escribe a disco
+        self.assertEqual(set(pages), set(urls))
+        self.assertEqual(pages[urls[0]], '<html>https://www.example.com/0</html>')
+        self.assertEqual(self.saved, {})
+
+class TestLeanProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = Driver()
+
+    def test_lean_options(self):
+        options = Mock()
+        self.driver._set_lean_options('firefox', options)
+        self.assertEqual(options.page_load_strategy, 'eager')
+        options.set_preference.assert_any_call('permissions.default.image', 2)
+
+        # En Chrome el bloqueo se hace por URL con DevTools
+        browser = Mock()
+        self.driver._block_resources('chrome', browser)
+        browser.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': Driver.BLOCKED_URL_PATTERNS})
+
+    def test_network_idle(self):
+        browser = Mock()
+        browser.execute_script.side_effect = [['loading', 3], ['interactive', 5], ['interactive', 5], ['complete', 5]]
+        condition = NetworkIdle(idle_time=0.05)
+        self.assertFalse(condition(browser))
+        self.assertFalse(condition(browser))
+
+        # Sin pedidos nuevos durante idle_time la red se considera inactiva
+        self.assertFalse(condition(browser))
+        time.sleep(0.06)
+        self.assertTrue(condition(browser))
+
+class TestPinnedDrivers(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp_dir.name, 'chromedriver')
+        with open(self.source, 'w') as file:
+            file.write('binario')
+        self.install = Mock(return_value=self.source)
+        self.driver = Driver()
+        self.driver.drivers_path = os.path.join(self.tmp_dir.name, 'drivers')
+        self.driver._get_browser_options = lambda browser: {'driver_manager': lambda: Mock(install=self.install)}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_resolve_once_and_reuse(self):
+        path = self.driver.get_driver_path('chrome')
+        self.assertEqual(path, os.path.join(self.driver.drivers_path, 'chrome', 'chromedriver'))
+        self.assertTrue(os.path.isfile(path))
+        self.assertEqual(self.driver.load_manifest()['chrome']['path'], path)
+
+        # Otro driver usa el binario fijado sin consultar a webdriver_manager
+        other = Driver()
+        other.drivers_path = self.driver.drivers_path
+        other.auto_resolve = False
+        other._get_browser_options = self.driver._get_browser_options
+        self.assertEqual(other.get_driver_path('chrome'), path)
+        self.install.assert_called_once()
+
+        # Solo se vuelve a descargar si se pide explicitamente
+        self.driver.resolve_drivers(['chrome'])
+        self.assertEqual(self.install.call_count, 2)
+
+    def test_missing_binary_without_auto_resolve(self):
+        self.driver.auto_resolve = False
+        with self.assertRaises(FileNotFoundError):
+            self.driver.resolve_driver('chrome')
+        self.install.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# Imports estándar de Python
+import os
+import sys
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from multiprocessing import Pool
+
+# Imports locales
+from src.utils.exclusion_store import ExclusionStore
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+def add_ids(args):
+    file_path, ids = args
+    ExclusionStore().add(file_path, ids)
+
+class TestExclusionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, 'excluded_test_ids.dat')
+        ExclusionStore._instance = None
+        self.store = ExclusionStore()
+
+    def tearDown(self):
+        ExclusionStore._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_add_and_get(self):
+        self.assertEqual(self.store.get(self.file_path), frozenset())
+        self.store.add(self.file_path, ['b', 'a', 'b'])
+        self.store.add(self.file_path, ['a', 'c'])
+        self.assertEqual(self.store.get(self.file_path), {'a', 'b', 'c'})
+
+        # Los valores ya presentes no se vuelven a escribir
+        with open(self.file_path) as file:
+            self.assertEqual(file.read().split(), ['b', 'a', 'c'])
+
+    def test_reads_lines_appended_by_other_process(self):
+        self.store.add(self.file_path, ['a'])
+        with open(self.file_path, 'a') as file:
+            file.write('x\ny')
+        self.assertEqual(self.store.get(self.file_path), {'a', 'x'})
+
+        # La linea sin terminar se lee cuando se completa
+        with open(self.file_path, 'a') as file:
+            file.write('\n')
+        self.assertEqual(self.store.get(self.file_path), {'a', 'x', 'y'})
+
+    def test_compaction_and_remove(self):
+        with open(self.file_path, 'w') as file:
+            file.write('a\n' * (ExclusionStore.COMPACT_MIN_LINES + 1))
+        self.store.add(self.file_path, ['b'])
+        with open(self.file_path) as file:
+            self.assertEqual(file.read().split(), ['a', 'b'])
+
+        self.store.remove(self.file_path, ['a'])
+        self.assertEqual(self.store.get(self.file_path), {'b'})
+
+    def test_concurrent_workers(self):
+        chunks = [(self.file_path, [f'{i}_{j}' for j in range(50)]) for i in range(4)]
+        with Pool(4) as pool:
+            pool.map(add_ids, chunks)
+        self.assertEqual(len(self.store.get(self.file_path)), 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# Imports estándar de Python
+import os
+import sys
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+
+# Imports locales
+from src.utils.executor import ExecutorService
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestExecutorService(unittest.TestCase):
+
+    def tearDown(self):
+        ExecutorService().shutdown()
+
+    def test_singleton(self):
+        self.assertIs(ExecutorService(), ExecutorService())
+
+    def test_map_reuses_lazy_executor(self):
+        executor = ExecutorService()
+        executor.backends = {'test': 'thread'}
+        self.assertEqual(executor.executors, {})
+
+        self.assertEqual(executor.map(abs, [-1, 2, -3], task_type='test'), [1, 2, 3])
+        pool = executor.executors['thread']
+        self.assertEqual(executor.map(abs, [-4], task_type='test'), [4])
+        self.assertIs(executor.executors['thread'], pool)
+
+        executor.shutdown()
+        self.assertEqual(executor.executors, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Imports estándar de Python
+import os
+import sys
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import Mock
+
+# Imports locales
+from src.utils.http_cache import HttpCache
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+def make_response(status_code=200, content=b'<html></html>', headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.encoding = 'utf-8'
+    response.headers = headers or {}
+    return response
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        HttpCache._instance = None
+        self.cache = HttpCache(path=os.path.join(self.tmp_dir.name, 'http_cache.db'))
+        self.cache.ttl = 0
+        self.cache.domain_ttl = {'example.com': 3600}
+        self.cache.connect()
+        self.session = Mock()
+
+    def tearDown(self):
+        self.cache.close()
+        HttpCache._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_domain_ttl_includes_subdomains(self):
+        self.assertEqual(self.cache.get_ttl('https://www.example.com/page'), 3600)
+        self.assertEqual(self.cache.get_ttl('https://other.org/page'), 0)
+
+    def test_path_ttl(self):
+        self.cache.domain_ttl = {'youtube.com/channel/*/shorts': 3600, 'ebay.com': 600}
+        self.assertEqual(self.cache.get_ttl('https://www.youtube.com/channel/UC123/shorts'), 3600)
+        self.assertEqual(self.cache.get_ttl('https://www.ebay.com/sch/i.html'), 600)
+
+        # Las paginas de las que se guardan estadisticas no usan el TTL
+        self.assertEqual(self.cache.get_ttl('https://www.youtube.com/watch?v=abc'), 0)
+        self.assertEqual(self.cache.get_ttl('https://www.youtube.com/channel/UC123'), 0)
+
+    def test_fresh_entry_skips_request(self):
+        self.session.get.return_value = make_response()
+        url = 'https://www.example.com/page'
+
+        first = self.cache.get(self.session, url)
+        second = self.cache.get(self.session, url)
+
+        self.assertEqual(self.session.get.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second.status_code, 200)
+
+    def test_stale_entry_is_revalidated(self):
+        url = 'https://www.example.com/page'
+        self.session.get.return_value = make_response(headers={'ETag': '"abc"'})
+        self.cache.get(self.session, url)
+
+        # Venzo la entrada guardada
+        self.cache.conn.execute('UPDATE HTTP_CACHE SET STORED_AT = 0')
+
+        # El servidor confirma que el contenido no cambio
+        self.session.get.return_value = make_response(status_code=304, content=b'')
+        response = self.cache.get(self.session, url)
+
+        _, kwargs = self.session.get.call_args
+        self.assertEqual(kwargs['headers']['If-None-Match'], '"abc"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'<html></html>')
+
+    def test_errors_are_not_stored(self):
+        self.session.get.return_value = make_response(status_code=404)
+        url = 'https://www.example.com/missing'
+        self.cache.get(self.session, url)
+        self.assertIsNone(self.cache.load(self.cache.make_key(url)))
+
+    def test_zero_ttl_is_not_cached(self):
+        # Aunque el servidor permita revalidarla, la pagina se pide siempre completa
+        self.session.get.return_value = make_response(headers={'ETag': '"abc"'})
+        url = 'https://socialcounts.org/youtube-live-subscriber-count/UC123'
+
+        self.cache.get(self.session, url)
+        self.cache.get(self.session, url)
+
+        self.assertEqual(self.session.get.call_count, 2)
+        _, kwargs = self.session.get.call_args
+        self.assertIsNone(kwargs['headers'])
+        self.assertIsNone(self.cache.load(self.cache.make_key(url)))
+
+if __name__ == '__main__':
+    unittest.main()
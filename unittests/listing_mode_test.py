@@ -0,0 +1,171 @@
+# Imports estándar de Python
+import os
+import sys
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+
+# Imports locales
+from src.products.meli_utils import MeLiProductListings
+from src.products.alibaba_utils import AlibabaProductListings
+from src.products.ebay_utils import EbayProductListings
+from src.news.google_news import GoogleNewsListings
+from src.utils.utils import make_soup, DEFAULT_HTML_PARSER
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+################################################################################
+# Paginas de listado de prueba
+################################################################################
+MELI_LISTING = """
+<html><body><ol>
+  <li><div class="ui-search-result__wrapper">
+    <a class="poly-component__title" href="https://articulo.mercadolibre.com.ar/MLA-1400000001-muneco-woody-_JM#position=1">link</a>
+    <h2 class="poly-box">Muñeco Woody Toy Story</h2>
+    <span class="andes-money-amount__currency-symbol">$</span>
+    <span class="andes-money-amount__fraction">25.999</span>
+    <span class="ui-search-installments">Mismo precio en 6 cuotas</span>
+    <p class="ui-search-official-store-label">por Disney</p>
+    <span class="ui-search-reviews__amount">(42)</span>
+  </div></li>
+  <li><div class="ui-search-result__wrapper">
+    <a class="poly-component__title" href="https://articulo.mercadolibre.com.ar/MLA-1400000002-buzz-lightyear-_JM#position=2">link</a>
+    <h2 class="poly-box">Buzz Lightyear</h2>
+    <span class="andes-money-amount__currency-symbol">US$</span>
+    <span class="andes-money-amount__fraction">40</span>
+    <div class="ui-search-item__highlight-label__container">MAS VENDIDO</div>
+  </div></li>
+</ol></body></html>
+"""
+
+ALIBABA_LISTING = """
+<html><body>
+  <div class="fy23-search-card">
+    <a href="https://www.alibaba.com/product-detail/Plush-Toy_1600000000001.html">link</a>
+    <h2>Plush Toy</h2>
+    <div class="search-card-e-price-main">US$2.50-3.10</div>
+    <a class="search-card-e-company">Toys Co., Ltd.</a>
+    <span class="search-card-e-review">4.8/5.0 (25 reviews)</span>
+  </div>
+  <div class="fy23-search-card">
+    <a href="https://www.alibaba.com/product-detail/Building-Blocks_1600000000002.html">link</a>
+    <h2>Building Blocks</h2>
+    <div class="search-card-e-price-main">US$10.00</div>
+    <div class="ads-main-search-component-title-icon"></div>
+  </div>
+</body></html>
+"""
+
+# Las dos primeras tarjetas de eBay no son productos y se descartan
+EBAY_LISTING = """
+<html><body><ul>
+  <li class="s-item" id="item0"></li>
+  <li class="s-item" id="item0"></li>
+  <li class="s-item" id="item1a2b3c4d">
+    <div class="s-item__info">
+      <div class="s-item__title">Lego Star Wars</div>
+      <span class="s-item__price">USD 12.50</span>
+      <span class="s-item__itemLocation">de China</span>
+      <span class="s-item__sep"><span style="color: kexu191"></span></span>
+    </div>
+  </li>
+  <li class="s-item" id="item1a2b3c4e">
+    <div class="s-item__info">
+      <div class="s-item__title">Hot Wheels Pack</div>
+      <span class="s-item__price">USD 8.00 a USD 10.00</span>
+      <div class="s-item__details-section--secondary">Mas vendido</div>
+      <span class="s-item__sep"><span style="display: none"></span></span>
+    </div>
+  </li>
+</ul></body></html>
+"""
+
+GOOGLE_NEWS_LISTING = """
+<html><body>
+  <div class="SoaBEf">
+    <a href="https://www.example.com/nota-1">link</a>
+    <div class="n0jPhd ynAwRc MBeuO nDgy9d">Disney anuncia una nueva pelicula</div>
+    <div class="MgUUmf NUnG9d">Diario Uno</div>
+    <div class="OSrXXb rbYSKb LfVVr">12 ago 2024</div>
+  </div>
+  <div class="SoaBEf">
+    <a href="https://www.example.com/nota-2">link</a>
+    <div class="n0jPhd ynAwRc MBeuO nDgy9d">Pixar lanza un corto</div>
+    <div class="MgUUmf NUnG9d">Diario Dos</div>
+    <div class="OSrXXb rbYSKb">3 dic 2023</div>
+  </div>
+</body></html>
+"""
+
+class ListingModeMixin:
+    """
+    Verifica que el modo 'page' (una pasada por pagina con from_dict) y el
+    modo 'item' (un objeto por tarjeta) generen los mismos datos para la
+    misma pagina de listado.
+    """
+    listings_class = None
+    listing_html = None
+    topic = 'juguetes'
+    expected_items = 2
+
+    def setUp(self):
+        self.listings_class._instance = None
+
+    def tearDown(self):
+        self.listings_class._instance = None
+
+    def run_listing_mode(self, listing_mode):
+        # Armo el objeto sin el constructor para no consultar las tematicas excluidas
+        self.listings_class._instance = None
+        listings = self.listings_class.__new__(self.listings_class)
+        listings.topics = [self.topic]
+        listings.html_parser = DEFAULT_HTML_PARSER
+        listings.enable_mp = False
+        listings.listing_mode = listing_mode
+
+        # En modo 'page' la pagina se descarga como texto y en modo 'item' ya procesada
+        if listing_mode == 'page':
+            html_content = self.listing_html
+        else:
+            html_content = make_soup(self.listing_html, DEFAULT_HTML_PARSER)
+        listings.listings = {self.topic: {'html_content': html_content}}
+
+        listings.find_items()
+        return [x.to_dicc() for x in listings.listings[self.topic]['items']]
+
+    def test_page_and_item_modes_match(self):
+        item_mode = self.run_listing_mode('item')
+        page_mode = self.run_listing_mode('page')
+
+        self.assertEqual(len(item_mode), self.expected_items)
+        self.assertEqual(page_mode, item_mode)
+        self.assertTrue(all(x['topic'] == self.topic for x in page_mode))
+
+class TestMeLiListingMode(ListingModeMixin, unittest.TestCase):
+    listings_class = MeLiProductListings
+    listing_html = MELI_LISTING
+
+class TestAlibabaListingMode(ListingModeMixin, unittest.TestCase):
+    listings_class = AlibabaProductListings
+    listing_html = ALIBABA_LISTING
+
+class TestEbayListingMode(ListingModeMixin, unittest.TestCase):
+    listings_class = EbayProductListings
+    listing_html = EBAY_LISTING
+
+class TestGoogleNewsListingMode(ListingModeMixin, unittest.TestCase):
+    listings_class = GoogleNewsListings
+    listing_html = GOOGLE_NEWS_LISTING
+    topic = 'disney'
+
+if __name__ == '__main__':
+    unittest.main()
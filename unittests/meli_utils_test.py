@@ -20,7 +20,7 @@ class TestMeLiProductListings(unittest.TestCase):
         del listings1
         del listings2
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_html_content_success(self, mock_get_http_response):
         # Simula una respuesta exitosa
         mock_response = Mock()
@@ -46,7 +46,7 @@ class TestMeLiProductListings(unittest.TestCase):
         # Borro el objeto
         del listings
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_html_content_failure(self, mock_get_http_response):
         # Simula una respuesta fallida
         mock_response = Mock()
@@ -0,0 +1,91 @@
+# Imports estándar de Python
+import os
+import sys
+import time
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from multiprocessing import Pool
+
+# Imports locales
+from src.utils.rate_limiter import RateLimiter, parse_retry_after, backoff_delay
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+def acquire_many(args):
+    path, n = args
+    RateLimiter._instance = None
+    limiter = RateLimiter(path=path)
+    limiter.enable = True
+    limiter.hosts = {'example.com': 20}
+    limiter.burst = 1
+    for _ in range(n):
+        limiter.acquire('https://www.example.com/')
+    return time.time()
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'rate_limiter.json')
+        RateLimiter._instance = None
+        self.limiter = RateLimiter(path=self.path)
+        self.limiter.enable = True
+        self.limiter.hosts = {'example.com': 10}
+        self.limiter.burst = 2
+        self.limiter.adaptive = False
+
+    def tearDown(self):
+        RateLimiter._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_helpers(self):
+        self.assertEqual(parse_retry_after('3'), 3)
+        self.assertIsNone(parse_retry_after('nunca'))
+        self.assertLessEqual(backoff_delay(10, base=1, max_delay=5), 5)
+        self.assertEqual(self.limiter.get_host('https://www.example.com/a'), 'example.com')
+        self.assertIsNone(self.limiter.get_host('https://otro.com/a'))
+
+    def test_token_bucket(self):
+        url = 'https://www.example.com/'
+        self.assertEqual(self.limiter.acquire(url), 0)
+        self.assertEqual(self.limiter.acquire(url), 0)
+
+        # Sin tokens se espera a que se recargue uno (10 por segundo)
+        self.assertGreater(self.limiter.acquire(url), 0.05)
+
+    def test_throttle_blocks_host(self):
+        url = 'https://www.example.com/'
+        self.limiter.report(url, 429, 0.1, retry_after='0.3')
+        start = time.time()
+        self.limiter.acquire(url)
+        self.assertGreaterEqual(time.time() - start, 0.25)
+
+    def test_adaptive_rate(self):
+        url = 'https://www.example.com/'
+        self.limiter.adaptive = True
+        self.limiter.report(url, 200, 0.1)
+        self.assertAlmostEqual(self.limiter.load()['example.com']['rate'], 10.5)
+        self.limiter.report(url, 503, 0.1, retry_after='0')
+        self.assertAlmostEqual(self.limiter.load()['example.com']['rate'], 5.25)
+
+    def test_shared_between_processes(self):
+        # 4 procesos x 5 solicitudes a 20 por segundo con un solo token de
+        # rafaga deberian tardar al menos ~1 segundo en total
+        start = time.time()
+        with Pool(4) as pool:
+            ends = pool.map(acquire_many, [(self.path, 5)] * 4)
+        self.assertGreaterEqual(max(ends) - start, 0.9)
+
+if __name__ == '__main__':
+    unittest.main()
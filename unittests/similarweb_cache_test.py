@@ -0,0 +1,94 @@
+# Imports estándar de Python
+import os
+import sys
+import time
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import Mock, patch
+
+# Imports locales
+from src.similarweb.similarweb_cache import RenderCache
+from src.similarweb.similarweb_manager import SimilarWebManager
+from src.utils.utils import get_similarweb_url_tuple
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestRenderCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        RenderCache._instance = None
+        self.cache = RenderCache(path=os.path.join(self.tmp_dir.name, 'similarweb_cache.db'))
+        self.cache.enable = True
+        self.cache.connect()
+
+    def tearDown(self):
+        self.cache.conn.close()
+        RenderCache._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_store_and_expire(self):
+        url = 'https://www.similarweb.com/website/youtube.com/'
+        self.assertIsNone(self.cache.get(url))
+
+        self.cache.store(url, '<html>youtube</html>')
+        self.assertEqual(self.cache.get(url), '<html>youtube</html>')
+
+        # Una copia mas antigua que el TTL ya no se usa
+        self.cache.ttl = 0.05
+        time.sleep(0.06)
+        self.assertIsNone(self.cache.get(url))
+
+    def test_manager_renders_only_stale_pages(self):
+        fresh_url = 'https://www.similarweb.com/website/youtube.com/'
+        stale_url = 'https://www.similarweb.com/website/netflix.com/'
+        self.cache.store(fresh_url, '<html>youtube</html>')
+
+        manager = SimilarWebManager.__new__(SimilarWebManager)
+        manager.skip_scrap = False
+        manager.delay = 1
+        manager.cache = self.cache
+        manager.driver = Mock()
+        manager.driver._normalize_url.side_effect = lambda url: url
+        manager.driver.iter_multiple_urls.return_value = iter([(stale_url, '<html>netflix</html>')])
+
+        pages = dict(manager.iter_pages([fresh_url, stale_url]))
+        self.assertEqual(pages, {fresh_url: '<html>youtube</html>', stale_url: '<html>netflix</html>'})
+        self.assertEqual(manager.driver.iter_multiple_urls.call_args.kwargs['urls'], [stale_url])
+
+        # La pagina renderizada queda en la cache para la proxima consulta
+        manager.driver.iter_multiple_urls.reset_mock()
+        self.assertEqual(dict(manager.iter_pages(stale_url)), {stale_url: '<html>netflix</html>'})
+        manager.driver.iter_multiple_urls.assert_not_called()
+
+    def test_unparsable_page_is_not_kept(self):
+        url = get_similarweb_url_tuple('youtube.com')[0]
+        manager = SimilarWebManager.__new__(SimilarWebManager)
+        manager.skip_scrap = False
+        manager.delay = 1
+        manager.cache = self.cache
+        manager.driver = Mock()
+        manager.driver._normalize_url.side_effect = lambda url: url
+        manager.driver.iter_multiple_urls.return_value = iter([(url, '<html>interstitial</html>')])
+
+        # La pagina renderizada no tiene los datos del sitio
+        with patch('src.similarweb.similarweb_manager.SimilarWebWebsite') as mock_website:
+            mock_website.return_value.fetch_status = False
+            manager.get_web('youtube.com')
+
+        # La copia rota no queda en la cache y se vuelve a renderizar
+        self.assertIsNone(self.cache.get(url))
+
+if __name__ == '__main__':
+    unittest.main()
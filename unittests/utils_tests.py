@@ -23,7 +23,7 @@ logger = Logger(os.path.basename(__file__)).get_logger()
 
 class TestUtils(unittest.TestCase):
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_page(self, mock_get):
         mock_response = Mock()
         mock_response.ok = True
@@ -35,7 +35,7 @@ class TestUtils(unittest.TestCase):
         self.assertIsInstance(response, BeautifulSoup)
         self.assertEqual(response.title.string, 'Test')
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_text(self, mock_get):
         mock_response = Mock()
         mock_response.ok = True
@@ -48,28 +48,44 @@ class TestUtils(unittest.TestCase):
         self.assertIsInstance(response, str)
         self.assertEqual(response, 'Some plain text content')
 
-    @patch('requests.get')
+    @patch('src.utils.utils.make_soup')
+    @patch('requests.Session.get')
+    def test_get_http_response_text_skips_parsing(self, mock_get, mock_make_soup):
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.text = '<html><head><title>Test</title></head></html>'
+        mock_get.return_value = mock_response
+
+        get_http_response('http://example.com', response_type='text')
+        mock_make_soup.assert_not_called()
+
+    def test_make_soup_missing_parser(self):
+        # Si el parser no esta instalado se usa html.parser
+        soup = make_soup('<html><head><title>Test</title></head></html>', parser='parser-inexistente')
+        self.assertEqual(soup.title.string, 'Test')
+
+    @patch('requests.Session.get')
     def test_get_http_response_invalid_url(self, mock_get):
         with self.assertRaises(ValueError):
             get_http_response(1234)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_invalid_headers(self, mock_get):
         with self.assertRaises(ValueError):
             get_http_response('http://example.com', headers='invalid_headers')
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_invalid_response_type(self, mock_get):
         with self.assertRaises(ValueError):
             get_http_response('http://example.com', response_type='invalid')
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_timeout(self, mock_get):
         mock_get.side_effect = requests.exceptions.Timeout
         response = get_http_response('http://example.com', timeout=0.001)
         self.assertIsNone(response)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_http_response_404(self, mock_get):
         mock_response = Mock()
         mock_response.ok = False
@@ -81,7 +97,7 @@ class TestUtils(unittest.TestCase):
         response = get_http_response(url)
         self.assertIsNone(response)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_retry_attempts(self, mock_get):
         # Mock successful response for first 2 attempts, successful response on 3rd attempt
         mock_failed_response = Mock()
@@ -0,0 +1,159 @@
+# Imports estándar de Python
+import os
+import sys
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Imports locales
+from src.youtube.youtube_api import YoutubeAPI
+from src.youtube.youtube_quota import QuotaLedger
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestYoutubeAPIBatch(unittest.TestCase):
+
+    def setUp(self):
+        # Armo la API sin el constructor para no conectarme a YouTube
+        YoutubeAPI._instance = None
+        self.api = YoutubeAPI.__new__(YoutubeAPI)
+        self.api.youtube = MagicMock()
+        self.api.enabled = True
+        self.api.request = None
+        self.api.last_request_success = True
+        self.api.page_results = 50
+
+        # Registro de cuota en un archivo temporal
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        QuotaLedger._instance = None
+        self.ledger = QuotaLedger(path=os.path.join(self.tmp_dir.name, 'quota.json'))
+
+        # Cada solicitud queda como el diccionario de argumentos de list()
+        for resource in ['videos', 'playlists']:
+            getattr(self.api.youtube, resource).return_value.list.side_effect = lambda **kwargs: kwargs
+
+        self.requests = []
+        self.failed_ids = set()
+        self.execute = patch.object(YoutubeAPI, 'execute', side_effect=self.fake_execute)
+        self.execute.start()
+
+    def tearDown(self):
+        self.execute.stop()
+        YoutubeAPI._instance = None
+        QuotaLedger._instance = None
+        self.tmp_dir.cleanup()
+
+    def fake_execute(self):
+        # Devuelve un elemento por ID, salvo para los lotes que fallan
+        ids = self.api.request['id'].split(',')
+        self.requests.append(ids)
+        if self.failed_ids & set(ids):
+            self.api.last_request_success = False
+            return {'error_code': 500, 'error_message': 'backendError', 'quota_exceeded': False}
+        self.api.last_request_success = True
+        return {'items': [self.make_item(x) for x in ids if not x.startswith('privado')]}
+
+    def make_item(self, item_id):
+        return {
+            'id': item_id,
+            'snippet': {'title': f'Titulo {item_id}', 'channelId': 'UC1', 'channelTitle': 'Canal', 'publishedAt': '2024-06-01T12:00:00Z'},
+            'statistics': {'viewCount': '10'},
+            'contentDetails': {'duration': 'PT1M', 'itemCount': 3},
+        }
+
+    def test_chunks_of_50_ids(self):
+        ids = [f'v{i}' for i in range(120)]
+
+        # Los IDs vacios y repetidos no se piden
+        items = self.api.fetch_batch_items('videos', ids + ['', 'v0'], 'id')
+
+        self.assertEqual([len(x) for x in self.requests], [50, 50, 20])
+        self.assertEqual(list(items), ids)
+
+        # El tamaño de lote no puede superar el maximo de la API
+        self.requests.clear()
+        self.api.fetch_batch_items('videos', ids, 'id', batch_size=500)
+        self.assertEqual([len(x) for x in self.requests], [50, 50, 20])
+
+    def test_failed_chunk_keeps_the_rest(self):
+        ids = [f'v{i}' for i in range(120)]
+        self.failed_ids = {'v60'}
+
+        data = self.api.fetch_videos_data(ids + ['privado_1'])
+
+        # Se piden todos los lotes y solo se pierden los IDs del lote fallido
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(set(data), set(ids[:50] + ids[100:]))
+        self.assertNotIn('privado_1', data)
+        self.assertEqual(data['v0']['views'], '10')
+        self.assertEqual(data['v0']['publish_date'], '2024/06/01 12:00:00')
+
+    def test_stops_when_api_is_disabled(self):
+        ids = [f'v{i}' for i in range(120)]
+
+        # La API se deshabilita (por ejemplo sin cuota) despues del primer lote
+        def disable_after_first(*args):
+            result = self.fake_execute()
+            self.api.enabled = False
+            return result
+        YoutubeAPI.execute.side_effect = disable_after_first
+
+        items = self.api.fetch_batch_items('videos', ids, 'id')
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(list(items), ids[:50])
+
+    def test_fetch_shorts_data(self):
+        data = self.api.fetch_shorts_data(['s1', 'privado_1'])
+
+        self.assertEqual(list(data), ['s1'])
+        self.assertEqual(data['s1']['short_id'], 's1')
+        self.assertNotIn('video_id', data['s1'])
+
+    @patch.object(YoutubeAPI, 'fetch_playlist_videos', return_value=['v1', 'v2'])
+    def test_fetch_playlists_data(self, mock_videos):
+        ids = [f'PL{i}' for i in range(60)]
+        self.failed_ids = {'PL0'}
+
+        data = self.api.fetch_playlists_data(ids)
+
+        # El primer lote falla y el segundo se procesa completo
+        self.assertEqual([len(x) for x in self.requests], [50, 10])
+        self.assertEqual(list(data), ids[50:])
+        self.assertEqual(data['PL50']['n_videos'], 3)
+        self.assertEqual(data['PL50']['video_ids'], ['v1', 'v2'])
+        self.assertEqual(mock_videos.call_count, 10)
+
+    @patch.object(YoutubeAPI, 'fetch_playlist_videos', return_value=['v1'])
+    def test_playlists_without_quota_for_their_videos(self, mock_videos):
+        # Quedan 3 unidades: alcanza para la playlist de 3 videos (1 pagina)
+        # pero no para la de 120 videos (3 paginas de 50) despues de la primera
+        self.ledger.daily_quota = 3
+        items = {'PL_corta': self.make_item('PL_corta'), 'PL_larga': self.make_item('PL_larga')}
+        items['PL_larga']['contentDetails']['itemCount'] = 120
+
+        def fetch_videos(playlist_id, n_videos_fetch=None):
+            self.ledger.charge('playlistItems.list')
+            return ['v1']
+        mock_videos.side_effect = fetch_videos
+
+        with patch.object(YoutubeAPI, 'fetch_batch_items', return_value=items):
+            data = self.api.fetch_playlists_data(['PL_corta', 'PL_larga'])
+
+        # La playlist sin cuota para sus videos queda para el HTML
+        self.assertEqual(list(data), ['PL_corta'])
+        self.assertEqual(mock_videos.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# Imports estándar de Python
+import os
+import sys
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch, Mock
+
+# Imports locales
+from src.youtube.youtube_availability import VideoAvailability, split_by_availability
+from src.utils.executor import ExecutorService
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestVideoAvailability(unittest.TestCase):
+
+    def setUp(self):
+        VideoAvailability._instance = None
+        ExecutorService().backends = {'availability': 'thread'}
+
+    def tearDown(self):
+        VideoAvailability._instance = None
+        ExecutorService().shutdown()
+
+    @patch('src.youtube.youtube_availability.YoutubeAPI')
+    @patch('src.youtube.youtube_availability.get_video_status')
+    def test_oembed_probes_are_cached(self, mock_online, mock_api):
+        mock_api.return_value.is_enabled.return_value = False
+        mock_online.side_effect = lambda x: x != 'offline'
+
+        online, offline = split_by_availability(['a', 'offline', 'b'])
+        self.assertEqual(online, ['a', 'b'])
+        self.assertEqual(offline, ['offline'])
+
+        # La segunda consulta se resuelve desde la cache
+        split_by_availability(['a', 'offline', 'b'])
+        self.assertEqual(mock_online.call_count, 3)
+
+    @patch('src.youtube.youtube_availability.YoutubeAPI')
+    @patch('src.youtube.youtube_availability.get_video_status')
+    def test_failed_probe_is_not_excluded(self, mock_online, mock_api):
+        mock_api.return_value.is_enabled.return_value = False
+        mock_online.side_effect = Exception('timeout')
+
+        online, offline = split_by_availability(['a'])
+        self.assertEqual((online, offline), ([], []))
+        self.assertIsNone(VideoAvailability().get_cached('a'))
+
+    @patch('src.youtube.youtube_availability.YoutubeAPI')
+    @patch('src.utils.http_client.http_get')
+    def test_throttled_probe_is_not_excluded(self, mock_get, mock_api):
+        mock_api.return_value.is_enabled.return_value = False
+        mock_get.side_effect = lambda url: Mock(status_code=429 if 'throttled' in url else 404)
+
+        # Un 429 no se puede interpretar como video eliminado
+        online, offline = split_by_availability(['throttled', 'deleted'])
+        self.assertEqual((online, offline), ([], ['deleted']))
+        self.assertIsNone(VideoAvailability().get_cached('throttled'))
+        self.assertFalse(VideoAvailability().get_cached('deleted'))
+
+    @patch('src.youtube.youtube_availability.YoutubeAPI')
+    @patch('src.youtube.youtube_availability.get_video_status')
+    def test_api_batches(self, mock_online, mock_api):
+        api = Mock()
+        api.MAX_IDS_PER_REQUEST = 50
+        api.is_enabled.return_value = True
+        api.last_request_success = True
+        api.fetch_batch_items.return_value = {
+            'a': {'id': 'a', 'status': {'privacyStatus': 'public'}},
+            'p': {'id': 'p', 'status': {'privacyStatus': 'private'}},
+        }
+        mock_api.return_value = api
+
+        results = VideoAvailability().check(['a', 'p', 'deleted'])
+        self.assertEqual(results, {'a': True, 'p': False, 'deleted': False})
+        self.assertEqual(api.fetch_batch_items.call_count, 1)
+        mock_online.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
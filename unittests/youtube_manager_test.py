@@ -0,0 +1,110 @@
+# Imports estándar de Python
+import os
+import sys
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch, Mock, MagicMock
+
+# Imports locales
+from src.youtube.youtube_manager import YoutubeManager
+from src.youtube.youtube_video import YoutubeVideo
+from src.youtube.youtube_channel import YoutubeChannel
+from src.youtube.youtube_scheduler import RefreshScheduler
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestAsyncInitialize(unittest.TestCase):
+
+    def test_single_download_for_all_channels(self):
+        manager = YoutubeManager.__new__(YoutubeManager)
+        manager.channels = [Mock(video_id_list=['a', 'b']), Mock(video_id_list=['c', 'a'])]
+
+        with patch.object(YoutubeManager, 'async_initialize', side_effect=lambda ids, cls, url: [f'obj_{x}' for x in ids]) as mock_async:
+            objects = manager.async_initialize_channels('video_id_list', {}, YoutubeVideo, 'https://www.youtube.com/watch?v={}')
+
+        # Se hace una unica descarga con los IDs de todos los canales, sin repetir
+        mock_async.assert_called_once()
+        self.assertEqual(mock_async.call_args.args[0], ['a', 'b', 'c'])
+        self.assertEqual(objects, [['obj_a', 'obj_b'], ['obj_c', 'obj_a']])
+
+class TestRefreshSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {'SOFT_RESULTS': self.tmp_dir.name, 'DB_NAME': os.path.join(self.tmp_dir.name, 'test.db')})
+        self.env.start()
+        self.availability = patch('src.youtube.youtube_channel.split_by_availability', side_effect=lambda ids: (ids, []))
+        self.availability.start()
+        RefreshScheduler._instance = None
+
+    def tearDown(self):
+        RefreshScheduler._instance = None
+        self.availability.stop()
+        self.env.stop()
+        self.tmp_dir.cleanup()
+
+    def test_playlist_videos_are_filtered(self):
+        channel = YoutubeChannel('UC1')
+        channel.playlist_id_list = ['PL1']
+        channel.add_video_ids_to_list(new_video_ids=['due_db', 'not_due_db'], source='database')
+
+        manager = YoutubeManager.__new__(YoutubeManager)
+        manager.channels = [channel]
+        manager.playlists = []
+        manager.stream_to_db = False
+        manager.database = None
+        manager.youtube_api = None
+        manager.load_videos_from_database = False
+        manager.fetch_engine = 'requests'
+        manager.enable_mp = False
+
+        # Los IDs 'not_due_*' ya estan en la base de datos y todavia no vencen
+        filter_due = lambda kind, id_lists, now=None: {k: [x for x in v if not x.startswith('not_due')] for k, v in id_lists.items()}
+        playlist = Mock(video_ids=['due_pl', 'not_due_pl'])
+        fetched = []
+
+        with patch.object(YoutubeManager, 'initialize_channels'), \
+             patch.object(RefreshScheduler, 'is_enabled', return_value=True), \
+             patch.object(RefreshScheduler, 'filter_due', side_effect=filter_due), \
+             patch.object(YoutubeManager, 'serial_playlist_initialize', side_effect=lambda ids: setattr(manager, 'playlists', [playlist])), \
+             patch.object(YoutubeManager, 'initialize_videos', side_effect=lambda: fetched.extend(channel.video_id_list)):
+            manager.fetch_data(initialize_shorts=False, insert_data_to_db=False)
+
+        # Ni los videos de la base ni los de la playlist que no vencen se descargan
+        self.assertEqual(sorted(fetched), ['due_db', 'due_pl'])
+
+class TestStreamWrites(unittest.TestCase):
+
+    def test_failed_batch_is_retried(self):
+        manager = YoutubeManager.__new__(YoutubeManager)
+        manager.database = MagicMock(bulk_success=False)
+        manager.db_batch_size = 2
+        manager.pending_writes = []
+        written = []
+
+        # La base esta bloqueada y el primer lote no se confirma
+        for x in ['a', 'b', 'c']:
+            manager.stream_write(written.append, x)
+        self.assertEqual([x for _, x in manager.pending_writes], ['a', 'b', 'c'])
+
+        # Al completar el siguiente lote se reintentan todos los pendientes
+        manager.database.bulk_success = True
+        manager.stream_write(written.append, 'd')
+        self.assertEqual(manager.pending_writes, [])
+
+        # El primer intento de 'a' y 'b' se deshizo con el rollback
+        self.assertEqual(written, ['a', 'b', 'a', 'b', 'c', 'd'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# Imports estándar de Python
+import os
+import sys
+import json
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+
+# Imports locales
+from src.youtube.youtube_page import parse_watch_page, extract_json_blob
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestYoutubePage(unittest.TestCase):
+
+    def setUp(self):
+        player_response = {
+            'videoDetails': {
+                'videoId': 'abc123',
+                'title': 'Video de prueba',
+                'lengthSeconds': '125',
+                'keywords': ['juguetes', 'disney'],
+                'channelId': 'UC123',
+                'author': 'Canal',
+                'viewCount': '1500',
+            },
+            'microformat': {
+                'playerMicroformatRenderer': {
+                    'ownerChannelName': 'Canal de prueba',
+                    'uploadDate': '2024-07-01T10:00:00-07:00',
+                }
+            }
+        }
+        initial_data = {
+            'contents': [
+                {'likeButton': {'likeCount': '320'}},
+                {'commentsHeader': {'commentCount': {'simpleText': '45'}}},
+                {'markers': [{'decorationTimeMillis': 61000}]},
+            ]
+        }
+        self.html = (
+            '<html><script>var ytInitialPlayerResponse = ' + json.dumps(player_response) + ';var meta = 1;</script>'
+            '<script>var ytInitialData = ' + json.dumps(initial_data) + ';</script></html>'
+        )
+
+    def test_parse_watch_page(self):
+        data = parse_watch_page(self.html)
+        self.assertEqual(data['channel_id'], 'UC123')
+        self.assertEqual(data['channel_name'], 'Canal de prueba')
+        self.assertEqual(data['title'], 'Video de prueba')
+        self.assertEqual(data['views'], 1500)
+        self.assertEqual(data['likes'], 320)
+        self.assertEqual(data['comment_count'], 45)
+        self.assertEqual(data['tags'], 'juguetes/disney')
+        self.assertEqual(data['publish_date'], '2024-07-01 10:00:00')
+        self.assertEqual(data['length'], '00:02:05')
+        self.assertEqual(data['mvm'], '00:01:01')
+
+    def test_missing_blob(self):
+        self.assertIsNone(parse_watch_page('<html></html>'))
+        self.assertIsNone(extract_json_blob('<html></html>', 'ytInitialData = '))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Imports estándar de Python
+import os
+import sys
+import json
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import Mock
+
+# Imports locales
+from src.youtube.youtube_quota import QuotaLedger
+from src.youtube.youtube_api import YoutubeAPI
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+class TestQuotaLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        QuotaLedger._instance = None
+        self.ledger = QuotaLedger(path=os.path.join(self.tmp_dir.name, 'quota.json'))
+        self.ledger.daily_quota = 300
+        self.ledger.reserve = 150
+
+    def tearDown(self):
+        QuotaLedger._instance = None
+        YoutubeAPI._instance = None
+        self.tmp_dir.cleanup()
+
+    def test_charge_and_reserve(self):
+        self.ledger.charge('youtube.videos.list')
+        self.ledger.charge('search.list')
+        self.assertEqual(self.ledger.get_used(), 101)
+        self.assertEqual(self.ledger.load()['calls'], {'videos.list': 1, 'search.list': 1})
+
+        # Una busqueda mas entraria en la reserva, un lote no
+        self.assertFalse(self.ledger.can_spend('search.list'))
+        self.assertTrue(self.ledger.can_spend('videos.list'))
+        self.assertEqual(self.ledger.plan_batch(10000, 'videos.list'), 199 * 50)
+
+    def test_plan_batch_with_per_id_cost(self):
+        # Quedan 199 unidades: cada lote de 50 playlists cuesta 1 + 50 unidades
+        self.ledger.charge('videos.list', 101)
+        n_ids = self.ledger.plan_batch(10000, 'playlists.list', 50, 'playlistItems.list')
+        self.assertEqual(n_ids, 195)
+
+        # 4 solicitudes de playlists.list y una de playlistItems.list por playlist
+        self.assertLessEqual(-(-n_ids // 50) + n_ids, self.ledger.get_remaining())
+        self.assertEqual(self.ledger.plan_batch(10, 'playlists.list', 50, 'playlistItems.list'), 10)
+
+    def test_new_day_resets_usage(self):
+        with open(self.ledger.path, 'w') as file:
+            json.dump({'day': '2000-01-01', 'used': 300, 'calls': {}}, file)
+        self.assertEqual(self.ledger.get_remaining(), 300)
+
+        self.ledger.exhaust()
+        self.assertEqual(self.ledger.get_remaining(), 0)
+
+    def test_execute_skips_optional_methods(self):
+        api = YoutubeAPI.__new__(YoutubeAPI)
+        api.enabled = True
+        api.request = Mock(methodId='youtube.search.list')
+        self.ledger.charge('videos.list', 200)
+
+        response = api.execute()
+        self.assertTrue(response['quota_exceeded'])
+        self.assertTrue(api.is_enabled())
+        api.request.execute.assert_not_called()
+
+        # Los metodos por lotes siguen funcionando y se cobran
+        api.request = Mock(methodId='youtube.videos.list')
+        api.request.execute.return_value = {'items': []}
+        self.assertEqual(api.execute(), {'items': []})
+        self.assertEqual(self.ledger.get_used(), 201)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Imports estándar de Python
+import os
+import sys
+import datetime
+import tempfile
+
+# Añade la ruta del directorio principal al sys.path
+current_path = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_path, '..'))  # Ajusta según la estructura de tu proyecto
+sys.path.append(project_root)
+
+# Imports de terceros
+import unittest
+from unittest.mock import patch
+
+# Imports locales
+from src.youtube.youtube_scheduler import RefreshScheduler
+from src.database.db import Database
+from src.logger.logger import Logger
+
+################################################################################
+# Genero una instancia del Logger
+################################################################################
+logger = Logger(os.path.basename(__file__)).get_logger()
+
+NOW = datetime.datetime(2024, 6, 1, 12, 0, 0)
+
+def hours_ago(hours):
+    return (NOW - datetime.timedelta(hours=hours)).strftime(RefreshScheduler.DATE_FORMAT)
+
+class TestRefreshScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {'DB_NAME': os.path.join(self.tmp_dir.name, 'test.db')})
+        self.env.start()
+        RefreshScheduler._instance = None
+        self.scheduler = RefreshScheduler()
+
+        # Videos del canal con distinta velocidad de crecimiento
+        # {video_id: [(horas atras, vistas)]}
+        records = {
+            'viral_viejo': [(48, 1000000), (24, 1000010)], # ~0.4 vistas/h
+            'nuevo_rapido': [(30, 100), (24, 10000)], # 1650 vistas/h
+            'un_registro': [(10, 500)],
+            'reciente': [(2, 100), (1, 5000)],
+        }
+        db = Database()
+        for video_id, rows in records.items():
+            db.exec('INSERT INTO VIDEO (VIDEO_ID, CHANNEL_ID) VALUES (?, ?)', (video_id, 'UC1'))
+            for hours, views in rows:
+                db.exec('INSERT INTO VIDEO_RECORDS (VIDEO_ID, VIEWS, UPDATE_DATE) VALUES (?, ?, ?)', (video_id, views, hours_ago(hours)))
+        db.db_close()
+
+    def tearDown(self):
+        RefreshScheduler._instance = None
+        self.env.stop()
+        self.tmp_dir.cleanup()
+
+    def test_interval(self):
+        self.assertEqual(self.scheduler.get_interval(1, 0, 0), self.scheduler.min_interval)
+        self.assertEqual(self.scheduler.get_interval(2, 0, 24), self.scheduler.max_interval)
+        self.assertEqual(self.scheduler.get_interval(2, 24000, 24), self.scheduler.min_interval)
+        self.assertAlmostEqual(self.scheduler.get_interval(2, 1000, 24), 24)
+
+    def test_due_videos_by_velocity(self):
+        due = self.scheduler.get_due('video', {'UC1': -1, 'UC2': 5}, now=NOW)
+        self.assertEqual(due['UC1'], ['nuevo_rapido', 'un_registro'])
+        self.assertEqual(due['UC2'], [])
+
+        # El presupuesto limita la cantidad y deja a los mas atrasados
+        self.scheduler.budget = 1
+        self.assertEqual(self.scheduler.get_due('video', {'UC1': -1}, now=NOW)['UC1'], ['nuevo_rapido'])
+
+    def test_filter_keeps_new_ids(self):
+        id_lists = {'UC1': ['no_en_db', 'viral_viejo', 'reciente', 'nuevo_rapido']}
+        filtered = self.scheduler.filter_due('video', id_lists, now=NOW)
+        self.assertEqual(filtered['UC1'], ['no_en_db', 'nuevo_rapido'])
+
+if __name__ == '__main__':
+    unittest.main()